@@ -0,0 +1,34 @@
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+
+from app.common.utility.constant.settings import Settings
+
+logger = logging.getLogger("gateway_api")
+
+
+def create_redis_client(settings: Settings) -> Optional[redis.Redis]:
+    """Gateway 공용 Redis 클라이언트 생성 (연결은 첫 명령 시점에 맺어짐)
+
+    REDIS_URL이 있으면 우선 사용하고, 없으면 REDIS_HOST/PORT/DB로 구성합니다.
+    REDIS_ENABLED=false이면 None을 반환하고 각 기능은 인메모리로 동작합니다.
+    """
+    if not settings.redis_enabled:
+        logger.info("🧊 Redis 비활성화 - 인메모리 폴백 사용")
+        return None
+    if settings.redis_url:
+        client = redis.Redis.from_url(
+            settings.redis_url,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_timeout,
+        )
+    else:
+        client = redis.Redis(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_timeout,
+        )
+    return client
@@ -0,0 +1,18 @@
+# 프록시가 그대로 전달하면 안 되는 hop-by-hop 헤더 (RFC 9110 7.6.1)
+HOP_BY_HOP_HEADERS = frozenset({
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "proxy-connection",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+})
+
+# 업스트림 요청 시 제거할 헤더 (host는 httpx가 업스트림 주소로 다시 채움)
+REQUEST_EXCLUDED_HEADERS = HOP_BY_HOP_HEADERS | {"host"}
+
+# 업스트림 응답에서 제거할 헤더 (date/server는 uvicorn이 gateway 응답에 직접 붙이므로 그대로 두면 중복됨)
+RESPONSE_EXCLUDED_HEADERS = HOP_BY_HOP_HEADERS | {"date", "server"}
@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Optional, Dict, List
 
 class Settings:
     def __init__(self):
@@ -8,7 +8,9 @@ class Settings:
         self.gateway_reload = os.getenv("GATEWAY_RELOAD", "false").lower() == "true"
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
         
-        # Service URLs
+        self.environment = os.getenv("ENVIRONMENT", "local")
+
+        # Service URLs (콤마로 여러 인스턴스 지정 가능: http://auth-1:8008,http://auth-2:8008)
         self.gateway_service_url = os.getenv("GATEWAY_SERVICE_URL")
         self.chatbot_service_url = os.getenv("CHATBOT_SERVICE_URL")
         self.materiality_service_url = os.getenv("MATERIALITY_SERVICE_URL")
@@ -19,7 +21,161 @@ class Settings:
         self.survey_service_url = os.getenv("SURVEY_SERVICE_URL")
         self.auth_service_url = os.getenv("AUTH_SERVICE_URL")
         
+        # Service registry / health check
+        self.service_registry_file = os.getenv("SERVICE_REGISTRY_FILE")
+        self.load_balancing_strategy = os.getenv("LOAD_BALANCING_STRATEGY", "p2c")
+        self.health_check_interval = float(os.getenv("HEALTH_CHECK_INTERVAL", 10.0))
+        self.health_check_timeout = float(os.getenv("HEALTH_CHECK_TIMEOUT", 2.0))
+        self.health_check_path = os.getenv("HEALTH_CHECK_PATH", "/health")
+        self.health_check_unhealthy_threshold = int(os.getenv("HEALTH_CHECK_UNHEALTHY_THRESHOLD", 2))
+        
         # Redis settings
         self.redis_host = os.getenv("REDIS_HOST", "localhost")
         self.redis_port = int(os.getenv("REDIS_PORT", 6379))
         self.redis_db = int(os.getenv("REDIS_DB", 0))
+        self.redis_url = os.getenv("REDIS_URL")
+        self.redis_enabled = os.getenv("REDIS_ENABLED", "true").lower() == "true"
+        self.redis_socket_timeout = float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.5))
+
+        # GET 응답 캐시 (서비스별 CACHE_TTL_{SERVICE}>0 인 서비스만 캐시, 기본 비활성)
+        self.cache_local_max_entries = int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", 1024))
+        self.cache_local_ttl = float(os.getenv("CACHE_LOCAL_TTL", 5.0))
+        self.cache_max_body_bytes = int(os.getenv("CACHE_MAX_BODY_BYTES", 1024 * 1024))
+        self.cache_lock_ttl = float(os.getenv("CACHE_LOCK_TTL", 5.0))
+        self.cache_lock_wait = float(os.getenv("CACHE_LOCK_WAIT", 2.0))
+        # 응답의 Vary와 별개로 항상 캐시 키에 포함할 요청 헤더 (사용자별 응답 분리)
+        # x-user-id는 JWT 미들웨어가 검증 후 넣는 값, 쿠키(access_token)로 인증한 요청도 사용자별로 분리됨
+        self.cache_key_headers = [
+            name.strip().lower()
+            for name in os.getenv("CACHE_KEY_HEADERS", "authorization,cookie,x-user-id").split(",")
+            if name.strip()
+        ]
+
+        # Upstream connection pool 기본값 (서비스별 {SERVICE}_UPSTREAM_* 환경변수로 덮어쓰기 가능)
+        self.upstream_max_connections = int(os.getenv("UPSTREAM_MAX_CONNECTIONS", 100))
+        self.upstream_max_keepalive_connections = int(os.getenv("UPSTREAM_MAX_KEEPALIVE_CONNECTIONS", 20))
+        self.upstream_keepalive_expiry = float(os.getenv("UPSTREAM_KEEPALIVE_EXPIRY", 30.0))
+        self.upstream_connect_timeout = float(os.getenv("UPSTREAM_CONNECT_TIMEOUT", 3.0))
+        self.upstream_read_timeout = float(os.getenv("UPSTREAM_READ_TIMEOUT", 30.0))
+        self.upstream_write_timeout = float(os.getenv("UPSTREAM_WRITE_TIMEOUT", 30.0))
+        self.upstream_pool_timeout = float(os.getenv("UPSTREAM_POOL_TIMEOUT", 5.0))
+
+        # Circuit breaker / retry budget (서비스별로 동일하게 적용)
+        self.circuit_failure_threshold = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", 5))
+        self.circuit_recovery_timeout = float(os.getenv("CIRCUIT_RECOVERY_TIMEOUT", 30.0))
+        self.circuit_half_open_max_calls = int(os.getenv("CIRCUIT_HALF_OPEN_MAX_CALLS", 1))
+        self.retry_max_attempts = int(os.getenv("RETRY_MAX_ATTEMPTS", 3))
+        self.retry_backoff_base = float(os.getenv("RETRY_BACKOFF_BASE", 0.05))
+        self.retry_backoff_max = float(os.getenv("RETRY_BACKOFF_MAX", 1.0))
+        self.retry_budget_ratio = float(os.getenv("RETRY_BUDGET_RATIO", 0.2))
+        self.retry_budget_min_per_second = float(os.getenv("RETRY_BUDGET_MIN_PER_SECOND", 5.0))
+        self.retry_budget_ttl = int(os.getenv("RETRY_BUDGET_TTL", 10))
+
+        # Single-flight (동일한 동시 GET 합치기)
+        self.single_flight_enabled = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+        self.single_flight_max_body_bytes = int(os.getenv("SINGLE_FLIGHT_MAX_BODY_BYTES", 1024 * 1024))
+        # 인증 범위가 다른 요청끼리는 합치지 않도록 키에 포함할 요청 헤더
+        self.single_flight_key_headers = [
+            name.strip().lower()
+            for name in os.getenv("SINGLE_FLIGHT_KEY_HEADERS", "authorization,cookie").split(",")
+            if name.strip()
+        ]
+
+        # 요청 로깅 (본문은 샘플링된 요청만 앞부분 REQUEST_LOG_BODY_MAX_BYTES까지 기록)
+        self.request_log_body_sample_rate = float(os.getenv("REQUEST_LOG_BODY_SAMPLE_RATE", 0.0))
+        self.request_log_body_max_bytes = int(os.getenv("REQUEST_LOG_BODY_MAX_BYTES", 2048))
+
+        # JWT 검증 (JWT_SECRET 또는 JWKS 파일/URL 중 하나 이상 설정 시 활성화)
+        self.jwt_secret = os.getenv("JWT_SECRET")
+        self.jwt_algorithms = [
+            name.strip() for name in os.getenv("JWT_ALGORITHMS", "HS256,RS256").split(",") if name.strip()
+        ]
+        self.jwt_jwks_file = os.getenv("JWT_JWKS_FILE")
+        self.jwt_jwks_url = os.getenv("JWT_JWKS_URL")
+        self.jwt_jwks_refresh_interval = float(os.getenv("JWT_JWKS_REFRESH_INTERVAL", 300.0))
+        self.jwt_audience = os.getenv("JWT_AUDIENCE")
+        self.jwt_issuer = os.getenv("JWT_ISSUER")
+        self.jwt_leeway = int(os.getenv("JWT_LEEWAY", 30))
+        self.jwt_cookie_name = os.getenv("JWT_COOKIE_NAME", "access_token")
+        # 검증된 토큰 캐시 (토큰 만료 시각을 넘겨 유지하지 않음)
+        self.jwt_cache_max_entries = int(os.getenv("JWT_CACHE_MAX_ENTRIES", 10000))
+        self.jwt_cache_ttl = float(os.getenv("JWT_CACHE_TTL", 300.0))
+        # 인증 없이 통과시킬 경로 정규식 (콤마 구분, gateway 경로 전체 일치)
+        # /auth/login은 auth-service의 /login으로 전달됨 (서비스 세그먼트를 떼고 전달)
+        self.jwt_public_paths = [
+            pattern.strip()
+            for pattern in os.getenv(
+                "JWT_PUBLIC_PATHS",
+                r"/health,/docs,/openapi\.json,/auth/+(login|signup|refresh|logout)/?,/[a-z]+/health",
+            ).split(",")
+            if pattern.strip()
+        ]
+
+        # 관리 API(/admin/*) 접근: X-Admin-Token 헤더가 ADMIN_TOKEN과 일치하거나 JWT 역할에 ADMIN_ROLE 포함
+        # 둘 다 만족하지 못하면 403 (ADMIN_TOKEN 미설정 + JWT 비활성이면 관리 API는 항상 닫힘)
+        self.admin_token = os.getenv("ADMIN_TOKEN")
+        self.admin_role = os.getenv("ADMIN_ROLE", "admin")
+
+        # Rate limiting ("초당 토큰:버스트" 형식, 비우거나 0이면 해당 한도 비활성)
+        self.rate_limit_enabled = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+        self.rate_limit_per_ip = os.getenv("RATE_LIMIT_PER_IP", "50:100")
+        self.rate_limit_per_user = os.getenv("RATE_LIMIT_PER_USER", "20:40")
+        self.rate_limit_per_service = os.getenv("RATE_LIMIT_PER_SERVICE", "500:1000")
+        # 로그인/회원가입은 IP별로 더 엄격하게
+        self.rate_limit_login = os.getenv("RATE_LIMIT_LOGIN", "1:10")
+        self.rate_limit_local_max_buckets = int(os.getenv("RATE_LIMIT_LOCAL_MAX_BUCKETS", 100000))
+        # X-Forwarded-For의 첫 주소를 클라이언트 IP로 사용 (프록시 뒤에 있을 때만 true)
+        self.rate_limit_trust_forwarded_for = os.getenv("RATE_LIMIT_TRUST_FORWARDED_FOR", "false").lower() == "true"
+        # 진행 중인 업스트림 요청 수 상한 (서비스별 / 사용자별, 0이면 무제한)
+        self.max_inflight_per_service = int(os.getenv("MAX_INFLIGHT_PER_SERVICE", 200))
+        self.max_inflight_per_user = int(os.getenv("MAX_INFLIGHT_PER_USER", 16))
+
+        # 요청 본문(업로드) 최대 크기, 0이면 제한 없음 (서비스별 override: UPLOAD_MAX_BYTES_MATERIALITY 등)
+        self.upload_max_bytes = int(os.getenv("UPLOAD_MAX_BYTES", 512 * 1024 * 1024))
+
+        # 응답 압축 (Accept-Encoding에 따라 gzip/brotli, 업스트림이 이미 압축한 응답은 그대로 통과)
+        self.compression_enabled = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+        self.compression_minimum_size = int(os.getenv("COMPRESSION_MINIMUM_SIZE", 1024))
+        self.compression_gzip_level = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+        self.compression_brotli_quality = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4))
+        self.compression_brotli_enabled = os.getenv("COMPRESSION_BROTLI_ENABLED", "true").lower() == "true"
+
+        # /batch (여러 하위 요청을 한 번의 왕복으로 처리)
+        self.batch_max_items = int(os.getenv("BATCH_MAX_ITEMS", 20))
+        self.batch_concurrency = int(os.getenv("BATCH_CONCURRENCY", 8))
+        self.batch_item_timeout = float(os.getenv("BATCH_ITEM_TIMEOUT", 10.0))
+        self.batch_max_item_timeout = float(os.getenv("BATCH_MAX_ITEM_TIMEOUT", 30.0))
+        # 하위 응답 본문 최대 크기 (초과하면 해당 항목만 502)
+        self.batch_max_item_body_bytes = int(os.getenv("BATCH_MAX_ITEM_BODY_BYTES", 1024 * 1024))
+
+    def service_urls(self, service_name: str) -> List[str]:
+        """{SERVICE}_SERVICE_URL 값을 인스턴스 URL 목록으로 변환"""
+        raw = getattr(self, f"{service_name.lower()}_service_url", None) or ""
+        return [url.strip() for url in raw.split(",") if url.strip()]
+
+    def cache_ttl(self, service_name: str) -> int:
+        """서비스별 GET 응답 캐시 TTL(초), 0이면 캐시하지 않음 (예: CACHE_TTL_GRI=300)"""
+        return int(os.getenv(f"CACHE_TTL_{service_name.upper()}", 0))
+
+    def service_rate_limit(self, service_name: str) -> str:
+        """RATE_LIMIT_{SERVICE} 설정이 있으면 우선, 없으면 RATE_LIMIT_PER_SERVICE"""
+        return os.getenv(f"RATE_LIMIT_{service_name.upper()}", self.rate_limit_per_service)
+
+    def service_max_inflight(self, service_name: str) -> int:
+        return int(os.getenv(f"MAX_INFLIGHT_{service_name.upper()}", self.max_inflight_per_service))
+
+    def service_upload_max_bytes(self, service_name: str) -> int:
+        return int(os.getenv(f"UPLOAD_MAX_BYTES_{service_name.upper()}", self.upload_max_bytes))
+
+    def upstream_pool_config(self, service_name: str) -> Dict[str, float]:
+        """서비스별 업스트림 풀 설정 (예: AUTH_UPSTREAM_MAX_CONNECTIONS=200)"""
+        prefix = f"{service_name.upper()}_UPSTREAM_"
+        return {
+            "max_connections": int(os.getenv(f"{prefix}MAX_CONNECTIONS", self.upstream_max_connections)),
+            "max_keepalive_connections": int(os.getenv(f"{prefix}MAX_KEEPALIVE_CONNECTIONS", self.upstream_max_keepalive_connections)),
+            "keepalive_expiry": float(os.getenv(f"{prefix}KEEPALIVE_EXPIRY", self.upstream_keepalive_expiry)),
+            "connect_timeout": float(os.getenv(f"{prefix}CONNECT_TIMEOUT", self.upstream_connect_timeout)),
+            "read_timeout": float(os.getenv(f"{prefix}READ_TIMEOUT", self.upstream_read_timeout)),
+            "write_timeout": float(os.getenv(f"{prefix}WRITE_TIMEOUT", self.upstream_write_timeout)),
+            "pool_timeout": float(os.getenv(f"{prefix}POOL_TIMEOUT", self.upstream_pool_timeout)),
+        }
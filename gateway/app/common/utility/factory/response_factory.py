@@ -1,7 +1,10 @@
-from fastapi.responses import JSONResponse
-from typing import Any, Dict
+from fastapi.responses import JSONResponse, StreamingResponse, Response
+from starlette.background import BackgroundTask
+from typing import Any, AsyncIterable, Optional
 import httpx
 
+from app.common.utility.constant.http_headers import RESPONSE_EXCLUDED_HEADERS
+
 class ResponseFactory:
     @staticmethod
     def success(data: Any = None, message: str = "Success") -> JSONResponse:
@@ -25,15 +28,54 @@ class ResponseFactory:
         )
     
     @staticmethod
-    def create_response(response: httpx.Response) -> JSONResponse:
-        """httpx.Response를 FastAPI JSONResponse로 변환"""
-        try:
-            content = response.json()
-        except:
-            content = response.text
-        
-        return JSONResponse(
+    def create_streaming_response(
+        response: httpx.Response,
+        content: Optional[AsyncIterable[bytes]] = None,
+    ) -> StreamingResponse:
+        """스트리밍 모드 httpx.Response를 파싱 없이 그대로 중계
+
+        업스트림 본문을 raw 바이트(청크) 단위로 흘려보내므로 content-encoding/content-length가
+        원본과 일치하며, 응답이 끝나거나 클라이언트가 끊기면 업스트림 연결을 풀에 반환합니다.
+        content를 주면 aiter_raw() 대신 사용합니다 (예: SSE 중계용 EventStreamRelay).
+        """
+        streaming_response = StreamingResponse(
+            content if content is not None else response.aiter_raw(),
             status_code=response.status_code,
-            content=content,
-            headers=dict(response.headers)
+            background=BackgroundTask(response.aclose),
         )
+        # set-cookie 같은 중복 헤더를 보존하기 위해 raw_headers를 직접 구성
+        streaming_response.raw_headers = [
+            (key.encode("latin-1"), value.encode("latin-1"))
+            for key, value in response.headers.multi_items()
+            if key.lower() not in RESPONSE_EXCLUDED_HEADERS
+        ]
+        return streaming_response
+
+    @staticmethod
+    def create_buffered_response(entry) -> Response:
+        """버퍼링된 업스트림 응답(CachedResponse)을 원본 바이트/헤더 그대로 반환"""
+        response = Response(content=entry.body, status_code=entry.status_code)
+        response.raw_headers = [
+            (key.encode("latin-1"), value.encode("latin-1")) for key, value in entry.headers
+        ] + [(b"content-length", str(len(entry.body)).encode("latin-1"))]
+        return response
+
+    @staticmethod
+    def create_cached_response(entry, if_none_match: Optional[str] = None, cache_status: str = "MISS") -> Response:
+        """캐시된(버퍼링된) 응답을 반환, If-None-Match가 ETag와 맞으면 304"""
+        not_modified = entry.status_code == 200 and entry.matches(if_none_match)
+        body = b"" if not_modified else entry.body
+        response = Response(content=body, status_code=304 if not_modified else entry.status_code)
+
+        headers = [
+            (key.encode("latin-1"), value.encode("latin-1"))
+            for key, value in entry.headers
+            if key.lower() != "etag" and not (not_modified and key.lower().startswith("content-"))
+        ]
+        headers.append((b"etag", entry.etag.encode("latin-1")))
+        headers.append((b"age", str(entry.age()).encode("latin-1")))
+        headers.append((b"x-cache", cache_status.encode("latin-1")))
+        if not not_modified:
+            headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        response.raw_headers = headers
+        return response
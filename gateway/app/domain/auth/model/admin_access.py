@@ -0,0 +1,49 @@
+import hmac
+import logging
+from typing import List
+from urllib.parse import unquote
+
+from fastapi import HTTPException, Request
+
+logger = logging.getLogger(__name__)
+
+ADMIN_TOKEN_HEADER = "x-admin-token"
+
+
+def path_segments(path: str) -> List[str]:
+    """빈 세그먼트를 뺀 경로 세그먼트 (퍼센트 인코딩 해제, "/x//admin/" → ["x", "admin"])"""
+    return [unquote(segment) for segment in path.split("/") if segment]
+
+
+def has_dot_segment(path: str) -> bool:
+    """dot 세그먼트("."/"..") 포함 여부 (httpx가 업스트림 URL에서 정규화하므로 검사한 경로와 전달되는 경로가 달라짐)"""
+    return any(segment in (".", "..") for segment in path_segments(path))
+
+
+def is_admin_path(path: str) -> bool:
+    """서비스 아래 경로가 관리 API(admin/...)인지 (dot 세그먼트가 없는 경로 기준)"""
+    segments = path_segments(path)
+    return bool(segments) and segments[0] == "admin"
+
+
+def is_admin_request(request: Request) -> bool:
+    """관리자 요청 여부
+
+    - X-Admin-Token 헤더가 ADMIN_TOKEN과 일치하거나
+    - JWT 미들웨어가 검증한 역할(x-user-roles)에 ADMIN_ROLE이 포함된 경우
+    클라이언트가 보낸 x-user-* 헤더는 JWT 미들웨어가 항상 제거하므로 역할 헤더는 검증된 토큰에서만 옴.
+    둘 다 설정되지 않았으면(JWT 비활성 + ADMIN_TOKEN 없음) 항상 거부.
+    """
+    settings = request.app.state.settings
+    token = request.headers.get(ADMIN_TOKEN_HEADER)
+    if settings.admin_token and token and hmac.compare_digest(token.encode(), settings.admin_token.encode()):
+        return True
+    roles = request.headers.get("x-user-roles", "")
+    return bool(settings.admin_role) and settings.admin_role in (role.strip() for role in roles.split(","))
+
+
+async def require_admin(request: Request) -> None:
+    """관리 라우터 의존성 (관리자가 아니면 403)"""
+    if not is_admin_request(request):
+        logger.warning("🔒 관리 API 접근 거부: %s %s", request.method, request.url.path)
+        raise HTTPException(status_code=403, detail="Admin access required")
@@ -0,0 +1,172 @@
+import os
+import json
+import asyncio
+import logging
+import httpx
+from typing import Optional, Dict, Any, Callable, List, Tuple
+
+from jose import jwk
+from jose.exceptions import JOSEError
+
+from app.common.utility.constant.settings import Settings
+
+logger = logging.getLogger("gateway_api")
+
+# HS 계열 공유 비밀키(JWT_SECRET)를 등록하는 kid
+SECRET_KEY_ID = "__secret__"
+
+
+class JwtKeySet:
+    """JWT 서명 검증 키 모음
+
+    - JWT_SECRET: HS 계열 공유 비밀키
+    - JWT_JWKS_FILE: 로컬 JWKS(JSON) 파일, 변경 시 다시 읽음
+    - JWT_JWKS_URL: 원격 JWKS, 백그라운드에서 주기적으로 다시 받음
+
+    키는 읽을 때 한 번만 jwk.construct로 변환해 두고, 요청마다 kid로 바로 찾습니다.
+    키마다 허용 알고리즘을 따로 두어 공개키를 HS 비밀키로 쓰는 알고리즘 혼동을 막습니다.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.algorithms = settings.jwt_algorithms
+        self._keys: Dict[str, Tuple[Any, List[str]]] = {}
+        self._fingerprint = ""
+        # 출처별 원본 JWK 목록 (바뀌었는지 비교용)
+        self._file_jwks: List[Dict[str, Any]] = []
+        self._url_jwks: List[Dict[str, Any]] = []
+        self._jwks_file_mtime = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[], None]] = []
+        self.refreshes = 0
+
+        self._load_file()
+        self._rebuild()
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.settings.jwt_secret or self.settings.jwt_jwks_file or self.settings.jwt_jwks_url)
+
+    def on_change(self, listener: Callable[[], None]) -> None:
+        """키가 바뀌면 호출할 콜백 등록 (검증 캐시 비우기 등)"""
+        self._listeners.append(listener)
+
+    def get(self, kid: Optional[str]) -> Optional[Tuple[Any, List[str]]]:
+        """kid에 맞는 (키, 허용 알고리즘) 반환 (kid가 없으면 공유 비밀키, 그것도 없고 키가 하나뿐이면 그 키)"""
+        if kid is not None:
+            return self._keys.get(kid)
+        if SECRET_KEY_ID in self._keys:
+            return self._keys[SECRET_KEY_ID]
+        if len(self._keys) == 1:
+            return next(iter(self._keys.values()))
+        return None
+
+    # ---- 키 읽기 ----
+
+    @staticmethod
+    def _default_algorithm(key_data: Dict[str, Any]) -> str:
+        return {"RSA": "RS256", "EC": "ES256", "oct": "HS256"}.get(key_data.get("kty"), "RS256")
+
+    def _load_file(self) -> None:
+        path = self.settings.jwt_jwks_file
+        if not path:
+            return
+        try:
+            self._jwks_file_mtime = os.path.getmtime(path)
+            with open(path, "r", encoding="utf-8") as f:
+                self._file_jwks = json.load(f).get("keys", [])
+        except (OSError, ValueError, AttributeError) as e:
+            # 읽지 못하면 이전 키를 계속 사용
+            logger.error(f"❌ JWKS 파일 읽기 실패: {path} ({str(e)})")
+
+    async def _fetch_url(self, client: httpx.AsyncClient) -> None:
+        url = self.settings.jwt_jwks_url
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            self._url_jwks = response.json().get("keys", [])
+        except (httpx.HTTPError, ValueError, AttributeError) as e:
+            logger.error(f"❌ JWKS 다운로드 실패: {url} ({str(e)})")
+
+    def _rebuild(self) -> None:
+        """출처별 키를 합쳐 다시 구성 (내용이 바뀐 경우에만 리스너 호출)"""
+        fingerprint = json.dumps([self.settings.jwt_secret, self._file_jwks, self._url_jwks], sort_keys=True)
+        if fingerprint == self._fingerprint:
+            return
+
+        keys = {}
+        if self.settings.jwt_secret:
+            hmac_algorithms = [name for name in self.algorithms if name.startswith("HS")]
+            keys[SECRET_KEY_ID] = (self.settings.jwt_secret, hmac_algorithms)
+        for source, jwks in (("file", self._file_jwks), ("url", self._url_jwks)):
+            for index, key_data in enumerate(jwks):
+                algorithm = key_data.get("alg") or self._default_algorithm(key_data)
+                if algorithm not in self.algorithms:
+                    logger.warning(f"⚠️ 허용되지 않은 알고리즘의 JWK 무시: {source} ({algorithm})")
+                    continue
+                try:
+                    keys[key_data.get("kid") or f"{source}#{index}"] = (jwk.construct(key_data, algorithm), [algorithm])
+                except JOSEError as e:
+                    logger.error(f"❌ JWK 변환 실패: {source} ({str(e)})")
+
+        self._keys = keys
+        self._fingerprint = fingerprint
+        logger.info(f"🔑 JWT 검증 키 {len(keys)}개 로드")
+        for listener in self._listeners:
+            listener()
+
+    # ---- 백그라운드 갱신 ----
+
+    async def refresh(self, client: Optional[httpx.AsyncClient] = None) -> None:
+        path = self.settings.jwt_jwks_file
+        if path:
+            try:
+                if os.path.getmtime(path) != self._jwks_file_mtime:
+                    self._load_file()
+            except OSError:
+                pass
+        if client is not None and self.settings.jwt_jwks_url:
+            await self._fetch_url(client)
+        self._rebuild()
+        self.refreshes += 1
+
+    async def start(self) -> None:
+        """원격 JWKS를 처음 받아오고 주기적 갱신 시작"""
+        if self._refresh_task is not None:
+            return
+        if not self.configured:
+            logger.warning("⚠️ JWT 검증 키가 설정되지 않아 토큰 검증 없이 요청을 통과시킵니다")
+            return
+        if self.settings.jwt_jwks_url:
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                await self.refresh(client)
+        if self.settings.jwt_jwks_refresh_interval > 0 and (self.settings.jwt_jwks_file or self.settings.jwt_jwks_url):
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def _refresh_loop(self) -> None:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            while True:
+                await asyncio.sleep(self.settings.jwt_jwks_refresh_interval)
+                try:
+                    await self.refresh(client)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"❌ JWKS 갱신 루프 오류: {str(e)}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "configured": self.configured,
+            "key_ids": [kid for kid in self._keys if kid != SECRET_KEY_ID],
+            "shared_secret": SECRET_KEY_ID in self._keys,
+            "refreshes": self.refreshes,
+        }
@@ -0,0 +1,98 @@
+import time
+import hashlib
+import logging
+from typing import Dict, Any
+
+from jose import jwt
+from jose.exceptions import JOSEError, ExpiredSignatureError
+
+from app.common.utility.constant.settings import Settings
+from app.domain.cache.model.lru_cache import LocalLRUCache
+from .jwt_key_set import JwtKeySet
+
+logger = logging.getLogger("gateway_api")
+
+
+class TokenVerificationError(Exception):
+    """토큰이 없거나 유효하지 않음"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class TokenVerifier:
+    """JWT 서명/클레임 검증 + 검증된 토큰 캐시
+
+    같은 토큰은 만료 전까지 캐시에서 클레임을 바로 돌려주므로, 서명 검증 CPU 비용은
+    요청 수가 아니라 서로 다른 토큰 수에 비례합니다. 키가 바뀌면 캐시를 비웁니다.
+    """
+
+    def __init__(self, settings: Settings, key_set: JwtKeySet):
+        self.key_set = key_set
+        self.audience = settings.jwt_audience
+        self.issuer = settings.jwt_issuer
+        self.leeway = settings.jwt_leeway
+        self.cache_ttl = settings.jwt_cache_ttl
+        self.cache = LocalLRUCache(settings.jwt_cache_max_entries)
+        key_set.on_change(self.cache.clear)
+
+        self.verified = 0
+        self.rejected = 0
+
+    @staticmethod
+    def _cache_key(token: str) -> str:
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """검증된 클레임 반환 (실패 시 TokenVerificationError)"""
+        cache_key = self._cache_key(token)
+        claims = self.cache.get(cache_key)
+        if claims is not None:
+            return claims
+
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except JOSEError:
+            self.rejected += 1
+            raise TokenVerificationError("malformed token")
+        entry = self.key_set.get(kid)
+        if entry is None:
+            self.rejected += 1
+            raise TokenVerificationError("unknown signing key")
+        key, algorithms = entry
+
+        try:
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=algorithms,
+                audience=self.audience,
+                issuer=self.issuer,
+                options={"verify_aud": self.audience is not None, "leeway": self.leeway},
+            )
+        except ExpiredSignatureError:
+            self.rejected += 1
+            raise TokenVerificationError("token expired")
+        except JOSEError as e:
+            self.rejected += 1
+            raise TokenVerificationError(str(e) or "invalid token")
+
+        self.verified += 1
+        ttl = self.cache_ttl
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            # 캐시 항목이 토큰 만료 시각을 넘기지 않도록
+            ttl = min(ttl, exp - time.time())
+        self.cache.set(cache_key, claims, ttl)
+        return claims
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "keys": self.key_set.snapshot(),
+            "verified": self.verified,
+            "rejected": self.rejected,
+            "cache_entries": len(self.cache),
+            "cache_hits": self.cache.hits,
+            "cache_misses": self.cache.misses,
+        }
@@ -0,0 +1,94 @@
+import json
+import time
+import hashlib
+import httpx
+from typing import List, Tuple, Optional
+
+from app.common.utility.constant.http_headers import RESPONSE_EXCLUDED_HEADERS
+
+
+class CachedResponse:
+    """버퍼링된 업스트림 응답 (상태 코드, 헤더, 원본 바이트, ETag)"""
+
+    __slots__ = ("status_code", "headers", "body", "etag", "stored_at")
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        etag: Optional[str] = None,
+        stored_at: Optional[float] = None,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.etag = etag or self.header("etag") or self.compute_etag(body)
+        self.stored_at = stored_at if stored_at is not None else time.time()
+
+    @classmethod
+    async def from_upstream(cls, response: httpx.Response) -> "CachedResponse":
+        """스트리밍 업스트림 응답을 원본 바이트 그대로 읽어 버퍼링 (content-encoding 유지)"""
+        try:
+            body = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        headers = [
+            (key, value) for key, value in response.headers.multi_items()
+            if key.lower() not in RESPONSE_EXCLUDED_HEADERS and key.lower() != "content-length"
+        ]
+        return cls(response.status_code, headers, body)
+
+    @staticmethod
+    def compute_etag(body: bytes) -> str:
+        return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+    def header(self, name: str) -> Optional[str]:
+        name = name.lower()
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+    def vary(self) -> List[str]:
+        """응답 Vary 헤더의 요청 헤더 이름 목록 (소문자)"""
+        values = [value for key, value in self.headers if key.lower() == "vary"]
+        return sorted({name.strip().lower() for value in values for name in value.split(",") if name.strip()})
+
+    def age(self) -> int:
+        return max(0, int(time.time() - self.stored_at))
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """If-None-Match 헤더와 ETag 비교 (weak 비교)"""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        etag = self.etag[2:] if self.etag.startswith("W/") else self.etag
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate.startswith("W/"):
+                candidate = candidate[2:]
+            if candidate == etag:
+                return True
+        return False
+
+    def dumps(self) -> bytes:
+        """Redis 저장용 직렬화: JSON 메타 한 줄 + 원본 본문"""
+        meta = json.dumps(
+            {"s": self.status_code, "h": self.headers, "e": self.etag, "t": self.stored_at},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        return meta + b"\n" + self.body
+
+    @classmethod
+    def loads(cls, raw: bytes) -> "CachedResponse":
+        meta, _, body = raw.partition(b"\n")
+        data = json.loads(meta)
+        return cls(
+            status_code=data["s"],
+            headers=[(key, value) for key, value in data["h"]],
+            body=body,
+            etag=data["e"],
+            stored_at=data["t"],
+        )
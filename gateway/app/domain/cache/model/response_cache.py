@@ -0,0 +1,230 @@
+import time
+import json
+import asyncio
+import hashlib
+import logging
+from typing import Optional, Dict, List, Any, Tuple, Mapping
+
+from redis.exceptions import RedisError
+
+from app.common.utility.constant.settings import Settings
+from app.domain.discovery.model.service_type import ServiceType
+from .cached_response import CachedResponse
+from .lru_cache import LocalLRUCache
+
+logger = logging.getLogger("gateway_api")
+
+# 캐시에 저장하지 않는 응답 Cache-Control 지시어
+UNCACHEABLE_DIRECTIVES = ("no-store", "private")
+
+# Redis 오류 후 다시 시도하기까지 대기 시간(초)
+REDIS_RETRY_INTERVAL = 5.0
+
+
+class ResponseCache:
+    """멱등 GET 프록시용 2단계 응답 캐시 (프로세스 내 LRU → Redis)
+
+    - CACHE_TTL_{SERVICE}>0 인 서비스만 캐시 (opt-in)
+    - 키: 서비스 + 경로 + 쿼리 + (CACHE_KEY_HEADERS ∪ Accept-Encoding ∪ 응답 Vary 헤더) 요청 헤더 값
+    - 같은 키를 동시에 채우려는 요청은 채우기 락(Redis SET NX / 인프로세스 Event)으로 하나만 업스트림 호출
+    - Redis가 없거나 장애 시 LRU만으로 동작
+    """
+
+    KEY_PREFIX = "gw:cache:"
+
+    def __init__(self, settings: Settings, redis_client=None):
+        self.redis = redis_client
+        self.ttls: Dict[ServiceType, int] = {
+            service_type: settings.cache_ttl(service_type.name) for service_type in ServiceType
+        }
+        self.local = LocalLRUCache(settings.cache_local_max_entries)
+        self.local_ttl = settings.cache_local_ttl
+        self.max_body_bytes = settings.cache_max_body_bytes
+        self.lock_ttl = settings.cache_lock_ttl
+        self.lock_wait = settings.cache_lock_wait
+        self.key_headers = settings.cache_key_headers
+
+        self._fill_events: Dict[str, asyncio.Event] = {}
+        self._redis_retry_at = 0.0
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.lock_waits = 0
+
+    def enabled_for(self, service_type: ServiceType) -> bool:
+        return self.ttls.get(service_type, 0) > 0
+
+    # ---- 키 구성 ----
+
+    @staticmethod
+    def _digest(value: str) -> str:
+        return hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _base_key(self, service_type: ServiceType, path: str, query: str) -> str:
+        return self._digest(f"{service_type.value}/{path}?{query}")
+
+    def _variant_key(self, base_key: str, vary: List[str], request_headers: Mapping[str, str]) -> str:
+        # 업스트림이 압축한 본문을 그대로 저장하므로 Vary가 없어도 Accept-Encoding별로 항목을 나눔 (SingleFlight.key와 같은 기준)
+        names = sorted(set(self.key_headers) | set(vary) | {"accept-encoding"})
+        parts = [base_key] + [f"{name}={request_headers.get(name, '')}" for name in names]
+        return self._digest("\n".join(parts))
+
+    # ---- Redis 접근 (장애 시 None) ----
+
+    def _redis_available(self) -> bool:
+        return self.redis is not None and time.monotonic() >= self._redis_retry_at
+
+    async def _redis_call(self, coro) -> Any:
+        try:
+            return await coro
+        except (RedisError, OSError) as e:
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+            logger.warning(f"⚠️ Redis 캐시 접근 실패, {REDIS_RETRY_INTERVAL}초 동안 LRU만 사용: {str(e)}")
+            return None
+
+    async def _get_raw(self, key: str) -> Optional[bytes]:
+        if not self._redis_available():
+            return None
+        return await self._redis_call(self.redis.get(self.KEY_PREFIX + key))
+
+    # ---- 조회 / 저장 ----
+
+    async def _vary(self, base_key: str) -> List[str]:
+        vary_key = "vary:" + base_key
+        vary = self.local.get(vary_key)
+        if vary is not None:
+            return vary
+        raw = await self._get_raw(vary_key)
+        if raw is None:
+            return []
+        vary = json.loads(raw)
+        self.local.set(vary_key, vary, self.local_ttl)
+        return vary
+
+    async def lookup(
+        self,
+        service_type: ServiceType,
+        path: str,
+        query: str,
+        request_headers: Mapping[str, str],
+        record_stats: bool = True,
+    ) -> Tuple[Optional[CachedResponse], str]:
+        """(캐시된 응답 또는 None, 채우기 락에 쓸 키) 반환"""
+        base_key = self._base_key(service_type, path, query)
+        key = self._variant_key(base_key, await self._vary(base_key), request_headers)
+
+        entry = self.local.get(key)
+        if entry is None:
+            raw = await self._get_raw(key)
+            if raw is not None:
+                entry = CachedResponse.loads(raw)
+                # 자주 조회되는 키는 LRU에서 바로 응답
+                self.local.set(key, entry, self.local_ttl)
+
+        if record_stats:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry, key
+
+    def is_cacheable(self, entry: CachedResponse) -> bool:
+        if entry.status_code != 200 or len(entry.body) > self.max_body_bytes:
+            return False
+        if entry.header("set-cookie") is not None:
+            return False
+        cache_control = (entry.header("cache-control") or "").lower()
+        if any(directive in cache_control for directive in UNCACHEABLE_DIRECTIVES):
+            return False
+        return "*" not in entry.vary()
+
+    async def store(
+        self,
+        service_type: ServiceType,
+        path: str,
+        query: str,
+        request_headers: Mapping[str, str],
+        entry: CachedResponse,
+    ) -> None:
+        ttl = self.ttls.get(service_type, 0)
+        if ttl <= 0 or not self.is_cacheable(entry):
+            return
+
+        base_key = self._base_key(service_type, path, query)
+        vary = entry.vary()
+        key = self._variant_key(base_key, vary, request_headers)
+
+        self.local.set("vary:" + base_key, vary, min(ttl, self.local_ttl))
+        self.local.set(key, entry, min(ttl, self.local_ttl))
+        self.stores += 1
+
+        if self._redis_available():
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.set(self.KEY_PREFIX + "vary:" + base_key, json.dumps(vary), ex=ttl)
+            pipe.set(self.KEY_PREFIX + key, entry.dumps(), ex=ttl)
+            await self._redis_call(pipe.execute())
+
+    # ---- 스탬피드 방지 채우기 락 ----
+
+    async def acquire_fill_lock(self, key: str) -> bool:
+        """이 요청이 업스트림에서 캐시를 채워야 하면 True"""
+        if key in self._fill_events:
+            return False
+        if self._redis_available():
+            acquired = await self._redis_call(
+                self.redis.set(self.KEY_PREFIX + "lock:" + key, b"1", nx=True, px=int(self.lock_ttl * 1000))
+            )
+            # Redis 장애(None)면 인프로세스 락만으로 진행
+            if acquired is not None and not acquired:
+                return False
+        self._fill_events[key] = asyncio.Event()
+        return True
+
+    async def release_fill_lock(self, key: str) -> None:
+        event = self._fill_events.pop(key, None)
+        if event is not None:
+            event.set()
+        if self._redis_available():
+            await self._redis_call(self.redis.delete(self.KEY_PREFIX + "lock:" + key))
+
+    async def wait_for_fill(
+        self,
+        service_type: ServiceType,
+        path: str,
+        query: str,
+        request_headers: Mapping[str, str],
+        key: str,
+    ) -> Optional[CachedResponse]:
+        """다른 요청이 캐시를 채울 때까지 최대 lock_wait초 대기 후 다시 조회"""
+        self.lock_waits += 1
+        deadline = time.monotonic() + self.lock_wait
+        event = self._fill_events.get(key)
+        if event is not None:
+            try:
+                await asyncio.wait_for(event.wait(), timeout=self.lock_wait)
+            except asyncio.TimeoutError:
+                return None
+            entry, _ = await self.lookup(service_type, path, query, request_headers, record_stats=False)
+            return entry
+
+        # 다른 gateway 인스턴스가 채우는 중: 짧은 간격으로 폴링
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            entry, _ = await self.lookup(service_type, path, query, request_headers, record_stats=False)
+            if entry is not None:
+                return entry
+        return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enabled_services": {st.value: ttl for st, ttl in self.ttls.items() if ttl > 0},
+            "redis": self.redis is not None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "lock_waits": self.lock_waits,
+            "local_entries": len(self.local),
+            "local_hits": self.local.hits,
+            "local_misses": self.local.misses,
+        }
@@ -0,0 +1,120 @@
+import time
+import logging
+from enum import Enum
+from typing import Dict, Any
+
+logger = logging.getLogger("gateway_api")
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 업스트림 호출 없이 즉시 실패"""
+
+    def __init__(self, service_name: str, retry_after: float):
+        super().__init__(f"Circuit open for service: {service_name}")
+        self.service_name = service_name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """서비스별 서킷 브레이커 (closed → open → half_open → closed)
+
+    - closed: 연속 실패가 failure_threshold에 도달하면 open
+    - open: recovery_timeout 동안 호출 없이 즉시 실패, 이후 half_open
+    - half_open: half_open_max_calls개의 시험 호출만 허용, 성공하면 closed / 실패하면 다시 open
+
+    이벤트 루프 단일 스레드에서만 사용하므로 별도 락을 두지 않습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.half_open_in_flight = 0
+
+        # 관리용 카운터
+        self.total_successes = 0
+        self.total_failures = 0
+        self.short_circuited = 0
+        self.times_opened = 0
+
+    def _transition(self, state: CircuitState) -> None:
+        if self.state is state:
+            return
+        logger.warning(f"⚡ {self.name} 서킷 상태 변경: {self.state.value} → {state.value}")
+        self.state = state
+        if state is CircuitState.OPEN:
+            self.opened_at = time.monotonic()
+            self.times_opened += 1
+            self.half_open_in_flight = 0
+        elif state is CircuitState.CLOSED:
+            self.consecutive_failures = 0
+            self.half_open_in_flight = 0
+
+    def retry_after(self) -> float:
+        """open 상태가 끝날 때까지 남은 시간(초)"""
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+
+    def before_call(self) -> None:
+        """호출 허용 여부 확인 (허용되지 않으면 CircuitOpenError)"""
+        if self.state is CircuitState.OPEN:
+            if time.monotonic() - self.opened_at >= self.recovery_timeout:
+                self._transition(CircuitState.HALF_OPEN)
+            else:
+                self.short_circuited += 1
+                raise CircuitOpenError(self.name, self.retry_after())
+
+        if self.state is CircuitState.HALF_OPEN:
+            if self.half_open_in_flight >= self.half_open_max_calls:
+                self.short_circuited += 1
+                raise CircuitOpenError(self.name, self.recovery_timeout)
+            self.half_open_in_flight += 1
+
+    def release(self) -> None:
+        """결과 없이 끝난 호출(취소 등)의 half_open 시험 슬롯 반환"""
+        if self.state is CircuitState.HALF_OPEN and self.half_open_in_flight > 0:
+            self.half_open_in_flight -= 1
+
+    def record_success(self) -> None:
+        self.total_successes += 1
+        if self.state is CircuitState.HALF_OPEN:
+            self._transition(CircuitState.CLOSED)
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        self.total_failures += 1
+        if self.state is CircuitState.HALF_OPEN:
+            self._transition(CircuitState.OPEN)
+            return
+        self.consecutive_failures += 1
+        if self.state is CircuitState.CLOSED and self.consecutive_failures >= self.failure_threshold:
+            self._transition(CircuitState.OPEN)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_after": round(self.retry_after(), 3),
+            "total_successes": self.total_successes,
+            "total_failures": self.total_failures,
+            "short_circuited": self.short_circuited,
+            "times_opened": self.times_opened,
+        }
@@ -0,0 +1,92 @@
+import time
+import random
+from typing import Dict, Any, List
+
+# 재시도해도 안전한 멱등 메서드
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# 재시도 대상 업스트림 상태 코드
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+
+class RetryBudget:
+    """최근 ttl초 동안의 요청 수에 비례해 재시도 횟수를 제한하는 예산
+
+    허용 재시도 = min_retries_per_second * ttl + ratio * (최근 요청 수)
+    장애 시 재시도가 트래픽을 증폭시키지 않도록 전체 요청 대비 재시도 비율을 묶어 둡니다.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries_per_second: float = 5.0, ttl: int = 10):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.ttl = max(1, int(ttl))
+        # 초 단위 버킷 (ttl개 순환): [epoch_second, requests, retries]
+        self._buckets: List[List[int]] = [[0, 0, 0] for _ in range(self.ttl)]
+
+        self.total_requests = 0
+        self.total_retries = 0
+        self.denied_retries = 0
+
+    def _bucket(self, now: int) -> List[int]:
+        bucket = self._buckets[now % self.ttl]
+        if bucket[0] != now:
+            bucket[0], bucket[1], bucket[2] = now, 0, 0
+        return bucket
+
+    def _window(self, now: int):
+        requests = retries = 0
+        for second, bucket_requests, bucket_retries in self._buckets:
+            if now - second < self.ttl:
+                requests += bucket_requests
+                retries += bucket_retries
+        return requests, retries
+
+    def record_request(self) -> None:
+        self._bucket(int(time.monotonic()))[1] += 1
+        self.total_requests += 1
+
+    def try_acquire_retry(self) -> bool:
+        """예산 안이면 재시도 1회를 차감하고 True"""
+        now = int(time.monotonic())
+        requests, retries = self._window(now)
+        allowed = self.min_retries_per_second * self.ttl + self.ratio * requests
+        if retries + 1 > allowed:
+            self.denied_retries += 1
+            return False
+        self._bucket(now)[2] += 1
+        self.total_retries += 1
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        requests, retries = self._window(int(time.monotonic()))
+        return {
+            "window_requests": requests,
+            "window_retries": retries,
+            "total_requests": self.total_requests,
+            "total_retries": self.total_retries,
+            "denied_retries": self.denied_retries,
+        }
+
+
+class RetryPolicy:
+    """멱등 요청 재시도 정책 (지수 백오프 + full jitter, 재시도 예산 적용)"""
+
+    def __init__(
+        self,
+        budget: RetryBudget,
+        max_attempts: int = 3,
+        backoff_base: float = 0.05,
+        backoff_max: float = 1.0,
+    ):
+        self.budget = budget
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    @staticmethod
+    def is_retryable_method(method: str) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 재시도 전 대기 시간 (0 ~ base * 2^attempt 사이 균등 분포)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
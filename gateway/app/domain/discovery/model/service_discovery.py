@@ -1,88 +1,221 @@
+import time
 import httpx
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterable, Callable, Iterable, Tuple, Union
+from app.common.utility.constant.http_headers import REQUEST_EXCLUDED_HEADERS
+from app.common.metrics import REGISTRY
+from app.common.tracing import tracer, current_span, TRACEPARENT_HEADER
 from .service_type import ServiceType
+from .circuit_breaker import CircuitBreaker
+from .service_registry import ServiceInstance, ServiceRegistry
+from .retry_policy import RetryBudget, RetryPolicy, RETRYABLE_STATUS_CODES
 
 logger = logging.getLogger("gateway_api")
 
+# 업스트림 시도 하나의 응답 헤더까지 걸린 시간 (재시도는 시도마다 기록, 연결 실패는 status="error")
+UPSTREAM_DURATION = REGISTRY.histogram(
+    "gateway_upstream_request_duration_seconds",
+    "업스트림 서비스 응답 헤더 수신까지 걸린 시간",
+    ("service", "method", "status"),
+)
+
+class InstanceReleasingStream(httpx.AsyncByteStream):
+    """업스트림 응답 스트림이 닫힐 때 인스턴스의 outstanding 카운트를 반환"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, instance: ServiceInstance):
+        self._stream = stream
+        self._instance = instance
+        self._released = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._instance.release()
+
 class ServiceDiscovery:
-    def __init__(self, service_type: ServiceType):
+    def __init__(
+        self,
+        service_type: ServiceType,
+        client: httpx.AsyncClient,
+        registry: ServiceRegistry,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
         self.service_type = service_type
+        # 시작 시 한 번 구성된 인스턴스 레지스트리 (헬스 체크 + 로드 밸런싱)
+        self.registry = registry
+        # lifespan에서 생성된 공유 커넥션 풀 (요청마다 새로 만들지 않음)
+        self.client = client
+        # 서비스별 서킷 브레이커 / 재시도 정책
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(service_type.value)
+        self.retry_policy = retry_policy or RetryPolicy(RetryBudget())
         
-        # 환경에 따라 URL 설정
-        import os
-        is_local = os.getenv("ENVIRONMENT", "local") == "local"
-        
-        if is_local:
-            # 로컬 개발 환경
-            self.service_urls = {
-                ServiceType.AUTH: "http://localhost:8008",
-                ServiceType.CHATBOT: "http://localhost:8001",
-                ServiceType.MATERIALITY: "http://localhost:8002",
-                ServiceType.GRI: "http://localhost:8003",
-                ServiceType.GRIREPORT: "http://localhost:8004",
-                ServiceType.TCFD: "http://localhost:8005",
-                ServiceType.TCFDREPORT: "http://localhost:8006",
-                ServiceType.SURVEY: "http://localhost:8007",
-            }
-        else:
-            # 배포 환경 - 실제 서비스 URL 사용
-            self.service_urls = {
-                ServiceType.AUTH: "http://auth-service:8008",
-                ServiceType.CHATBOT: "http://chatbot-service:8001",
-                ServiceType.MATERIALITY: "http://materiality-service:8002",
-                ServiceType.GRI: "http://gri-service:8003",
-                ServiceType.GRIREPORT: "http://grireport-service:8004",
-                ServiceType.TCFD: "http://tcfd-service:8005",
-                ServiceType.TCFDREPORT: "http://tcfdreport-service:8006",
-                ServiceType.SURVEY: "http://survey-service:8007",
-            }
-    
     def get_service_url(self) -> str:
-        """서비스 URL 반환"""
-        return self.service_urls.get(self.service_type, "")
+        """로드 밸런싱으로 선택한 인스턴스 URL 반환"""
+        instance = self.registry.pick(self.service_type)
+        return instance.url if instance else ""
     
-    async def request(
+    async def _send(
         self,
         method: str,
-        path: str,
-        headers: Optional[Dict[str, str]] = None,
-        body: Optional[bytes] = None,
-        files: Optional[Dict] = None,
-        params: Optional[Dict] = None,
-        data: Optional[Dict] = None
+        build_request: Callable[[str], httpx.Request],
+        replayable: bool,
+        stream: bool,
     ) -> httpx.Response:
-        """서비스에 요청 전달"""
-        service_url = self.get_service_url()
-        if not service_url:
-            raise Exception(f"Unknown service type: {self.service_type}")
-        
-        # 전체 URL 구성
-        full_url = f"{service_url}/{path}"
-        
-        logger.info(f"🔄 {method} 요청을 {self.service_type.value} 서비스로 전달: {full_url}")
-        
-        async with httpx.AsyncClient() as client:
+        """서킷 브레이커와 재시도 예산을 적용해 요청 전송
+
+        시도할 때마다 레지스트리에서 인스턴스를 새로 골라 build_request(인스턴스 URL)로 요청을 만듭니다.
+        연결 실패/타임아웃과 502·503·504 응답을 실패로 기록합니다.
+        멱등 메서드이면서 본문을 다시 보낼 수 있는 요청만 jitter 백오프로 재시도합니다.
+        """
+        breaker = self.circuit_breaker
+        policy = self.retry_policy
+        retryable = replayable and policy.is_retryable_method(method)
+        policy.budget.record_request()
+
+        attempt = 0
+        while True:
+            # open 상태면 업스트림을 호출하지 않고 CircuitOpenError로 즉시 실패
+            breaker.before_call()
+            can_retry = retryable and attempt + 1 < policy.max_attempts
+            instance = self.registry.pick(self.service_type)
+            if instance is None:
+                breaker.release()
+                raise Exception(f"Unknown service type: {self.service_type}")
+
+            instance.acquire()
+            request = build_request(instance.url)
+            span = self._start_upstream_span(request, instance, attempt)
+            started = time.perf_counter()
             try:
-                if method.upper() == "GET":
-                    response = await client.get(full_url, headers=headers, params=params)
-                elif method.upper() == "POST":
-                    response = await client.post(full_url, headers=headers, json=data, files=files, params=params)
-                elif method.upper() == "PUT":
-                    response = await client.put(full_url, headers=headers, json=data)
-                elif method.upper() == "DELETE":
-                    response = await client.delete(full_url, headers=headers)
-                elif method.upper() == "PATCH":
-                    response = await client.patch(full_url, headers=headers, json=data)
-                else:
-                    raise Exception(f"Unsupported HTTP method: {method}")
-                
-                logger.info(f"✅ {self.service_type.value} 서비스 응답: {response.status_code}")
-                return response
-                
+                response = await self.client.send(request, stream=stream)
             except httpx.RequestError as e:
-                logger.error(f"❌ {self.service_type.value} 서비스 요청 실패: {str(e)}")
-                raise Exception(f"Service request failed: {str(e)}")
-            except Exception as e:
-                logger.error(f"❌ {self.service_type.value} 서비스 오류: {str(e)}")
+                UPSTREAM_DURATION.observe((self.service_type.value, method, "error"), time.perf_counter() - started)
+                if span is not None:
+                    span.set_error(e)
+                    span.end()
+                instance.release()
+                breaker.record_failure()
+                if can_retry and policy.budget.try_acquire_retry():
+                    await asyncio.sleep(policy.backoff(attempt))
+                    attempt += 1
+                    continue
+                raise
+            except BaseException as e:
+                # 취소 등 결과 없이 끝난 호출
+                if span is not None:
+                    span.set_error(e)
+                    span.end()
+                instance.release()
+                breaker.release()
                 raise
+
+            UPSTREAM_DURATION.observe(
+                (self.service_type.value, method, str(response.status_code)), time.perf_counter() - started
+            )
+            if span is not None:
+                span.set_attribute("http.status_code", response.status_code)
+                if response.status_code >= 500:
+                    span.status = "error"
+                span.end()
+            if stream:
+                # 스트리밍 응답은 본문 전송이 끝나 aclose될 때 outstanding을 반환
+                response.stream = InstanceReleasingStream(response.stream, instance)
+            else:
+                instance.release()
+
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                breaker.record_failure()
+                if can_retry and policy.budget.try_acquire_retry():
+                    await response.aclose()
+                    logger.warning(f"🔁 {self.service_type.value} {response.status_code} 응답, 재시도 {attempt + 1}")
+                    await asyncio.sleep(policy.backoff(attempt))
+                    attempt += 1
+                    continue
+                return response
+
+            breaker.record_success()
+            return response
+
+    def _start_upstream_span(self, request: httpx.Request, instance: ServiceInstance, attempt: int):
+        """업스트림 시도마다 client span을 만들고 traceparent를 그 span 값으로 교체
+
+        응답 헤더를 받을 때까지를 기록하며(본문 스트리밍 제외), 샘플링되지 않은 trace도 ID는 전파합니다.
+        """
+        parent = current_span()
+        if parent is None or not tracer.enabled:
+            return None
+        span = tracer.start_span(f"upstream {self.service_type.value}", parent=parent.context, kind="client")
+        request.headers[TRACEPARENT_HEADER] = span.context.traceparent
+        if not span.recording:
+            return None
+        span.set_attribute("http.method", request.method)
+        span.set_attribute("http.url", str(request.url))
+        span.set_attribute("upstream.instance", instance.url)
+        span.set_attribute("retry.attempt", attempt)
+        return span
+
+    def resilience_snapshot(self) -> Dict[str, Any]:
+        """관리 엔드포인트용 서킷/재시도/인스턴스 상태"""
+        return {
+            "circuit_breaker": self.circuit_breaker.snapshot(),
+            "retry_budget": self.retry_policy.budget.snapshot(),
+            "instances": self.registry.snapshot(self.service_type),
+        }
+
+    @staticmethod
+    def forward_headers(headers: Iterable[Tuple[str, str]]) -> list:
+        """클라이언트 요청 헤더에서 hop-by-hop/host 헤더를 제거 (중복 헤더는 유지)
+
+        클라이언트가 Accept-Encoding을 보내지 않았으면 identity를 붙입니다. 그렇지 않으면 httpx 기본값(gzip 등)이
+        대신 전달되어, 압축을 요청하지 않은 클라이언트에게 압축된 원본 바이트가 그대로 중계됩니다.
+        """
+        forwarded = [
+            (key, value) for key, value in headers
+            if key.lower() not in REQUEST_EXCLUDED_HEADERS
+        ]
+        if not any(key.lower() == "accept-encoding" for key, _ in forwarded):
+            forwarded.append(("accept-encoding", "identity"))
+        return forwarded
+
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Any] = None,
+        content: Optional[Union[bytes, AsyncIterable[bytes]]] = None,
+        params: Optional[Any] = None,
+        query: str = "",
+    ) -> httpx.Response:
+        """본문을 버퍼링/파싱하지 않고 그대로 전달하는 스트리밍 요청
+
+        반환된 응답은 본문을 아직 읽지 않은 상태이므로 호출자가 반드시 aclose() 해야 합니다.
+        """
+        target = f"{path}?{query}" if query else path
+        logger.info("🔄 %s 스트리밍 요청을 %s 서비스로 전달: /%s", method, self.service_type.value, target)
+
+        try:
+            response = await self._send(
+                method,
+                # 클라이언트 쿼리스트링을 재인코딩 없이 그대로 전달
+                lambda service_url: self.client.build_request(
+                    method.upper(), f"{service_url}/{target}",
+                    headers=headers, content=content, params=params
+                ),
+                # 스트림 본문은 한 번만 읽을 수 있으므로 본문이 없거나 bytes일 때만 재시도
+                replayable=content is None or isinstance(content, bytes),
+                stream=True,
+            )
+            logger.info("✅ %s 서비스 응답: %s", self.service_type.value, response.status_code)
+            return response
+        except httpx.RequestError as e:
+            logger.error(f"❌ {self.service_type.value} 서비스 요청 실패: {str(e)}")
+            raise Exception(f"Service request failed: {str(e)}")
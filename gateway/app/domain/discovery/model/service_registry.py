@@ -0,0 +1,239 @@
+import os
+import json
+import time
+import random
+import asyncio
+import logging
+import httpx
+from typing import Optional, Dict, List, Any
+
+from app.common.utility.constant.settings import Settings
+from .service_type import ServiceType
+
+logger = logging.getLogger("gateway_api")
+
+# 설정이 없을 때 사용하는 기본 서비스 주소
+LOCAL_SERVICE_URLS = {
+    ServiceType.AUTH: "http://localhost:8008",
+    ServiceType.CHATBOT: "http://localhost:8001",
+    ServiceType.MATERIALITY: "http://localhost:8002",
+    ServiceType.GRI: "http://localhost:8003",
+    ServiceType.GRIREPORT: "http://localhost:8004",
+    ServiceType.TCFD: "http://localhost:8005",
+    ServiceType.TCFDREPORT: "http://localhost:8006",
+    ServiceType.SURVEY: "http://localhost:8007",
+}
+
+DEPLOYED_SERVICE_URLS = {
+    ServiceType.AUTH: "http://auth-service:8008",
+    ServiceType.CHATBOT: "http://chatbot-service:8001",
+    ServiceType.MATERIALITY: "http://materiality-service:8002",
+    ServiceType.GRI: "http://gri-service:8003",
+    ServiceType.GRIREPORT: "http://grireport-service:8004",
+    ServiceType.TCFD: "http://tcfd-service:8005",
+    ServiceType.TCFDREPORT: "http://tcfdreport-service:8006",
+    ServiceType.SURVEY: "http://survey-service:8007",
+}
+
+LOAD_BALANCING_STRATEGIES = ("p2c", "least_outstanding")
+
+
+class ServiceInstance:
+    """서비스 인스턴스 하나의 주소와 상태"""
+
+    __slots__ = ("url", "healthy", "outstanding", "probe_failures", "last_checked", "total_requests")
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.healthy = True
+        self.outstanding = 0
+        self.probe_failures = 0
+        self.last_checked = 0.0
+        self.total_requests = 0
+
+    def acquire(self) -> None:
+        self.outstanding += 1
+        self.total_requests += 1
+
+    def release(self) -> None:
+        if self.outstanding > 0:
+            self.outstanding -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "probe_failures": self.probe_failures,
+            "total_requests": self.total_requests,
+        }
+
+
+class ServiceRegistry:
+    """시작 시 한 번 구성되는 서비스 인스턴스 레지스트리
+
+    - 인스턴스 목록: SERVICE_REGISTRY_FILE(JSON, 변경 감지) → {SERVICE}_SERVICE_URL(콤마 구분) → 기본값 순
+    - 백그라운드에서 각 인스턴스의 /health를 주기적으로 확인
+    - 정상 인스턴스 중 p2c(power-of-two-choices) 또는 least_outstanding으로 선택
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.strategy = settings.load_balancing_strategy
+        if self.strategy not in LOAD_BALANCING_STRATEGIES:
+            logger.warning(f"⚠️ 알 수 없는 로드밸런싱 전략 '{self.strategy}', p2c 사용")
+            self.strategy = "p2c"
+
+        self._instances: Dict[ServiceType, List[ServiceInstance]] = {}
+        self._registry_file = settings.service_registry_file
+        self._registry_mtime = 0.0
+        self._health_task: Optional[asyncio.Task] = None
+        self._probe_client: Optional[httpx.AsyncClient] = None
+
+        self._load()
+
+    # ---- 인스턴스 목록 구성 ----
+
+    def _configured_urls(self) -> Dict[ServiceType, List[str]]:
+        defaults = LOCAL_SERVICE_URLS if self.settings.environment == "local" else DEPLOYED_SERVICE_URLS
+        file_urls = self._read_registry_file()
+        urls = {}
+        for service_type in ServiceType:
+            configured = file_urls.get(service_type) or self.settings.service_urls(service_type.name)
+            urls[service_type] = configured or [defaults[service_type]]
+        return urls
+
+    def _read_registry_file(self) -> Dict[ServiceType, List[str]]:
+        """{"auth": ["http://auth-1:8008", "http://auth-2:8008"], ...} 형식의 JSON 파일"""
+        if not self._registry_file:
+            return {}
+        try:
+            self._registry_mtime = os.path.getmtime(self._registry_file)
+            with open(self._registry_file, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"❌ 서비스 레지스트리 파일 읽기 실패: {self._registry_file} ({str(e)})")
+            return {}
+
+        result = {}
+        for name, urls in raw.items():
+            try:
+                service_type = ServiceType(name)
+            except ValueError:
+                logger.warning(f"⚠️ 레지스트리 파일의 알 수 없는 서비스: {name}")
+                continue
+            if isinstance(urls, str):
+                urls = [urls]
+            result[service_type] = [url for url in urls if url]
+        return result
+
+    def _load(self) -> None:
+        """설정에서 인스턴스 목록을 다시 읽음 (기존 인스턴스 상태는 URL 기준으로 유지)"""
+        for service_type, urls in self._configured_urls().items():
+            existing = {instance.url: instance for instance in self._instances.get(service_type, [])}
+            instances = []
+            for url in urls:
+                url = url.rstrip("/")
+                instances.append(existing.get(url) or ServiceInstance(url))
+            self._instances[service_type] = instances
+        logger.info(
+            "📒 서비스 레지스트리 구성: "
+            + ", ".join(f"{st.value}={len(insts)}" for st, insts in self._instances.items())
+        )
+
+    def _reload_if_changed(self) -> None:
+        if not self._registry_file:
+            return
+        try:
+            mtime = os.path.getmtime(self._registry_file)
+        except OSError:
+            return
+        if mtime != self._registry_mtime:
+            logger.info(f"🔄 서비스 레지스트리 파일 변경 감지: {self._registry_file}")
+            self._load()
+
+    # ---- 로드 밸런싱 ----
+
+    def instances(self, service_type: ServiceType) -> List[ServiceInstance]:
+        return self._instances.get(service_type, [])
+
+    def pick(self, service_type: ServiceType) -> Optional[ServiceInstance]:
+        """정상 인스턴스 중 하나를 선택 (모두 비정상이면 전체 중에서 선택)"""
+        instances = self._instances.get(service_type)
+        if not instances:
+            return None
+        if len(instances) == 1:
+            return instances[0]
+
+        candidates = [instance for instance in instances if instance.healthy] or instances
+        if len(candidates) == 1:
+            return candidates[0]
+        if self.strategy == "least_outstanding":
+            return min(candidates, key=lambda instance: instance.outstanding)
+        first, second = random.sample(candidates, 2)
+        return first if first.outstanding <= second.outstanding else second
+
+    # ---- 헬스 체크 ----
+
+    async def start(self) -> None:
+        """백그라운드 헬스 체크 시작"""
+        if self.settings.health_check_interval <= 0 or self._health_task is not None:
+            return
+        self._probe_client = httpx.AsyncClient(timeout=self.settings.health_check_timeout)
+        self._health_task = asyncio.create_task(self._health_loop())
+
+    async def stop(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        if self._probe_client is not None:
+            await self._probe_client.aclose()
+            self._probe_client = None
+
+    async def _health_loop(self) -> None:
+        while True:
+            try:
+                self._reload_if_changed()
+                await self.check_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ 헬스 체크 루프 오류: {str(e)}")
+            await asyncio.sleep(self.settings.health_check_interval)
+
+    async def check_all(self) -> None:
+        """모든 인스턴스를 동시에 probe"""
+        probes = [
+            self._probe(service_type, instance)
+            for service_type, instances in self._instances.items()
+            for instance in instances
+        ]
+        await asyncio.gather(*probes)
+
+    async def _probe(self, service_type: ServiceType, instance: ServiceInstance) -> None:
+        healthy = False
+        try:
+            response = await self._probe_client.get(f"{instance.url}{self.settings.health_check_path}")
+            healthy = response.status_code < 500
+        except httpx.HTTPError:
+            healthy = False
+        instance.last_checked = time.monotonic()
+
+        if healthy:
+            if not instance.healthy:
+                logger.info(f"💚 {service_type.value} 인스턴스 복구: {instance.url}")
+            instance.healthy = True
+            instance.probe_failures = 0
+            return
+
+        instance.probe_failures += 1
+        if instance.healthy and instance.probe_failures >= self.settings.health_check_unhealthy_threshold:
+            logger.warning(f"💔 {service_type.value} 인스턴스 비정상: {instance.url}")
+            instance.healthy = False
+
+    def snapshot(self, service_type: ServiceType) -> List[Dict[str, Any]]:
+        return [instance.snapshot() for instance in self._instances.get(service_type, [])]
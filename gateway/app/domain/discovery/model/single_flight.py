@@ -0,0 +1,86 @@
+import asyncio
+import hashlib
+import logging
+import httpx
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger("gateway_api")
+
+
+class UnsharedResponse:
+    """공유할 수 없는(큰 본문/이벤트 스트림) 업스트림 응답
+
+    먼저 claim()한 요청 하나만 그대로 중계하고, 나머지 요청은 각자 업스트림을 호출합니다.
+    """
+
+    def __init__(self, response: httpx.Response):
+        self._response: Optional[httpx.Response] = response
+
+    def claim(self) -> Optional[httpx.Response]:
+        response, self._response = self._response, None
+        return response
+
+
+class SingleFlight:
+    """동일한 동시 업스트림 요청을 하나로 합치는 single-flight 그룹
+
+    같은 키로 진행 중인 호출이 있으면 새 호출을 만들지 않고 그 결과를 함께 기다립니다.
+    실제 호출은 별도 태스크로 실행되므로 처음 요청한 클라이언트가 끊겨도 나머지 요청은 결과를 받습니다.
+    """
+
+    def __init__(self, key_headers: List[str], max_body_bytes: int):
+        self.key_headers = key_headers
+        self.max_body_bytes = max_body_bytes
+        self._calls: Dict[str, asyncio.Future] = {}
+
+        self.leaders = 0
+        self.collapsed = 0
+        self.unshared = 0
+
+    def key(self, method: str, service: str, path: str, query: str, headers: Mapping[str, str]) -> str:
+        """메서드, 서비스, 경로, 쿼리와 인증 범위(key_headers 값), Accept-Encoding으로 키 구성
+
+        업스트림이 압축한 원본 바이트를 그대로 공유하므로 Accept-Encoding이 다른 요청끼리는 합치지 않습니다.
+        """
+        parts = [method, service, path, query, headers.get("accept-encoding", "")]
+        parts += [headers.get(name, "") for name in self.key_headers]
+        return hashlib.blake2b("\n".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def shareable(self, response: httpx.Response) -> bool:
+        """본문 크기를 미리 알고 충분히 작은 일반 응답만 버퍼링해 공유"""
+        if "text/event-stream" in response.headers.get("content-type", ""):
+            return False
+        content_length = response.headers.get("content-length")
+        return content_length is not None and content_length.isdigit() and int(content_length) <= self.max_body_bytes
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """(결과, 다른 요청의 결과를 공유했는지) 반환"""
+        future = self._calls.get(key)
+        shared = future is not None
+        if shared:
+            self.collapsed += 1
+        else:
+            self.leaders += 1
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+
+        result = await asyncio.shield(future)
+        if isinstance(result, UnsharedResponse) and shared:
+            self.unshared += 1
+        return result, shared
+
+    def _finish(self, key: str, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        # 기다리던 요청이 모두 취소된 경우에도 예외가 회수되지 않았다는 경고를 남기지 않음
+        if not future.cancelled() and future.exception() is not None:
+            logger.debug(f"single-flight 호출 실패: {future.exception()}")
+
+    def snapshot(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "collapsed": self.collapsed,
+            "unshared": self.unshared,
+        }
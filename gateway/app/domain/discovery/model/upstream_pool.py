@@ -0,0 +1,116 @@
+import httpx
+import logging
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.common.utility.constant.settings import Settings
+from .service_type import ServiceType
+
+logger = logging.getLogger("gateway_api")
+
+
+@dataclass(frozen=True)
+class UpstreamPoolConfig:
+    """업스트림 서비스 하나에 대한 커넥션 풀/타임아웃 설정"""
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+    connect_timeout: float
+    read_timeout: float
+    write_timeout: float
+    pool_timeout: float
+
+    @classmethod
+    def from_settings(cls, settings: Settings, service_type: ServiceType) -> "UpstreamPoolConfig":
+        """Settings 기본값에 서비스별 override({SERVICE}_UPSTREAM_*)를 적용"""
+        values = settings.upstream_pool_config(service_type.name)
+        return cls(**values)
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+
+class _RejectAllCookiePolicy(DefaultCookiePolicy):
+    """쿠키를 저장하지도 보내지도 않는 정책"""
+
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+    def return_ok(self, cookie, request) -> bool:
+        return False
+
+
+def stateless_cookies() -> CookieJar:
+    """공유 클라이언트용 쿠키 저장소 (업스트림 Set-Cookie를 저장하지 않음)
+
+    httpx.Cookies로 감싸서 넘기면 클라이언트가 기본 정책 CookieJar로 복사하므로 CookieJar를 그대로 넘깁니다.
+    """
+    return CookieJar(policy=_RejectAllCookiePolicy())
+
+
+class UpstreamClientPool:
+    """ServiceType별로 하나씩 유지되는 httpx.AsyncClient 커넥션 풀
+
+    앱 lifespan에서 한 번 생성하고 종료 시 aclose()로 정리합니다.
+    요청마다 클라이언트를 새로 만들지 않으므로 업스트림 TCP 연결이 keep-alive로 재사용됩니다.
+    클라이언트는 모든 사용자가 공유하므로 쿠키를 저장하지 않습니다 (httpx 기본 쿠키 저장소를 쓰면
+    한 사용자 응답의 Set-Cookie가 다른 사용자 요청에 실려 감). 쿠키는 호출자의 Cookie 헤더만 전달됩니다.
+    """
+
+    def __init__(self, settings: Settings, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self._configs: Dict[ServiceType, UpstreamPoolConfig] = {}
+        self._clients: Dict[ServiceType, httpx.AsyncClient] = {}
+        for service_type in ServiceType:
+            config = UpstreamPoolConfig.from_settings(settings, service_type)
+            self._configs[service_type] = config
+            self._clients[service_type] = httpx.AsyncClient(
+                limits=config.limits(),
+                timeout=config.timeout(),
+                cookies=stateless_cookies(),
+                transport=transport,
+            )
+
+    def get(self, service_type: ServiceType) -> httpx.AsyncClient:
+        """서비스 타입에 해당하는 공유 클라이언트 반환"""
+        return self._clients[service_type]
+
+    def config(self, service_type: ServiceType) -> UpstreamPoolConfig:
+        return self._configs[service_type]
+
+    def usage(self) -> Iterable[Tuple[Tuple[str, str], int]]:
+        """/metrics용 서비스별 커넥션 풀 사용량 ((서비스, active|idle|queued), 개수)
+
+        httpx가 풀 상태를 공개하지 않아 httpcore 풀 내부를 읽으며, 구조가 다르면 건너뜁니다.
+        """
+        for service_type, client in self._clients.items():
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            if pool is None:
+                continue
+            connections = list(getattr(pool, "connections", ()))
+            idle = sum(1 for connection in connections if connection.is_idle())
+            queued = sum(1 for request in list(getattr(pool, "_requests", ())) if request.is_queued())
+            yield (service_type.value, "active"), len(connections) - idle
+            yield (service_type.value, "idle"), idle
+            yield (service_type.value, "queued"), queued
+
+    async def aclose(self) -> None:
+        """모든 업스트림 커넥션 풀 종료"""
+        for service_type, client in self._clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"⚠️ {service_type.value} 커넥션 풀 종료 실패: {str(e)}")
+        logger.info("🔌 업스트림 커넥션 풀 종료 완료")
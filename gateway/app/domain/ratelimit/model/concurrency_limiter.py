@@ -0,0 +1,56 @@
+from typing import Optional, Dict, Any
+
+from app.common.utility.constant.settings import Settings
+from app.domain.discovery.model.service_type import ServiceType
+
+
+class ConcurrencyLimiter:
+    """ServiceType별 / 사용자별 진행 중인 업스트림 요청 수 상한 (gateway 인스턴스 단위)
+
+    한도를 넘는 요청은 커넥션 풀 대기열에 쌓이지 않고 바로 거부되므로,
+    한 서비스로 몰린 요청이 이벤트 루프와 다른 서비스의 커넥션 풀을 잡아먹지 않습니다.
+    이벤트 루프 단일 스레드에서만 사용하므로 별도 락을 두지 않습니다.
+    """
+
+    def __init__(self, settings: Settings):
+        self.service_limits: Dict[ServiceType, int] = {
+            service_type: settings.service_max_inflight(service_type.name) for service_type in ServiceType
+        }
+        self.user_limit = settings.max_inflight_per_user
+        self._service_inflight: Dict[ServiceType, int] = {service_type: 0 for service_type in ServiceType}
+        self._user_inflight: Dict[str, int] = {}
+
+        self.rejected: Dict[str, int] = {"service": 0, "user": 0}
+
+    def try_acquire(self, service_type: ServiceType, user_id: Optional[str]) -> Optional[str]:
+        """슬롯을 얻으면 None, 한도 초과면 거부한 한도 이름("service" / "user")"""
+        service_limit = self.service_limits[service_type]
+        if service_limit > 0 and self._service_inflight[service_type] >= service_limit:
+            self.rejected["service"] += 1
+            return "service"
+        if user_id is not None and self.user_limit > 0 and self._user_inflight.get(user_id, 0) >= self.user_limit:
+            self.rejected["user"] += 1
+            return "user"
+
+        self._service_inflight[service_type] += 1
+        if user_id is not None:
+            self._user_inflight[user_id] = self._user_inflight.get(user_id, 0) + 1
+        return None
+
+    def release(self, service_type: ServiceType, user_id: Optional[str]) -> None:
+        self._service_inflight[service_type] -= 1
+        if user_id is not None:
+            remaining = self._user_inflight.get(user_id, 1) - 1
+            if remaining > 0:
+                self._user_inflight[user_id] = remaining
+            else:
+                self._user_inflight.pop(user_id, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "in_flight": {st.value: count for st, count in self._service_inflight.items()},
+            "limits": {st.value: limit for st, limit in self.service_limits.items()},
+            "users_in_flight": len(self._user_inflight),
+            "user_limit": self.user_limit,
+            "rejected": dict(self.rejected),
+        }
@@ -0,0 +1,174 @@
+import math
+import time
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Any, Tuple
+
+from redis.exceptions import RedisError
+
+logger = logging.getLogger("gateway_api")
+
+# Redis 오류 후 다시 시도하기까지 대기 시간(초)
+REDIS_RETRY_INTERVAL = 5.0
+
+# 여러 버킷을 한 번에 검사하고, 모두 허용될 때만 토큰을 하나씩 차감 (원자적)
+# KEYS[i] = 버킷 키, ARGV[2i-1] = 초당 충전 토큰, ARGV[2i] = 버킷 크기
+# 반환: {허용 여부(1/0), 다시 시도까지 대기 ms, 가장 오래 기다려야 하는 버킷 번호}
+TOKEN_BUCKET_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local tokens = {}
+local wait = 0
+local worst = 0
+for i = 1, #KEYS do
+    local rate = tonumber(ARGV[2 * i - 1])
+    local burst = tonumber(ARGV[2 * i])
+    local bucket = redis.call('HMGET', KEYS[i], 't', 'ts')
+    local t = tonumber(bucket[1]) or burst
+    local ts = tonumber(bucket[2]) or now
+    t = math.min(burst, t + math.max(0, now - ts) * rate / 1000)
+    tokens[i] = t
+    if t < 1 then
+        local w = math.ceil((1 - t) * 1000 / rate)
+        if w > wait then
+            wait = w
+            worst = i
+        end
+    end
+end
+for i = 1, #KEYS do
+    local rate = tonumber(ARGV[2 * i - 1])
+    local burst = tonumber(ARGV[2 * i])
+    local t = tokens[i]
+    if wait == 0 then
+        t = t - 1
+    end
+    redis.call('HSET', KEYS[i], 't', tostring(t), 'ts', now)
+    redis.call('PEXPIRE', KEYS[i], math.ceil(burst * 1000 / rate) + 1000)
+end
+if wait == 0 then
+    return {1, 0, 0}
+end
+return {0, wait, worst}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """토큰 버킷 한도 (초당 rate개 충전, 최대 burst개)"""
+    rate: float
+    burst: float
+
+    @classmethod
+    def parse(cls, raw: Optional[str]) -> Optional["RateLimitRule"]:
+        """"20:40" → RateLimitRule(20, 40), 비어 있거나 0이면 None"""
+        if not raw:
+            return None
+        rate, _, burst = raw.partition(":")
+        rate = float(rate)
+        burst = float(burst) if burst else rate
+        if rate <= 0 or burst <= 0:
+            return None
+        return cls(rate, max(burst, 1.0))
+
+
+class LocalTokenBuckets:
+    """Redis가 없을 때 쓰는 프로세스 내 토큰 버킷 (오래 안 쓴 버킷부터 제거)"""
+
+    def __init__(self, max_buckets: int):
+        self.max_buckets = max_buckets
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def acquire(self, checks: List[Tuple[str, RateLimitRule]]) -> Tuple[float, int]:
+        """모두 허용되면 (0, -1), 아니면 (다시 시도까지 대기 시간(초), 거부한 버킷 번호)"""
+        now = time.monotonic()
+        states = []
+        wait = 0.0
+        worst = -1
+        for index, (key, rule) in enumerate(checks):
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                tokens = rule.burst
+            else:
+                tokens = min(rule.burst, bucket[0] + (now - bucket[1]) * rule.rate)
+            states.append(tokens)
+            if tokens < 1 and (1 - tokens) / rule.rate > wait:
+                wait = (1 - tokens) / rule.rate
+                worst = index
+
+        for (key, rule), tokens in zip(checks, states):
+            self._buckets[key] = [tokens - 1 if wait == 0 else tokens, now]
+            self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_buckets:
+            self._buckets.popitem(last=False)
+        return wait, worst
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class RateLimiter:
+    """IP / 사용자 / ServiceType별 토큰 버킷 rate limiter
+
+    Redis가 있으면 Lua 스크립트 한 번으로 요청에 해당하는 모든 버킷을 원자적으로 검사하므로
+    여러 gateway 인스턴스가 같은 한도를 공유합니다. Redis가 없거나 장애 시 인스턴스별 인메모리 버킷으로 동작합니다.
+    """
+
+    KEY_PREFIX = "gw:rl:"
+
+    def __init__(self, local_max_buckets: int = 100000):
+        self.redis = None
+        self._script = None
+        self._redis_retry_at = 0.0
+        self.local = LocalTokenBuckets(local_max_buckets)
+
+        self.allowed = 0
+        self.rejected: Dict[str, int] = {}
+
+    def attach_redis(self, redis_client) -> None:
+        """lifespan에서 만든 Redis 클라이언트 연결 (None이면 인메모리만 사용)"""
+        self.redis = redis_client
+        self._script = redis_client.register_script(TOKEN_BUCKET_SCRIPT) if redis_client is not None else None
+
+    def _redis_available(self) -> bool:
+        return self._script is not None and time.monotonic() >= self._redis_retry_at
+
+    async def acquire(self, checks: List[Tuple[str, str, RateLimitRule]]) -> Tuple[float, Optional[str]]:
+        """checks: (한도 이름, 버킷 키, 규칙) 목록. (대기 시간(초), 거부한 한도 이름) 반환, 허용이면 (0, None)"""
+        if not checks:
+            return 0.0, None
+
+        wait, worst = None, -1
+        if self._redis_available():
+            keys = [self.KEY_PREFIX + key for _, key, _ in checks]
+            args = []
+            for _, _, rule in checks:
+                args.extend([rule.rate, rule.burst])
+            try:
+                allowed, wait_ms, index = await self._script(keys=keys, args=args)
+                wait, worst = (0.0, -1) if allowed else (int(wait_ms) / 1000, int(index) - 1)
+            except (RedisError, OSError) as e:
+                self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+                logger.warning(f"⚠️ Redis rate limit 실패, {REDIS_RETRY_INTERVAL}초 동안 인메모리 버킷 사용: {str(e)}")
+        if wait is None:
+            wait, worst = self.local.acquire([(key, rule) for _, key, rule in checks])
+
+        if wait <= 0:
+            self.allowed += 1
+            return 0.0, None
+        limit_name = checks[worst][0]
+        self.rejected[limit_name] = self.rejected.get(limit_name, 0) + 1
+        return max(wait, 0.001), limit_name
+
+    @staticmethod
+    def retry_after_header(wait: float) -> str:
+        return str(max(1, math.ceil(wait)))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "backend": "redis" if self._redis_available() else "local",
+            "allowed": self.allowed,
+            "rejected": dict(self.rejected),
+            "local_buckets": len(self.local),
+        }
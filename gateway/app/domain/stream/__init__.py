@@ -0,0 +1 @@
+# Stream package
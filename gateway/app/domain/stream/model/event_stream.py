@@ -0,0 +1,91 @@
+import time
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+
+from app.common.metrics import REGISTRY
+from app.domain.discovery.model.service_type import ServiceType
+
+logger = logging.getLogger("gateway_api")
+
+EVENT_STREAM_TYPE = "text/event-stream"
+
+SSE_STREAMS = REGISTRY.counter(
+    "gateway_sse_streams_total",
+    "중계를 마친 SSE 스트림 수 (completed / client_disconnect / upstream_error)",
+    ("service", "result"),
+)
+SSE_STREAMS_ACTIVE = REGISTRY.gauge(
+    "gateway_sse_streams_active",
+    "중계 중인 SSE 스트림 수",
+    ("service",),
+)
+SSE_FIRST_EVENT = REGISTRY.histogram(
+    "gateway_sse_first_event_seconds",
+    "gateway가 요청을 받은 뒤 첫 SSE 청크를 클라이언트로 보내기까지 걸린 시간",
+    ("service",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+SSE_DURATION = REGISTRY.histogram(
+    "gateway_sse_stream_duration_seconds",
+    "SSE 스트림 전체 중계 시간",
+    ("service", "result"),
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+)
+
+
+def accepts_event_stream(accept: str) -> bool:
+    """클라이언트가 SSE를 요청했는지 (캐시/single-flight 대상에서 제외)"""
+    return EVENT_STREAM_TYPE in accept
+
+
+def is_event_stream(response: httpx.Response) -> bool:
+    return response.headers.get("content-type", "").startswith(EVENT_STREAM_TYPE)
+
+
+class EventStreamRelay:
+    """업스트림 SSE 응답을 받는 즉시 클라이언트로 흘려보내는 async iterator
+
+    aiter_raw()로 업스트림 청크를 그대로(파싱/버퍼링 없이) 넘기므로 토큰 하나하나가 도착하는 대로 전달됩니다.
+    클라이언트가 끊으면 StreamingResponse가 이 iterator를 취소하고, BackgroundTask(response.aclose)가
+    업스트림 연결을 닫아 서비스 쪽 생성도 중단됩니다 (끝까지 읽지 않은 연결은 풀에 반환하지 않음).
+    """
+
+    def __init__(self, response: httpx.Response, service: ServiceType, received_at: Optional[float] = None):
+        self.response = response
+        self.service = service
+        # 첫 이벤트 지연은 gateway가 요청을 받은 시점부터 측정 (없으면 중계 시작 시점)
+        self.received_at = received_at
+        self.bytes_sent = 0
+
+    async def __aiter__(self):
+        service = self.service.value
+        started = time.perf_counter()
+        received_at = self.received_at if self.received_at is not None else started
+        first = True
+        result = "upstream_error"
+        SSE_STREAMS_ACTIVE.inc((service,))
+        try:
+            async for chunk in self.response.aiter_raw():
+                if first:
+                    first = False
+                    SSE_FIRST_EVENT.observe((service,), time.perf_counter() - received_at)
+                self.bytes_sent += len(chunk)
+                yield chunk
+            result = "completed"
+        except (asyncio.CancelledError, GeneratorExit):
+            result = "client_disconnect"
+            raise
+        except httpx.HTTPError as e:
+            # 이미 200과 헤더를 보낸 뒤이므로 상태 코드를 바꿀 수 없음 → 스트림을 끊어 클라이언트가 재연결하도록
+            logger.warning(f"❌ {service} SSE 업스트림 오류로 스트림 종료: {str(e)}")
+            raise
+        finally:
+            SSE_STREAMS_ACTIVE.dec((service,))
+            elapsed = time.perf_counter() - started
+            SSE_STREAMS.inc((service, result))
+            SSE_DURATION.observe((service, result), elapsed)
+            if result == "client_disconnect":
+                logger.info("🔌 %s SSE 클라이언트 연결 끊김 - 업스트림 스트림 취소 (%.2fs, %d bytes)", service, elapsed, self.bytes_sent)
@@ -0,0 +1 @@
+# Model package
@@ -0,0 +1,78 @@
+import time
+import logging
+from typing import AsyncIterator, Optional
+
+from app.common.metrics import REGISTRY
+from app.domain.discovery.model.service_type import ServiceType
+
+logger = logging.getLogger("gateway_api")
+
+UPLOAD_BYTES = REGISTRY.counter(
+    "gateway_upload_bytes_total",
+    "업스트림으로 전달한 요청 본문 바이트 수",
+    ("service",),
+)
+UPLOAD_DURATION = REGISTRY.histogram(
+    "gateway_upload_duration_seconds",
+    "요청 본문(업로드) 전달에 걸린 시간 (첫 청크 수신 ~ 마지막 청크 전달)",
+    ("service", "result"),
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+UPLOADS_IN_PROGRESS = REGISTRY.gauge(
+    "gateway_uploads_in_progress",
+    "본문을 전달 중인 요청 수",
+    ("service",),
+)
+
+# 이 크기 이상인 업로드만 완료 시 처리량을 INFO로 기록
+LOG_MIN_BYTES = 1024 * 1024
+
+
+class BodySizeLimitExceeded(Exception):
+    """요청 본문이 서비스별 최대 크기를 넘음"""
+
+    def __init__(self, limit: int):
+        super().__init__(f"request body exceeds {limit} bytes")
+        self.limit = limit
+
+
+class MeteredUploadStream:
+    """클라이언트 요청 본문을 청크 단위로 업스트림에 흘려보내면서 크기 제한/진행 상황을 기록
+
+    본문을 메모리에 모으지 않으므로 업로드 크기와 관계없이 gateway 메모리는 청크 하나 수준입니다.
+    누적 바이트가 limit을 넘는 순간 BodySizeLimitExceeded로 전송을 중단합니다
+    (Content-Length로 미리 알 수 있는 경우는 proxy에서 업스트림 호출 전에 413).
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], service: ServiceType, limit: Optional[int]):
+        self.chunks = chunks
+        self.service = service
+        self.limit = limit
+        self.received = 0
+
+    async def __aiter__(self):
+        service = self.service.value
+        started = None
+        result = "error"
+        UPLOADS_IN_PROGRESS.inc((service,))
+        try:
+            async for chunk in self.chunks:
+                if started is None:
+                    started = time.perf_counter()
+                self.received += len(chunk)
+                if self.limit is not None and self.received > self.limit:
+                    result = "too_large"
+                    raise BodySizeLimitExceeded(self.limit)
+                UPLOAD_BYTES.inc((service,), len(chunk))
+                yield chunk
+            result = "ok"
+        finally:
+            UPLOADS_IN_PROGRESS.dec((service,))
+            elapsed = time.perf_counter() - started if started is not None else 0.0
+            UPLOAD_DURATION.observe((service, result), elapsed)
+            if self.received >= LOG_MIN_BYTES:
+                logger.info(
+                    "📤 %s 업로드 전달 %s: %.1fMB, %.2fs (%.1fMB/s)",
+                    service, result, self.received / 1048576, elapsed,
+                    self.received / 1048576 / elapsed if elapsed > 0 else 0.0,
+                )
@@ -1,9 +1,10 @@
 # app/main.py
 
 import os
-import sys
+import time
 import logging
-from fastapi import FastAPI
+import httpx
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
@@ -11,31 +12,135 @@ from contextlib import asynccontextmanager
 from app.www.jwt_auth_middleware import AuthMiddleware
 from app.common.utility.constant.settings import Settings
 from app.www.request_loggin import RequestLoggingMiddleware
-from fastapi import APIRouter, Request, HTTPException, UploadFile, File, Query, Form, Depends
+from app.www.rate_limit_middleware import RateLimitMiddleware, RateLimitRules
+from app.www.compression_middleware import CompressionMiddleware
+from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
-from typing import Optional, List
 from app.domain.discovery.model.service_discovery import ServiceDiscovery
 from app.domain.discovery.model.service_type import ServiceType
+from app.domain.discovery.model.upstream_pool import UpstreamClientPool
+from app.domain.discovery.model.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.domain.discovery.model.retry_policy import RetryBudget, RetryPolicy
+from app.domain.discovery.model.service_registry import ServiceRegistry
+from app.domain.discovery.model.single_flight import SingleFlight, UnsharedResponse
+from app.domain.auth.model.jwt_key_set import JwtKeySet
+from app.domain.auth.model.token_verifier import TokenVerifier
+from app.domain.auth.model.admin_access import has_dot_segment, is_admin_path, is_admin_request, require_admin
+from app.domain.ratelimit.model.rate_limiter import RateLimiter
+from app.domain.ratelimit.model.concurrency_limiter import ConcurrencyLimiter
+from app.domain.cache.model.cached_response import CachedResponse
+from app.domain.cache.model.response_cache import ResponseCache
+from app.domain.upload.model.upload_stream import MeteredUploadStream, BodySizeLimitExceeded
+from app.domain.stream.model.event_stream import EventStreamRelay, accepts_event_stream, is_event_stream
+from app.common.database.redis_client import create_redis_client
+from app.common.async_logging import setup_logging, route_logger, create_log_level_router
+from app.common.metrics import REGISTRY, MetricsMiddleware, create_metrics_router
+from app.common.tracing import setup_tracing, tracer, TracingMiddleware
+from app.router.admin_router import admin_router
+from app.router.batch_router import batch_router
 from app.common.utility.factory.response_factory import ResponseFactory
 
 # 로컬 환경에서만 .env 로드
 if os.getenv("RAILWAY_ENVIRONMENT") != "true":
     load_dotenv()
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
+# 로깅 설정 (QueueHandler + 백그라운드 리스너, JSON lines)
+setup_logging("gateway")
+# 분산 추적 (TRACE_EXPORTER=none이면 꺼짐, 클라이언트의 traceparent는 그대로 전달)
+setup_tracing("gateway")
 logger = logging.getLogger("gateway_api")
 
+# 환경 설정 (미들웨어 구성과 lifespan에서 함께 사용)
+settings = Settings()
+
+# JWT 검증 키와 검증기 (키 갱신 태스크는 lifespan에서 시작)
+jwt_key_set = JwtKeySet(settings)
+token_verifier = TokenVerifier(settings, jwt_key_set)
+
+# 요청 수 제한(Redis는 lifespan에서 연결)과 진행 중 요청 수 상한
+rate_limiter = RateLimiter(settings.rate_limit_local_max_buckets)
+rate_limit_rules = RateLimitRules(settings)
+concurrency_limiter = ConcurrencyLimiter(settings)
+
+def build_route_table(settings: Settings, upstream_pool: UpstreamClientPool, registry: ServiceRegistry) -> dict:
+    """ServiceType별 ServiceDiscovery(커넥션 풀 + 서킷 브레이커 + 재시도 정책) 생성"""
+    route_table = {}
+    for service_type in ServiceType:
+        route_table[service_type] = ServiceDiscovery(
+            service_type=service_type,
+            client=upstream_pool.get(service_type),
+            registry=registry,
+            circuit_breaker=CircuitBreaker(
+                service_type.value,
+                failure_threshold=settings.circuit_failure_threshold,
+                recovery_timeout=settings.circuit_recovery_timeout,
+                half_open_max_calls=settings.circuit_half_open_max_calls,
+            ),
+            retry_policy=RetryPolicy(
+                RetryBudget(
+                    ratio=settings.retry_budget_ratio,
+                    min_retries_per_second=settings.retry_budget_min_per_second,
+                    ttl=settings.retry_budget_ttl,
+                ),
+                max_attempts=settings.retry_max_attempts,
+                backoff_base=settings.retry_backoff_base,
+                backoff_max=settings.retry_backoff_max,
+            ),
+        )
+    return route_table
+
 # 앱 생명주기 이벤트
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("🚀 Gateway API 서비스 시작")
-    app.state.settings = Settings()
+    app.state.settings = settings
+    app.state.token_verifier = token_verifier
+    await jwt_key_set.start()
+    # 업스트림 서비스별 커넥션 풀과 ServiceDiscovery 라우트 테이블은 앱 수명 동안 한 번만 생성
+    upstream_pool = UpstreamClientPool(settings)
+    app.state.upstream_pool = upstream_pool
+    # 서비스 인스턴스 레지스트리도 시작 시 한 번 구성하고 백그라운드 헬스 체크 시작
+    registry = ServiceRegistry(settings)
+    app.state.service_registry = registry
+    await registry.start()
+    app.state.route_table = build_route_table(settings, upstream_pool, registry)
+    # /metrics 조회 시 읽는 커넥션 풀/업스트림 진행 중 요청 게이지
+    REGISTRY.gauge_callback(
+        "gateway_upstream_pool_connections",
+        "업스트림 커넥션 풀 연결 수 (active/idle) 및 연결 대기 중인 요청 수 (queued)",
+        ("service", "state"),
+        upstream_pool.usage,
+    )
+    REGISTRY.gauge_callback(
+        "gateway_upstream_in_flight",
+        "업스트림 인스턴스별 응답 대기/스트리밍 중인 요청 수",
+        ("service", "instance"),
+        lambda: (
+            ((service_type.value, instance.url), instance.outstanding)
+            for service_type in ServiceType
+            for instance in registry.instances(service_type)
+        ),
+    )
+    # Redis 클라이언트와 GET 응답 캐시 (CACHE_TTL_{SERVICE}로 서비스별 opt-in)
+    redis_client = create_redis_client(settings)
+    app.state.redis = redis_client
+    app.state.response_cache = ResponseCache(settings, redis_client)
+    # rate limit 버킷도 같은 Redis를 사용해 gateway 인스턴스 간 공유
+    rate_limiter.attach_redis(redis_client)
+    app.state.rate_limiter = rate_limiter
+    app.state.rate_limit_rules = rate_limit_rules
+    app.state.concurrency_limiter = concurrency_limiter
+    # 동일한 동시 GET을 하나의 업스트림 요청으로 합치는 single-flight 그룹
+    app.state.single_flight = SingleFlight(
+        key_headers=settings.single_flight_key_headers,
+        max_body_bytes=settings.single_flight_max_body_bytes,
+    )
     yield
+    await jwt_key_set.stop()
+    await registry.stop()
+    await upstream_pool.aclose()
+    if redis_client is not None:
+        await redis_client.aclose()
     logger.info("🛑 Gateway API 서비스 종료")
 
 # FastAPI 인스턴스 생성
@@ -47,7 +152,49 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS 설정
+# 미들웨어 등록 (나중에 등록한 것이 바깥쪽: CORS → 압축 → 추적 → 메트릭 → 요청 로깅 → 인증 → rate limit)
+# rate limit은 인증 안쪽에서 실행되어 x-user-id로 사용자별 한도를 적용
+app.add_middleware(
+    RateLimitMiddleware,
+    settings=settings,
+    rate_limiter=rate_limiter,
+    concurrency_limiter=concurrency_limiter,
+    rules=rate_limit_rules,
+)
+app.add_middleware(
+    AuthMiddleware,
+    verifier=token_verifier,
+    public_paths=settings.jwt_public_paths,
+    cookie_name=settings.jwt_cookie_name,
+    admin_token=settings.admin_token,
+)
+# 본문은 버퍼링하지 않고 흘려보내며, 샘플링된 요청만 앞부분을 기록
+app.add_middleware(
+    RequestLoggingMiddleware,
+    body_sample_rate=settings.request_log_body_sample_rate,
+    max_body_bytes=settings.request_log_body_max_bytes,
+)
+
+# 요청 수/지연 히스토그램 (rate limit·인증에서 끝난 요청도 포함, 프록시 라우트는 서비스별로 구분)
+app.add_middleware(
+    MetricsMiddleware,
+    expand_path_params={"service": [service_type.value for service_type in ServiceType]},
+)
+
+# 요청마다 server span 생성 (traceparent 이어받기), 안쪽 미들웨어/업스트림 span의 부모
+app.add_middleware(TracingMiddleware, tracer=tracer)
+
+# 응답 압축 (본문을 다루는 다른 미들웨어보다 바깥쪽, 요청 로깅의 out 바이트는 압축 전 크기)
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+        brotli_enabled=settings.compression_brotli_enabled,
+    )
+
+# CORS 설정 (가장 바깥쪽에 두어 401/429 응답에도 CORS 헤더가 붙도록)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -62,101 +209,219 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 미들웨어 등록
-app.add_middleware(AuthMiddleware)
-app.add_middleware(RequestLoggingMiddleware, log_body=True)
-
 # Gateway 라우터 정의
 gateway_router = APIRouter(tags=["Gateway API"])
 
-@gateway_router.post("/{service}/{path:path}")
-async def proxy_post(...):
-    logger.info("🔥🔥🔥🔥 POST 프록시 진입함!")
-    ...
+def get_service_discovery(request: Request, service: ServiceType) -> ServiceDiscovery:
+    """lifespan에서 만든 서비스별 ServiceDiscovery 반환"""
+    return request.app.state.route_table[service]
 
-# 프록시 라우터 추가
-@gateway_router.get("/{service}/{path:path}", summary="GET 프록시")
-async def proxy_get(service: ServiceType, path: str, request: Request):
+# 요청 데이터 로깅을 지원하는 라우트 (해당 라우트 로거가 DEBUG일 때만 본문을 읽어 파싱)
+# 예: LOG_LEVELS=gateway_api.route.auth.login=DEBUG 또는 PUT /admin/log-levels
+JSON_INSPECT_ROUTES = {
+    (ServiceType.AUTH, "login"),
+    (ServiceType.AUTH, "signup"),
+}
+
+def payload_logger(service: ServiceType, path: str) -> logging.Logger:
+    return route_logger("gateway_api", service.value, path)
+
+def log_json_payload(payload_log: logging.Logger, path: str, body: bytes) -> None:
+    """JSON_INSPECT_ROUTES 라우트의 요청 데이터를 구분하여 DEBUG 로깅 (비밀번호는 마스킹)"""
+    if not body:
+        return
+    import json
     try:
-        factory = ServiceDiscovery(service_type=service)
-        headers = dict(request.headers)
-        
-        response = await factory.request(
-            method="GET",
-            path=path,
-            headers=headers
-        )
-        return ResponseFactory.create_response(response)
-    except Exception as e:
-        logger.error(f"Error in GET proxy: {str(e)}")
-        return JSONResponse(
-            content={"detail": f"Error processing request: {str(e)}"},
-            status_code=500
-        )
+        data = json.loads(body)
+    except Exception as parse_error:
+        payload_log.warning("⚠️ JSON 파싱 실패: %s", parse_error)
+        return
+
+    masked = dict(data)
+    for secret_field in ("password", "auth_pw"):
+        if masked.get(secret_field):
+            masked[secret_field] = "*" * len(str(masked[secret_field]))
 
-@gateway_router.post("/{service}/{path:path}", summary="POST 프록시")
-async def proxy_post(
-    service: ServiceType, 
+    # 로그인/회원가입 데이터 구분하여 로깅
+    if path == "login":
+        payload_log.debug("🔐 로그인 요청 데이터", extra={"payload": masked})
+    elif path == "signup":
+        payload_log.debug("📝 회원가입 요청 데이터", extra={"payload": masked})
+    else:
+        payload_log.debug("📦 기타 POST 데이터", extra={"payload": masked})
+
+# 프록시가 전달하는 HTTP 메서드 (하나의 핸들러로 처리)
+PROXY_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]
+
+def has_request_body(request: Request) -> bool:
+    """본문이 있는 요청인지 헤더로만 판단 (본문을 읽지 않음)"""
+    headers = request.headers
+    return "transfer-encoding" in headers or headers.get("content-length", "0") != "0"
+
+def is_coalescible_get(request: Request) -> bool:
+    """single-flight로 합칠 수 있는 GET인지 (본문 없음, 이벤트 스트림 아님)"""
+    return (
+        request.app.state.settings.single_flight_enabled
+        and request.method == "GET"
+        and not has_request_body(request)
+        and not accepts_event_stream(request.headers.get("accept", ""))
+    )
+
+async def fetch_coalesced_get(
+    request: Request,
+    service: ServiceType,
     path: str,
+    factory: ServiceDiscovery,
+    headers: list,
+):
+    """동일한 동시 GET을 하나의 업스트림 요청으로 합쳐 CachedResponse 반환
+
+    공유할 수 없는 응답(큰 본문, 이벤트 스트림)이면 스트리밍 httpx.Response를 반환합니다.
+    """
+    single_flight: SingleFlight = request.app.state.single_flight
+    query = request.url.query
+
+    async def fetch():
+        response = await factory.stream(method="GET", path=path, headers=headers, query=query)
+        if single_flight.shareable(response):
+            return await CachedResponse.from_upstream(response)
+        return UnsharedResponse(response)
+
+    key = single_flight.key("GET", service.value, path, query, request.headers)
+    result, shared = await single_flight.do(key, fetch)
+    if shared:
+        logger.info("🤝 %s/%s 진행 중인 동일 GET 결과 공유", service.value, path)
+    if isinstance(result, UnsharedResponse):
+        # 첫 요청만 업스트림 응답을 그대로 중계하고 나머지는 각자 요청
+        return result.claim() or await factory.stream(method="GET", path=path, headers=headers, query=query)
+    return result
+
+async def proxy_cached_get(
     request: Request,
-    file: Optional[UploadFile] = None,
-    sheet_names: Optional[List[str]] = Query(None, alias="sheet_name")
+    service: ServiceType,
+    path: str,
+    factory: ServiceDiscovery,
+    headers: list,
 ):
+    """캐시 대상 서비스의 GET: 캐시 조회 → (스탬피드 락) → 업스트림 → 저장, ETag/304 처리"""
+    cache: ResponseCache = request.app.state.response_cache
+    query = request.url.query
+    if_none_match = request.headers.get("if-none-match")
+    # 클라이언트가 no-cache를 요청하면 캐시를 읽지 않고 새로 채움
+    bypass = "no-cache" in request.headers.get("cache-control", "").lower()
+
+    entry, key = await cache.lookup(service, path, query, request.headers)
+    if entry is not None and not bypass:
+        return ResponseFactory.create_cached_response(entry, if_none_match, "HIT")
+
+    owns_lock = await cache.acquire_fill_lock(key)
+    if not owns_lock and not bypass:
+        entry = await cache.wait_for_fill(service, path, query, request.headers, key)
+        if entry is not None:
+            return ResponseFactory.create_cached_response(entry, if_none_match, "HIT")
+
     try:
-        logger.info(f"🌈gateway.main.py🌈 POST 요청 받음: 서비스={service}, 경로={path}")
-        logger.info(f"🔗 요청 URL: {request.url}")
-        logger.info(f"📋 요청 헤더: {dict(request.headers)}")
+        if is_coalescible_get(request):
+            entry = await fetch_coalesced_get(request, service, path, factory, headers)
+        else:
+            response = await factory.stream(method="GET", path=path, headers=headers, query=query)
+            entry = await CachedResponse.from_upstream(response)
+        if isinstance(entry, httpx.Response):
+            # 공유/캐시할 수 없는 큰 응답은 그대로 스트리밍
+            return ResponseFactory.create_streaming_response(entry)
+        await cache.store(service, path, query, request.headers, entry)
+    finally:
+        if owns_lock:
+            await cache.release_fill_lock(key)
+    return ResponseFactory.create_cached_response(entry, if_none_match, "MISS")
+
+def payload_too_large(limit: int) -> JSONResponse:
+    return JSONResponse(
+        content={"detail": f"Request body too large (max {limit} bytes)"},
+        status_code=413,
+        headers={"Connection": "close"},
+    )
+
+# 프록시 라우터 추가
+@gateway_router.api_route("/{service}/{path:path}", methods=PROXY_METHODS, summary="서비스 프록시")
+async def proxy(service: ServiceType, path: str, request: Request):
+    """경로, 쿼리스트링, 헤더, 본문을 변경 없이 대상 서비스로 전달"""
+    method = request.method
+    received_at = time.perf_counter()
+    if has_dot_segment(path):
+        # ./.. 세그먼트는 업스트림에서 다른 경로(예: /x/../admin → /admin)가 되므로 검사 전에 거부
+        return JSONResponse(content={"detail": "Invalid path"}, status_code=400)
+    if is_admin_path(path) and not is_admin_request(request):
+        # 서비스의 관리 API(/admin/log-levels 등)도 게이트웨이 관리 API와 같은 조건으로만 전달
+        logger.warning("🔒 %s/%s 관리 API 접근 거부", service.value, path)
+        return JSONResponse(content={"detail": "Admin access required"}, status_code=403)
+    try:
+        logger.info("🌈gateway.main.py🌈 %s 요청 받음: 서비스=%s, 경로=%s", method, service.value, path)
+        
+        # 서비스별 ServiceDiscovery는 lifespan에서 미리 만든 라우트 테이블에서 dict 조회 한 번으로 찾음
+        factory = get_service_discovery(request, service)
+        
+        # 원본 바이트를 그대로 전달하므로 Content-Length도 그대로 유지
+        with tracer.span("proxy.forward_headers"):
+            headers = factory.forward_headers(request.headers.items())
         
-        factory = ServiceDiscovery(service_type=service)
+        # SSE 요청은 캐시/single-flight를 거치지 않음 (응답 전체를 모으면 실시간 전달이 깨짐)
+        event_stream_requested = accepts_event_stream(request.headers.get("accept", ""))
+        if method == "GET" and not event_stream_requested and request.app.state.response_cache.enabled_for(service):
+            return await proxy_cached_get(request, service, path, factory, headers)
         
-        # 헤더에서 Content-Length 제거 (httpx가 자동으로 계산)
-        headers = dict(request.headers)
-        headers.pop('content-length', None)
+        if is_coalescible_get(request):
+            result = await fetch_coalesced_get(request, service, path, factory, headers)
+            if isinstance(result, CachedResponse):
+                return ResponseFactory.create_buffered_response(result)
+            return ResponseFactory.create_streaming_response(result)
         
-        # 요청 본문을 한 번만 읽기
-        body = await request.body()
-        data = None
-        if body:
-            try:
-                import json
-                data = json.loads(body)
-                
-                # 로그인/회원가입 데이터 구분하여 로깅
-                if path == "login":
-                    logger.info("🔐 === 로그인 요청 데이터 ===")
-                    logger.info(f"👤 사용자명: {data.get('username', 'N/A')}")
-                    logger.info(f"🔑 비밀번호: {'*' * len(data.get('password', '')) if data.get('password') else 'N/A'}")
-                    logger.info(f"📦 전체 로그인 데이터: {json.dumps(data, ensure_ascii=False, indent=2)}")
-                elif path == "signup":
-                    logger.info("📝 === 회원가입 요청 데이터 ===")
-                    logger.info(f"🏭 업종: {data.get('industry', 'N/A')}")
-                    logger.info(f"📧 이메일: {data.get('email', 'N/A')}")
-                    logger.info(f"👤 이름: {data.get('name', 'N/A')}")
-                    logger.info(f"🎂 나이: {data.get('age', 'N/A')}")
-                    logger.info(f"🆔 아이디: {data.get('auth_id', 'N/A')}")
-                    logger.info(f"🔑 비밀번호: {'*' * len(data.get('auth_pw', '')) if data.get('auth_pw') else 'N/A'}")
-                    logger.info(f"📦 전체 회원가입 데이터: {json.dumps(data, ensure_ascii=False, indent=2)}")
-                else:
-                    logger.info(f"📦 기타 POST 데이터: {json.dumps(data, ensure_ascii=False, indent=2)}")
-                    
-            except Exception as parse_error:
-                logger.warning(f"⚠️ JSON 파싱 실패: {parse_error}")
-                logger.warning(f"⚠️ 원본 데이터: {body}")
-                pass
+        content = None
+        if (
+            method == "POST"
+            and (service, path.strip("/")) in JSON_INSPECT_ROUTES
+            and payload_logger(service, path.strip("/")).isEnabledFor(logging.DEBUG)
+        ):
+            # 라우트 DEBUG가 켜진 경우만 본문을 읽어 파싱 (전송은 원본 바이트 그대로)
+            content = await request.body()
+            log_json_payload(payload_logger(service, path.strip("/")), path, content)
+        elif has_request_body(request):
+            # 본문을 메모리에 모으지 않고 청크 단위로 업스트림에 흘려보냄 (멀티파트 업로드 포함)
+            limit = settings.service_upload_max_bytes(service.name) or None
+            content_length = request.headers.get("content-length", "")
+            if limit is not None and content_length.isdigit() and int(content_length) > limit:
+                return payload_too_large(limit)
+            content = MeteredUploadStream(request.stream(), service, limit)
         
-        logger.info(f"🚀 {service} 서비스로 요청 전송 중...")
-        response = await factory.request(
-            method="POST",
+        response = await factory.stream(
+            method=method,
             path=path,
             headers=headers,
-            data=data
+            content=content,
+            query=request.url.query
         )
+        with tracer.span("proxy.build_response", status_code=response.status_code):
+            if is_event_stream(response):
+                # 이벤트(토큰)를 받는 즉시 중계하고 클라이언트 연결 끊김을 업스트림 취소로 전파
+                return ResponseFactory.create_streaming_response(
+                    response, EventStreamRelay(response, service, received_at)
+                )
+            return ResponseFactory.create_streaming_response(response)
         
-        logger.info(f"✅ {service} 서비스 응답 수신 완료")
-        return ResponseFactory.create_response(response)
-        
+    except BodySizeLimitExceeded as e:
+        # Content-Length 없이(chunked) 보내다 한도를 넘은 경우, 업스트림 전송을 중단하고 413
+        logger.warning(f"📦 {service.value}/{path} 요청 본문 크기 초과 ({e.limit} bytes)")
+        return payload_too_large(e.limit)
+    except CircuitOpenError as e:
+        # 비정상 서비스는 업스트림을 기다리지 않고 즉시 503
+        logger.warning(f"⚡ {service.value} 서킷 open - 요청 차단")
+        return JSONResponse(
+            content={"detail": f"Service temporarily unavailable: {service.value}"},
+            status_code=503,
+            headers={"Retry-After": str(max(1, int(e.retry_after + 0.999)))}
+        )
     except Exception as e:
-        logger.error(f"❌ POST 요청 처리 중 오류 발생: {str(e)}")
+        logger.error(f"❌ {method} 프록시 처리 중 오류 발생: {str(e)}")
         return JSONResponse(
             content={"detail": f"Gateway error: {str(e)}"},
             status_code=500
@@ -174,7 +439,12 @@ async def root():
     logger.info(f"🌈gateway.main.py🌈")
     return {"message": "Gateway API", "version": "0.1.0"}
 
-# ✅ 라우터 등록
+# ✅ 라우터 등록 (관리 라우터는 /{service}/{path} 프록시보다 먼저 매칭되도록 앞에 등록)
+app.include_router(admin_router)
+app.include_router(batch_router)
+app.include_router(create_log_level_router(dependencies=[Depends(require_admin)]))
+# 업스트림 인스턴스 URL 등 내부 구성이 라벨에 포함되므로 관리자(또는 ADMIN_TOKEN을 보내는 수집기)만 조회
+app.include_router(create_metrics_router(dependencies=[Depends(require_admin)]))
 app.include_router(gateway_router)
 
 # 404 핸들러
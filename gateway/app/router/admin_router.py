@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, Request
+
+from app.common.tracing import tracer
+from app.domain.auth.model.admin_access import require_admin
+
+# 토폴로지/캐시/제한기 상태는 관리자만 조회 (X-Admin-Token 또는 JWT ADMIN_ROLE)
+admin_router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+@admin_router.get("/upstreams", summary="업스트림 서킷 브레이커/재시도 상태")
+async def upstream_status(request: Request):
+    """서비스별 서킷 상태와 재시도 예산 카운터 조회"""
+    route_table = request.app.state.route_table
+    return {
+        service_type.value: discovery.resilience_snapshot()
+        for service_type, discovery in route_table.items()
+    }
+
+@admin_router.get("/cache", summary="GET 응답 캐시 상태")
+async def cache_status(request: Request):
+    """서비스별 캐시 TTL과 히트/미스 카운터 조회"""
+    return request.app.state.response_cache.snapshot()
+
+@admin_router.get("/single-flight", summary="동일 GET 합치기(single-flight) 상태")
+async def single_flight_status(request: Request):
+    """진행 중인 호출 수와 합쳐진(collapsed) 요청 수 조회"""
+    return request.app.state.single_flight.snapshot()
+
+@admin_router.get("/auth", summary="JWT 검증 키/캐시 상태")
+async def auth_status(request: Request):
+    """로드된 키 ID와 검증/거부 횟수, 검증 캐시 히트율 조회"""
+    return request.app.state.token_verifier.snapshot()
+
+@admin_router.get("/tracing", summary="분산 추적 설정/내보낸 span 수")
+async def tracing_status(request: Request):
+    """exporter 종류, 샘플링 비율, 내보낸 span 수 조회"""
+    return tracer.snapshot()
+
+@admin_router.get("/rate-limits", summary="요청 수 제한/동시 요청 상한 상태")
+async def rate_limit_status(request: Request):
+    """허용/거부 횟수와 서비스별 진행 중 요청 수 조회"""
+    return {
+        "rate_limiter": request.app.state.rate_limiter.snapshot(),
+        "concurrency": request.app.state.concurrency_limiter.snapshot(),
+    }
@@ -0,0 +1,219 @@
+import json
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import unquote
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+from app.domain.discovery.model.service_type import ServiceType
+from app.domain.discovery.model.circuit_breaker import CircuitOpenError
+from app.domain.auth.model.admin_access import ADMIN_TOKEN_HEADER, is_admin_path, is_admin_request
+from app.www.rate_limit_middleware import is_login_route
+
+logger = logging.getLogger("gateway_api")
+
+batch_router = APIRouter(tags=["Batch"])
+
+BATCH_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE"}
+
+# 하위 요청에서 덮어쓸 수 없는 헤더 (AuthMiddleware가 넣은 사용자 정보, 본문 관련 헤더)
+PROTECTED_HEADER_PREFIXES = ("x-user-", "x-auth-")
+BODY_HEADERS = {"content-length", "content-type", "transfer-encoding", "content-encoding"}
+# 인증 정보를 담는 헤더는 항목별로 바꿀 수 없음 (x-user-id는 바깥 요청의 토큰에서 오므로 다른 자격 증명과 섞이면 안 됨)
+AUTH_HEADERS = {"authorization", "proxy-authorization", "cookie", ADMIN_TOKEN_HEADER}
+
+
+class BatchItem(BaseModel):
+    id: Optional[str] = Field(None, description="응답에서 결과를 구분할 ID (없으면 인덱스)")
+    service: ServiceType
+    method: str = "GET"
+    path: str = ""
+    query: Union[str, Dict[str, Any], None] = None
+    headers: Dict[str, str] = Field(default_factory=dict)
+    body: Any = Field(None, description="JSON 본문 (application/json으로 전달)")
+    timeout: Optional[float] = Field(None, gt=0, description="항목별 타임아웃(초), 최대 BATCH_MAX_ITEM_TIMEOUT")
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem]
+
+
+def _item_headers(request: Request, item: BatchItem, factory) -> list:
+    """바깥 요청 헤더(인증 정보 포함) + 항목 헤더, 본문 관련/사용자 정보 헤더는 항목에서 바꿀 수 없음"""
+    headers = [
+        (key, value) for key, value in factory.forward_headers(request.headers.items())
+        if key.lower() not in BODY_HEADERS and key.lower() != "accept-encoding"
+    ]
+    overrides = {
+        key.lower(): value for key, value in item.headers.items()
+        if not key.lower().startswith(PROTECTED_HEADER_PREFIXES) and key.lower() not in BODY_HEADERS
+    }
+    overrides = dict(factory.forward_headers(overrides.items()))
+    headers = [(key, value) for key, value in headers if key.lower() not in overrides]
+    headers.extend(overrides.items())
+    if item.body is not None:
+        headers.append(("content-type", "application/json"))
+    return headers
+
+
+def _normalize_path(raw: str) -> Tuple[Optional[str], str]:
+    """항목 경로 → (빈 세그먼트를 뺀 경로, 경로에 붙어 온 쿼리), "."/".." 세그먼트가 있으면 경로는 None
+
+    "login?x=1", "/login/", "%6Cogin" 같은 변형도 업스트림이 해석하는 경로 기준으로 검사하기 위함
+    """
+    path, _, inline_query = raw.partition("?")
+    path = path.partition("#")[0]
+    segments = [segment for segment in path.split("/") if segment]
+    if any(unquote(segment) in (".", "..") for segment in segments):
+        return None, inline_query
+    return "/".join(segments), inline_query
+
+
+def _decode_body(content_type: str, body: bytes) -> Any:
+    if not body:
+        return None
+    if "json" in content_type:
+        try:
+            return json.loads(body)
+        except ValueError:
+            pass
+    return body.decode("utf-8", errors="replace")
+
+
+async def _execute_item(request: Request, index: int, item: BatchItem) -> Dict[str, Any]:
+    """하위 요청 하나를 업스트림 풀로 보내고 결과를 dict로 반환 (예외는 항목 결과로 변환)"""
+    settings = request.app.state.settings
+    concurrency_limiter = request.app.state.concurrency_limiter
+    factory = request.app.state.route_table[item.service]
+    result: Dict[str, Any] = {"id": item.id if item.id is not None else str(index), "index": index}
+
+    method = item.method.upper()
+    if method not in BATCH_METHODS:
+        return dict(result, status=400, error=f"Unsupported method: {item.method}")
+    path, inline_query = _normalize_path(item.path)
+    if path is None:
+        return dict(result, status=400, error="Invalid path")
+    route_path = f"/{item.service.value}/{unquote(path)}"
+    if is_login_route(route_path):
+        # 로그인/회원가입은 IP별 한도를 받도록 배치로 묶을 수 없음
+        return dict(result, status=400, error="Route not allowed in batch")
+    if is_admin_path(path) and not is_admin_request(request):
+        return dict(result, status=403, error="Admin access required")
+    auth_overrides = sorted(key for key in item.headers if key.lower() in AUTH_HEADERS)
+    if auth_overrides:
+        return dict(result, status=400, error=f"Header not allowed in batch: {', '.join(auth_overrides)}")
+
+    query = item.query
+    params = None
+    if isinstance(query, dict):
+        params, query = query, inline_query
+    elif inline_query:
+        query = f"{inline_query}&{query}" if query else inline_query
+    content = json.dumps(item.body).encode("utf-8") if item.body is not None else None
+    timeout = min(item.timeout or settings.batch_item_timeout, settings.batch_max_item_timeout)
+    max_bytes = settings.batch_max_item_body_bytes
+
+    user_id = request.headers.get("x-user-id")
+    # 하위 요청마다 서비스/사용자 버킷을 차감 (바깥 /batch 요청은 IP/사용자 버킷만 한 번 차감됨)
+    rules = request.app.state.rate_limit_rules
+    if rules.enabled:
+        _, limit_name = await request.app.state.rate_limiter.acquire(rules.checks(None, user_id, item.service))
+        if limit_name is not None:
+            return dict(result, status=429, error=limit_name)
+    limit_name = concurrency_limiter.try_acquire(item.service, user_id)
+    if limit_name is not None:
+        return dict(result, status=429, error=f"inflight_{limit_name}")
+
+    async def fetch() -> Dict[str, Any]:
+        response = await factory.stream(
+            method=method,
+            path=path,
+            headers=_item_headers(request, item, factory),
+            content=content,
+            params=params,
+            query=query or "",
+        )
+        try:
+            chunks = []
+            size = 0
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if size > max_bytes:
+                    return dict(result, status=502, error="Upstream response too large")
+                chunks.append(chunk)
+        finally:
+            await response.aclose()
+        content_type = response.headers.get("content-type", "")
+        return dict(
+            result,
+            status=response.status_code,
+            content_type=content_type or None,
+            body=_decode_body(content_type, b"".join(chunks)),
+        )
+
+    try:
+        return await asyncio.wait_for(fetch(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning("⏱️ 배치 항목 타임아웃: %s /%s (%.1fs)", item.service.value, path, timeout)
+        return dict(result, status=504, error="Upstream timeout")
+    except CircuitOpenError:
+        return dict(result, status=503, error=f"Service temporarily unavailable: {item.service.value}")
+    except Exception as e:
+        logger.error(f"❌ 배치 항목 처리 중 오류 발생: {str(e)}")
+        return dict(result, status=502, error=f"Gateway error: {str(e)}")
+    finally:
+        concurrency_limiter.release(item.service, user_id)
+
+
+def _wants_ndjson(request: Request, stream: bool) -> bool:
+    return stream or "application/x-ndjson" in request.headers.get("accept", "")
+
+
+@batch_router.post("/batch", summary="여러 서비스 요청을 한 번에 실행")
+async def batch(payload: BatchRequest, request: Request, stream: bool = False):
+    """하위 요청을 BATCH_CONCURRENCY개씩 동시에 실행하고 결과를 한 응답으로 반환
+
+    - 기본: 모든 항목이 끝나면 요청 순서대로 {"results": [...]} 반환
+    - ?stream=true 또는 Accept: application/x-ndjson: 끝나는 순서대로 결과를 한 줄씩(NDJSON) 스트리밍
+    하위 요청의 실패/타임아웃은 해당 항목의 status로만 표시되고 전체 응답은 200입니다.
+    """
+    settings = request.app.state.settings
+    items = payload.requests
+    if not items:
+        return JSONResponse(status_code=400, content={"detail": "requests must not be empty"})
+    if len(items) > settings.batch_max_items:
+        return JSONResponse(
+            status_code=413,
+            content={"detail": f"Too many batch items (max {settings.batch_max_items})"},
+        )
+
+    semaphore = asyncio.Semaphore(max(1, settings.batch_concurrency))
+
+    async def run(index: int, item: BatchItem) -> Dict[str, Any]:
+        async with semaphore:
+            return await _execute_item(request, index, item)
+
+    logger.info("📦 배치 요청 %d건 실행 (동시 %d)", len(items), settings.batch_concurrency)
+    tasks = [asyncio.ensure_future(run(index, item)) for index, item in enumerate(items)]
+
+    if not _wants_ndjson(request, stream):
+        try:
+            return {"results": await asyncio.gather(*tasks)}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def ndjson():
+        try:
+            for completed in asyncio.as_completed(tasks):
+                result = await completed
+                yield json.dumps(result, ensure_ascii=False).encode("utf-8") + b"\n"
+        finally:
+            # 클라이언트가 끊으면 남은 하위 요청 취소
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
@@ -0,0 +1,184 @@
+import re
+import zlib
+import logging
+from typing import List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+logger = logging.getLogger("gateway_api")
+
+# 압축 효과가 있는 응답 타입 (이미지/압축 파일/바이너리는 제외)
+COMPRESSIBLE_TYPE_PATTERN = re.compile(
+    r"^(text/(?!event-stream)[\w.+-]+|application/([\w.+-]*\+)?(json|xml|javascript|graphql)|image/svg\+xml)\b",
+    re.IGNORECASE,
+)
+# 한 줄씩 흘려보내야 하는 스트리밍 응답 (압축기가 모아두면 실시간 전달이 깨짐)
+STREAMING_TYPES = ("text/event-stream", "application/x-ndjson")
+
+_ACCEPT_ENCODING_ITEM = re.compile(r"\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?\s*")
+
+
+def negotiate_encoding(accept_encoding: str, brotli_available: bool) -> Optional[str]:
+    """Accept-Encoding에서 사용할 압축 방식 선택 (br > gzip, q=0은 거부로 처리)"""
+    qualities = {}
+    for item in accept_encoding.split(","):
+        match = _ACCEPT_ENCODING_ITEM.fullmatch(item)
+        if not match:
+            continue
+        try:
+            qualities[match.group(1).lower()] = float(match.group(2)) if match.group(2) else 1.0
+        except ValueError:
+            continue
+    wildcard = qualities.get("*", 0.0)
+    candidates = (["br"] if brotli_available else []) + ["gzip"]
+    best, best_quality = None, 0.0
+    for encoding in candidates:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class _GzipStream:
+    def __init__(self, level: int):
+        # wbits=31: gzip 헤더/트레일러 포함
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliStream:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """클라이언트 Accept-Encoding에 맞춰 응답을 gzip/brotli로 스트리밍 압축 (pure ASGI)
+
+    - 업스트림이 이미 압축한 응답(content-encoding 있음)은 건드리지 않고 그대로 통과
+    - minimum_size보다 작은 응답, 압축 효과가 없는 타입, SSE/NDJSON 스트림, no-transform은 통과
+    - 본문 청크를 받는 대로 압축해 내보내므로 응답 전체를 메모리에 모으지 않습니다
+      (압축기 내부 버퍼는 zlib/brotli 윈도 크기로 제한)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        brotli_enabled: bool = True,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.brotli_available = brotli_enabled and brotli is not None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            return await self.app(scope, receive, send)
+        accept_encoding = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = negotiate_encoding(accept_encoding, self.brotli_available) if accept_encoding else None
+        if encoding is None:
+            return await self.app(scope, receive, send)
+
+        start_message: Optional[Message] = None
+        compressor = None
+        passthrough = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                passthrough = not self._should_compress(message)
+                if passthrough:
+                    await send(message)
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                return await send(message)
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    # 한 번에 끝나는 작은 응답은 압축하지 않음
+                    passthrough = True
+                    await send(start_message)
+                    return await send(message)
+                compressor = self._compressor(encoding)
+                await send(self._compressed_start(start_message, encoding))
+
+            chunk = compressor.compress(body) if body else b""
+            if not more_body:
+                chunk += compressor.finish()
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _should_compress(self, message: Message) -> bool:
+        status = message["status"]
+        if status < 200 or status in (204, 206, 304):
+            return False
+        content_type = ""
+        for name, value in message.get("headers", []):
+            name = name.lower()
+            if name == b"content-encoding":
+                # 업스트림이 이미 압축함 (identity 포함, 재압축하지 않음)
+                return False
+            if name == b"content-type":
+                content_type = value.decode("latin-1")
+            elif name == b"content-length":
+                if int(value) < self.minimum_size:
+                    return False
+            elif name == b"cache-control" and b"no-transform" in value.lower():
+                return False
+        if not content_type or any(streaming in content_type for streaming in STREAMING_TYPES):
+            return False
+        return COMPRESSIBLE_TYPE_PATTERN.match(content_type) is not None
+
+    def _compressor(self, encoding: str):
+        if encoding == "br":
+            return _BrotliStream(self.brotli_quality)
+        return _GzipStream(self.gzip_level)
+
+    @staticmethod
+    def _compressed_start(message: Message, encoding: str) -> Message:
+        """content-length 제거, content-encoding/Vary 추가, 강한 ETag는 약한 ETag로 변경"""
+        headers: List[Tuple[bytes, bytes]] = []
+        vary_found = False
+        for name, value in message.get("headers", []):
+            lower = name.lower()
+            if lower == b"content-length":
+                continue
+            if lower == b"etag" and not value.startswith(b"W/"):
+                value = b"W/" + value
+            if lower == b"vary":
+                vary_found = True
+                if b"accept-encoding" not in value.lower() and value.strip() != b"*":
+                    value = value + b", Accept-Encoding"
+            headers.append((name, value))
+        if not vary_found:
+            headers.append((b"vary", b"Accept-Encoding"))
+        headers.append((b"content-encoding", encoding.encode("latin-1")))
+        return dict(message, headers=headers)
@@ -1,23 +1,117 @@
-from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+import re
+import hmac
+import json
+import base64
 import logging
+from typing import List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.common.tracing import tracer
+from app.domain.auth.model.token_verifier import TokenVerifier, TokenVerificationError
 
 logger = logging.getLogger(__name__)
 
+# 백엔드로 전달하는 신뢰 헤더 (클라이언트가 보낸 같은 접두사 헤더는 항상 제거)
+TRUSTED_HEADER_PREFIXES = (b"x-user-", b"x-auth-")
+USER_ID_HEADER = b"x-user-id"
+USER_EMAIL_HEADER = b"x-user-email"
+USER_ROLES_HEADER = b"x-user-roles"
+AUTH_CLAIMS_HEADER = b"x-auth-claims"
+ADMIN_TOKEN_HEADER = b"x-admin-token"
+# X-Admin-Token만으로 JWT 없이 접근할 수 있는 게이트웨이 자체 관리 경로 (라우트의 require_admin이 다시 확인)
+GATEWAY_ADMIN_PATHS = re.compile(r"/admin(?:/.*)?|/metrics")
+
+
 class AuthMiddleware:
-    def __init__(self, app):
+    """게이트웨이 JWT 검증 미들웨어 (pure ASGI)
+
+    - 공개 경로(정규식 하나로 미리 컴파일)와 CORS preflight는 검증 없이 통과
+    - Authorization: Bearer 또는 쿠키의 토큰을 검증하고, 클레임을 x-user-*/x-auth-claims 헤더로 전달
+    - 검증 키가 하나도 설정되지 않았으면 검증 없이 통과 (시작 시 경고)
+    - 게이트웨이 관리 경로(/admin/*, /metrics)는 ADMIN_TOKEN과 같은 X-Admin-Token이면 토큰 없이 통과 (수집기용)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        verifier: Optional[TokenVerifier] = None,
+        public_paths: Optional[List[str]] = None,
+        cookie_name: str = "access_token",
+        admin_token: Optional[str] = None,
+    ):
         self.app = app
+        self.admin_token = admin_token.encode("latin-1") if admin_token else None
+        self.verifier = verifier
+        patterns = public_paths or [r"/health", r"/docs", r"/openapi\.json"]
+        self.public_path_pattern = re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+        self.cookie_name = cookie_name
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
 
-    async def __call__(self, scope, receive, send):
-        if scope["type"] == "http":
-            request = Request(scope, receive)
-            
-            # Skip auth for health check and docs
-            if request.url.path in ["/health", "/docs", "/openapi.json"]:
-                return await self.app(scope, receive, send)
-            
-            # Add your JWT validation logic here
-            # For now, we'll just pass through
-            logger.info(f"Processing request: {request.url.path}")
-        
+        headers = [(name, value) for name, value in scope["headers"] if not name.startswith(TRUSTED_HEADER_PREFIXES)]
+        scope = dict(scope, headers=headers)
+
+        enabled = self.verifier is not None and self.verifier.key_set.configured
+        if not enabled or scope["method"] == "OPTIONS" or self.public_path_pattern.fullmatch(scope["path"]):
+            return await self.app(scope, receive, send)
+
+        if self.admin_token is not None and GATEWAY_ADMIN_PATHS.fullmatch(scope["path"]) and self._has_admin_token(headers):
+            return await self.app(scope, receive, send)
+
+        token = self._extract_token(headers)
+        if token is None:
+            return await self._reject(scope, receive, send, "missing token")
+        try:
+            with tracer.span("auth.verify"):
+                claims = self.verifier.verify(token)
+        except TokenVerificationError as e:
+            logger.info("🔒 토큰 거부: %s %s (%s)", scope["method"], scope["path"], e.reason)
+            return await self._reject(scope, receive, send, e.reason)
+
+        headers.extend(self._claim_headers(claims))
         return await self.app(scope, receive, send)
+
+    def _has_admin_token(self, headers: List[Tuple[bytes, bytes]]) -> bool:
+        return any(name == ADMIN_TOKEN_HEADER and hmac.compare_digest(value, self.admin_token) for name, value in headers)
+
+    def _extract_token(self, headers: List[Tuple[bytes, bytes]]) -> Optional[str]:
+        cookie_header = None
+        for name, value in headers:
+            if name == b"authorization":
+                scheme, _, credentials = value.decode("latin-1").partition(" ")
+                if scheme.lower() == "bearer" and credentials.strip():
+                    return credentials.strip()
+            elif name == b"cookie":
+                cookie_header = value.decode("latin-1")
+        if cookie_header:
+            return cookie_parser(cookie_header).get(self.cookie_name) or None
+        return None
+
+    @staticmethod
+    def _claim_headers(claims: dict) -> List[Tuple[bytes, bytes]]:
+        result = []
+        if claims.get("sub") is not None:
+            result.append((USER_ID_HEADER, str(claims["sub"]).encode("utf-8")))
+        if claims.get("email"):
+            result.append((USER_EMAIL_HEADER, str(claims["email"]).encode("utf-8")))
+        roles = claims.get("roles", claims.get("role"))
+        if roles:
+            roles = roles if isinstance(roles, list) else [roles]
+            result.append((USER_ROLES_HEADER, ",".join(str(role) for role in roles).encode("utf-8")))
+        encoded = base64.urlsafe_b64encode(json.dumps(claims, separators=(",", ":"), default=str).encode("utf-8"))
+        result.append((AUTH_CLAIMS_HEADER, encoded.rstrip(b"=")))
+        return result
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send, reason: str):
+        response = JSONResponse(
+            status_code=401,
+            content={"detail": "Unauthorized", "reason": reason},
+            headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,140 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.common.tracing import tracer
+from app.common.utility.constant.settings import Settings
+from app.domain.discovery.model.service_type import ServiceType
+from app.domain.ratelimit.model.rate_limiter import RateLimiter, RateLimitRule
+from app.domain.ratelimit.model.concurrency_limiter import ConcurrencyLimiter
+
+logger = logging.getLogger("gateway_api")
+
+# IP별 엄격한 한도(RATE_LIMIT_LOGIN)를 적용하는 (서비스, 경로)
+# gateway /auth/login → auth-service /login (서비스 세그먼트를 떼고 전달)
+LOGIN_ROUTES = {(ServiceType.AUTH, "login"), (ServiceType.AUTH, "signup")}
+
+SERVICE_BY_SEGMENT: Dict[str, ServiceType] = {service_type.value: service_type for service_type in ServiceType}
+
+
+def split_route(path: str) -> Tuple[Optional[ServiceType], str]:
+    """gateway 경로 → (서비스, 서비스 아래 경로), 빈 세그먼트는 무시 ("/auth//login/" → (AUTH, "login"))"""
+    segments = [segment for segment in path.split("/") if segment]
+    service_type = SERVICE_BY_SEGMENT.get(segments[0]) if segments else None
+    return service_type, "/".join(segments[1:])
+
+
+def is_login_route(path: str) -> bool:
+    """gateway 경로가 정확히 로그인/회원가입인지 (JWT_PUBLIC_PATHS의 /auth/+login/? 와 같은 범위, /auth/login/extra는 아님)"""
+    return split_route(path) in LOGIN_ROUTES
+
+
+class RateLimitRules:
+    """설정에서 읽은 토큰 버킷 규칙과 요청별 검사 목록 (미들웨어와 /batch 하위 요청이 같은 버킷을 사용)"""
+
+    def __init__(self, settings: Settings):
+        self.enabled = settings.rate_limit_enabled
+        self.ip_rule = RateLimitRule.parse(settings.rate_limit_per_ip)
+        self.user_rule = RateLimitRule.parse(settings.rate_limit_per_user)
+        self.login_rule = RateLimitRule.parse(settings.rate_limit_login)
+        self.service_rules: Dict[ServiceType, Optional[RateLimitRule]] = {
+            service_type: RateLimitRule.parse(settings.service_rate_limit(service_type.name))
+            for service_type in ServiceType
+        }
+
+    def checks(
+        self,
+        client_ip: Optional[str],
+        user_id: Optional[str],
+        service_type: Optional[ServiceType],
+        route: str = "",
+    ) -> List[Tuple[str, str, RateLimitRule]]:
+        """(한도 이름, 버킷 키, 규칙) 목록, client_ip가 None이면 IP/로그인 버킷은 제외"""
+        checks: List[Tuple[str, str, RateLimitRule]] = []
+        if client_ip is not None and self.ip_rule is not None:
+            checks.append(("ip", f"ip:{client_ip}", self.ip_rule))
+        if user_id is not None and self.user_rule is not None:
+            checks.append(("user", f"user:{user_id}", self.user_rule))
+        if service_type is not None:
+            service_rule = self.service_rules[service_type]
+            if service_rule is not None:
+                checks.append(("service", f"svc:{service_type.value}", service_rule))
+            if client_ip is not None and (service_type, route) in LOGIN_ROUTES and self.login_rule is not None:
+                checks.append(("login", f"login:{client_ip}", self.login_rule))
+        return checks
+
+
+class RateLimitMiddleware:
+    """요청 수 제한 + 진행 중 요청 수 상한 미들웨어 (pure ASGI)
+
+    - 토큰 버킷: IP, 사용자(AuthMiddleware가 넣은 x-user-id), ServiceType, 로그인/회원가입(IP별)
+    - 동시 요청: ServiceType별 / 사용자별 in-flight 상한
+    한도를 넘으면 업스트림을 호출하지 않고 바로 429 + Retry-After로 응답합니다.
+    AuthMiddleware 안쪽에 등록해야 사용자별 한도가 적용됩니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        settings: Settings,
+        rate_limiter: RateLimiter,
+        concurrency_limiter: ConcurrencyLimiter,
+        rules: Optional[RateLimitRules] = None,
+    ):
+        self.app = app
+        self.rules = rules or RateLimitRules(settings)
+        self.enabled = self.rules.enabled
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.trust_forwarded_for = settings.rate_limit_trust_forwarded_for
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.enabled or scope["method"] == "OPTIONS" or scope["path"] == "/health":
+            return await self.app(scope, receive, send)
+
+        service_type, route = split_route(scope["path"])
+        client_ip = self._client_ip(scope)
+        user_id = self._user_id(scope)
+
+        checks = self.rules.checks(client_ip, user_id, service_type, route)
+        with tracer.span("ratelimit.acquire"):
+            wait, limit_name = await self.rate_limiter.acquire(checks)
+        if limit_name is not None:
+            return await self._reject(scope, receive, send, limit_name, wait)
+
+        if service_type is None:
+            return await self.app(scope, receive, send)
+
+        limit_name = self.concurrency_limiter.try_acquire(service_type, user_id)
+        if limit_name is not None:
+            return await self._reject(scope, receive, send, f"inflight_{limit_name}", 1.0)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.concurrency_limiter.release(service_type, user_id)
+
+    def _client_ip(self, scope: Scope) -> str:
+        if self.trust_forwarded_for:
+            for name, value in scope["headers"]:
+                if name == b"x-forwarded-for":
+                    return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    @staticmethod
+    def _user_id(scope: Scope) -> Optional[str]:
+        for name, value in scope["headers"]:
+            if name == b"x-user-id":
+                return value.decode("utf-8")
+        return None
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send, limit_name: str, wait: float):
+        logger.info("🚦 요청 제한(%s): %s %s", limit_name, scope["method"], scope["path"])
+        response = JSONResponse(
+            status_code=429,
+            content={"detail": "Too Many Requests", "limit": limit_name},
+            headers={"Retry-After": self.rate_limiter.retry_after_header(wait)},
+        )
+        await response(scope, receive, send)
@@ -1,30 +1,123 @@
+import re
+import time
+import random
 import logging
-from typing import Callable
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.common.tracing import current_span
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log incoming requests."""
+# 캡처한 본문에서 가릴 JSON 필드 ("password": "..." → "password": "***")
+_SECRET_FIELD_PATTERN = re.compile(
+    r'("(?:password|auth_pw|passwd|secret|token|access_token|refresh_token)"\s*:\s*)"[^"]*"',
+    re.IGNORECASE,
+)
 
-    def __init__(self, app, log_body: bool = False) -> None:
-        super().__init__(app)
-        self.log_body = log_body
+
+class RequestLoggingMiddleware:
+    """요청/응답 요약 로깅 미들웨어 (pure ASGI)
+
+    receive/send를 감싸 메서드, 경로, 상태 코드, 주고받은 바이트 수, 첫 바이트까지 시간과
+    전체 소요 시간을 응답이 끝난 뒤 한 줄로 기록합니다. 본문은 버퍼링하지 않고 그대로 흘려보내며,
+    body_sample_rate 비율로 샘플링된 요청만 앞부분 max_body_bytes까지 복사해 함께 기록합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        log_body: bool = False,
+        body_sample_rate: float = 0.0,
+        max_body_bytes: int = 2048,
+    ) -> None:
+        self.app = app
+        # log_body=True는 모든 요청의 본문 앞부분을 기록 (body_sample_rate=1.0과 동일)
+        self.body_sample_rate = 1.0 if log_body else body_sample_rate
+        self.max_body_bytes = max_body_bytes
         self.logger = logging.getLogger("request_logger")
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        body_bytes = b""
-        if self.log_body:
-            body_bytes = await request.body()
-            body_text = body_bytes.decode("utf-8", errors="replace")
-            self.logger.info("%s %s Body: %s", request.method, request.url, body_text)
-
-            async def receive() -> dict:  # pragma: no cover - internal
-                return {"type": "http.request", "body": body_bytes, "more_body": False}
-
-            request = Request(request.scope, receive)
-        else:
-            self.logger.info("%s %s", request.method, request.url)
-        response = await call_next(request)
-        return response
\ No newline at end of file
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        capture = self.body_sample_rate > 0 and random.random() < self.body_sample_rate
+        state = {
+            "bytes_in": 0,
+            "bytes_out": 0,
+            "status": None,
+            "first_byte": None,
+            "completed": False,
+            "disconnected": False,
+        }
+        captured = bytearray()
+
+        async def logging_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                body = message.get("body", b"")
+                state["bytes_in"] += len(body)
+                if capture and len(captured) < self.max_body_bytes:
+                    captured.extend(body[: self.max_body_bytes - len(captured)])
+            elif message["type"] == "http.disconnect" and not state["completed"]:
+                # 응답을 다 보내기 전에 클라이언트가 끊은 경우만 기록
+                state["disconnected"] = True
+            return message
+
+        async def logging_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                state["first_byte"] = time.perf_counter() - start
+            elif message["type"] == "http.response.body":
+                state["bytes_out"] += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    state["completed"] = True
+            await send(message)
+
+        try:
+            await self.app(scope, logging_receive, logging_send)
+        except Exception:
+            if state["status"] is None:
+                state["status"] = 500
+            raise
+        finally:
+            self._log(scope, state, start, captured if capture else None)
+
+    def _log(self, scope: Scope, state: dict, start: float, captured) -> None:
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        duration_ms = (time.perf_counter() - start) * 1000
+        first_byte_ms = state["first_byte"] * 1000 if state["first_byte"] is not None else None
+        extra = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": state["status"],
+            "bytes_in": state["bytes_in"],
+            "bytes_out": state["bytes_out"],
+            "duration_ms": round(duration_ms, 2),
+            "ttfb_ms": round(first_byte_ms, 2) if first_byte_ms is not None else None,
+        }
+        span = current_span()
+        if span is not None and span.recording:
+            extra["trace_id"] = span.context.trace_id
+        if state["disconnected"]:
+            extra["client_disconnected"] = True
+        if captured is not None:
+            extra["body"] = self._render_body(captured)
+            extra["body_truncated"] = state["bytes_in"] > len(captured)
+
+        self.logger.info(
+            "%s %s %s %.1fms in=%d out=%d",
+            scope["method"],
+            scope["path"],
+            state["status"],
+            duration_ms,
+            state["bytes_in"],
+            state["bytes_out"],
+            extra=extra,
+        )
+
+    @staticmethod
+    def _render_body(captured: bytearray) -> str:
+        text = bytes(captured).decode("utf-8", errors="replace")
+        return _SECRET_FIELD_PATTERN.sub(r'\1"***"', text)
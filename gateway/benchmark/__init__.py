@@ -0,0 +1 @@
+# gateway 부하 테스트/벤치마크 (python -m benchmark.run, README의 "벤치마크" 참고)
@@ -0,0 +1,104 @@
+import time
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+
+@dataclass
+class LoadResult:
+    """한 시나리오의 요청별 지연/상태 코드 집계"""
+    latencies: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    bytes_received: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    @staticmethod
+    def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+        if not sorted_values:
+            return None
+        index = min(len(sorted_values) - 1, max(0, int(round(q / 100 * len(sorted_values) + 0.5)) - 1))
+        return sorted_values[index]
+
+    def summary(self) -> Dict[str, Any]:
+        values = sorted(self.latencies)
+        ok = sum(count for status, count in self.statuses.items() if 200 <= status < 400)
+
+        def ms(value: Optional[float]) -> Optional[float]:
+            return round(value * 1000, 3) if value is not None else None
+
+        return {
+            "requests": self.requests,
+            "ok": ok,
+            "elapsed_s": round(self.elapsed, 3),
+            "throughput_rps": round(self.requests / self.elapsed, 1) if self.elapsed else 0.0,
+            "ok_rps": round(ok / self.elapsed, 1) if self.elapsed else 0.0,
+            "latency_ms": {
+                "min": ms(values[0] if values else None),
+                "mean": ms(sum(values) / len(values) if values else None),
+                "p50": ms(self.percentile(values, 50)),
+                "p95": ms(self.percentile(values, 95)),
+                "p99": ms(self.percentile(values, 99)),
+                "max": ms(values[-1] if values else None),
+            },
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "errors": dict(self.errors),
+            "bytes_received": self.bytes_received,
+        }
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    send: Callable[[httpx.AsyncClient], Any],
+    concurrency: int,
+    duration: float,
+    max_requests: Optional[int] = None,
+    warmup: float = 0.0,
+) -> LoadResult:
+    """concurrency개의 워커가 duration초 동안(또는 max_requests건까지) 쉬지 않고 요청 (closed-loop)
+
+    send(client)는 응답 본문까지 읽은 httpx.Response를 돌려주는 코루틴이어야 합니다.
+    warmup 동안의 요청은 집계하지 않습니다 (커넥션 풀/캐시 예열).
+    """
+    result = LoadResult()
+    started = time.perf_counter()
+    measure_from = started + warmup
+    deadline = measure_from + duration
+    issued = 0
+
+    async def worker():
+        nonlocal issued
+        while True:
+            now = time.perf_counter()
+            if now >= deadline or (max_requests is not None and issued >= max_requests):
+                return
+            measuring = now >= measure_from
+            if measuring:
+                issued += 1
+            request_started = time.perf_counter()
+            try:
+                response = await send(client)
+                status = response.status_code
+                size = len(response.content)
+                error = None
+            except httpx.HTTPError as e:
+                status, size, error = 0, 0, type(e).__name__
+            latency = time.perf_counter() - request_started
+            if not measuring:
+                continue
+            result.latencies.append(latency)
+            result.statuses[status] += 1
+            result.bytes_received += size
+            if error is not None:
+                result.errors[error] += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed = time.perf_counter() - max(measure_from, started)
+    return result
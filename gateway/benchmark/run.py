@@ -0,0 +1,252 @@
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import platform
+import subprocess
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.domain.discovery.model.service_type import ServiceType
+from benchmark.load_generator import run_load
+from benchmark.scenarios import build_scenarios
+
+# gateway 벤치마크 실행기
+#
+#   cd gateway && python -m benchmark.run --duration 10 --concurrency 32
+#
+# 1) 가짜 업스트림(benchmark.stub_upstream)과 gateway(uvicorn app.main:app)를 각각 별도 프로세스로 띄우고
+# 2) 시나리오마다 closed-loop 부하를 걸어 처리량, p50/p95/p99, gateway 프로세스 메모리(RSS)를 측정한 뒤
+# 3) 결과를 JSON으로 저장합니다 (--compare로 이전 결과와 비교).
+# 부하 생성기가 gateway와 같은 이벤트 루프를 쓰지 않도록 모두 다른 프로세스에서 실행합니다.
+
+GATEWAY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _rss_mb(pid: int) -> Optional[float]:
+    """리눅스 /proc 기준 프로세스 RSS (다른 OS에서는 None)"""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        return None
+    return None
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=GATEWAY_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _gateway_env(stub_base_port: int, extra: List[str]) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update({
+        "PYTHONPATH": GATEWAY_DIR,
+        "REDIS_ENABLED": "false",
+        "RATE_LIMIT_ENABLED": "false",
+        "LOG_LEVEL": "WARNING",
+        "TRACE_EXPORTER": "none",
+        "MAX_INFLIGHT_PER_SERVICE": "0",
+        "MAX_INFLIGHT_PER_USER": "0",
+        "RAILWAY_ENVIRONMENT": "true",  # .env를 읽지 않도록
+    })
+    for offset, service_type in enumerate(ServiceType):
+        env[f"{service_type.name}_SERVICE_URL"] = f"http://127.0.0.1:{stub_base_port + offset}"
+    for item in extra:
+        key, _, value = item.partition("=")
+        env[key] = value
+    return env
+
+
+async def _wait_ready(url: str, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while True:
+            try:
+                if (await client.get(url)).status_code < 500:
+                    return
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"{url} 가 {timeout}초 안에 응답하지 않습니다")
+            await asyncio.sleep(0.2)
+
+
+async def _sample_memory(pid: int, samples: List[float], interval: float = 0.1) -> None:
+    while True:
+        rss = _rss_mb(pid)
+        if rss is not None:
+            samples.append(rss)
+        await asyncio.sleep(interval)
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    stub_base_port = args.stub_port or _free_port()
+    gateway_port = args.gateway_port or _free_port()
+    gateway_url = f"http://127.0.0.1:{gateway_port}"
+    env = _gateway_env(stub_base_port, args.gateway_env)
+
+    # 서버 로그는 --show-logs일 때만 출력 (로그 출력 자체가 측정에 섞이지 않도록 LOG_LEVEL=WARNING)
+    output = None if args.show_logs else subprocess.DEVNULL
+    stub = subprocess.Popen(
+        [sys.executable, "-m", "benchmark.stub_upstream", str(stub_base_port)],
+        cwd=GATEWAY_DIR, env=env, stdout=output, stderr=output,
+    )
+    gateway = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(gateway_port),
+            "--log-level", "warning", "--no-access-log",
+        ],
+        cwd=GATEWAY_DIR,
+        env=env,
+        stdout=output,
+        stderr=output,
+    )
+    try:
+        await _wait_ready(f"http://127.0.0.1:{stub_base_port}/health")
+        await _wait_ready(f"{gateway_url}/health")
+
+        scenarios = build_scenarios(
+            small_size=args.small_size,
+            large_size=args.large_size,
+            upload_size=args.upload_size,
+            slow_latency_ms=args.slow_latency_ms,
+            error_rate=args.error_rate,
+        )
+        selected = args.scenarios.split(",") if args.scenarios else list(scenarios)
+        results = {}
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=gateway_url, limits=limits, timeout=args.timeout) as client:
+            for name in selected:
+                scenario = scenarios[name]
+                print(f"▶ {name}: {scenario.description} (동시 {args.concurrency}, {args.duration:g}초)", flush=True)
+                memory: List[float] = []
+                rss_before = _rss_mb(gateway.pid)
+                sampler = asyncio.create_task(_sample_memory(gateway.pid, memory))
+                try:
+                    load = await run_load(
+                        client, scenario.send, args.concurrency, args.duration,
+                        max_requests=args.requests, warmup=args.warmup,
+                    )
+                finally:
+                    sampler.cancel()
+                summary = load.summary()
+                summary["description"] = scenario.description
+                summary["memory_mb"] = {
+                    "rss_before": rss_before,
+                    "rss_peak": max(memory) if memory else None,
+                    "rss_after": _rss_mb(gateway.pid),
+                }
+                results[name] = summary
+                latency = summary["latency_ms"]
+                print(
+                    f"  {summary['throughput_rps']} req/s  p50={latency['p50']}ms  p95={latency['p95']}ms  "
+                    f"p99={latency['p99']}ms  statuses={summary['statuses']}  rss_peak={summary['memory_mb']['rss_peak']}MB",
+                    flush=True,
+                )
+    finally:
+        for process in (gateway, stub):
+            process.terminate()
+        for process in (gateway, stub):
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "requests": args.requests,
+            "gateway_env": args.gateway_env,
+        },
+        "scenarios": results,
+    }
+
+
+def compare(previous: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """두 결과 파일의 처리량/p50/p99/최대 RSS 변화율 출력"""
+    print(f"\n📊 {previous.get('git_commit')} → {current.get('git_commit')}")
+    for name, now in current["scenarios"].items():
+        before = previous.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+        rows = [
+            ("req/s", before["throughput_rps"], now["throughput_rps"]),
+            ("p50", before["latency_ms"]["p50"], now["latency_ms"]["p50"]),
+            ("p99", before["latency_ms"]["p99"], now["latency_ms"]["p99"]),
+            ("rss_peak", before["memory_mb"]["rss_peak"], now["memory_mb"]["rss_peak"]),
+        ]
+        parts = []
+        for label, old, new in rows:
+            if old and new is not None:
+                parts.append(f"{label} {old}→{new} ({(new - old) / old * 100:+.1f}%)")
+        print(f"  {name}: " + ", ".join(parts))
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="gateway 벤치마크 (가짜 업스트림 대상)")
+    parser.add_argument("--scenarios", default="", help="실행할 시나리오 (콤마 구분, 기본 전체)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="시나리오별 측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=1.0, help="측정 전 예열 시간(초)")
+    parser.add_argument("--requests", type=int, default=None, help="시나리오별 최대 요청 수")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--small-size", type=int, default=256)
+    parser.add_argument("--large-size", type=int, default=1024 * 1024)
+    parser.add_argument("--upload-size", type=int, default=5 * 1024 * 1024)
+    parser.add_argument("--slow-latency-ms", type=float, default=200.0)
+    parser.add_argument("--error-rate", type=float, default=0.5)
+    parser.add_argument("--gateway-env", action="append", default=[], metavar="KEY=VALUE",
+                        help="gateway 프로세스 환경 변수 추가 (여러 번 지정 가능)")
+    parser.add_argument("--gateway-port", type=int, default=None)
+    parser.add_argument("--stub-port", type=int, default=None, help="가짜 업스트림 시작 포트 (ServiceType 수만큼 사용)")
+    parser.add_argument("--show-logs", action="store_true", help="gateway/가짜 업스트림 로그 출력")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본 benchmark/results/<시각>-<커밋>.json)")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    result = asyncio.run(run_benchmark(args))
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(GATEWAY_DIR, "benchmark", "results", f"{stamp}-{result['git_commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(result, file, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            compare(json.load(file), result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import itertools
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+import httpx
+
+from app.domain.discovery.model.service_type import ServiceType
+
+
+@dataclass
+class Scenario:
+    """벤치마크 시나리오 하나 (send가 gateway로 요청 하나를 보냄)"""
+    name: str
+    description: str
+    send: Callable[[httpx.AsyncClient], object]
+
+
+def _multipart_body(size: int, boundary: str) -> bytes:
+    return (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="bench.bin"\r\n'
+        f"Content-Type: application/octet-stream\r\n\r\n"
+    ).encode("ascii") + b"\0" * size + f"\r\n--{boundary}--\r\n".encode("ascii")
+
+
+def build_scenarios(
+    small_size: int = 256,
+    large_size: int = 1024 * 1024,
+    upload_size: int = 5 * 1024 * 1024,
+    slow_latency_ms: float = 200.0,
+    error_rate: float = 0.5,
+    error_status: int = 503,
+) -> Dict[str, Scenario]:
+    """기본 시나리오 모음 (크기/지연/오류율은 run.py 옵션으로 조정)"""
+    services = itertools.cycle([service_type.value for service_type in ServiceType])
+    boundary = "gateway-benchmark-boundary"
+    upload_body = _multipart_body(upload_size, boundary)
+    upload_headers = {"content-type": f"multipart/form-data; boundary={boundary}"}
+
+    async def small_json(client: httpx.AsyncClient):
+        # 모든 ServiceType의 커넥션 풀을 번갈아 사용
+        return await client.get(f"/{next(services)}/bench/json", params={"size": small_size})
+
+    async def large_json(client: httpx.AsyncClient):
+        return await client.get("/materiality/bench/json", params={"size": large_size})
+
+    async def file_upload(client: httpx.AsyncClient):
+        return await client.post("/materiality/bench/upload", content=upload_body, headers=upload_headers)
+
+    async def slow_upstream(client: httpx.AsyncClient):
+        return await client.get("/tcfd/bench/json", params={"size": small_size, "latency_ms": slow_latency_ms})
+
+    async def failing_upstream(client: httpx.AsyncClient):
+        return await client.get("/survey/bench/json", params={
+            "size": small_size, "error_rate": error_rate, "error_status": error_status,
+        })
+
+    scenarios: List[Scenario] = [
+        Scenario("small_json", f"{small_size}B JSON GET, 모든 서비스 순환", small_json),
+        Scenario("large_json", f"{large_size}B JSON GET", large_json),
+        Scenario("file_upload", f"{upload_size}B multipart POST (스트리밍 업로드)", file_upload),
+        Scenario("slow_upstream", f"업스트림 {slow_latency_ms:g}ms 지연", slow_upstream),
+        Scenario("failing_upstream", f"업스트림 오류율 {error_rate:g} ({error_status}, 서킷 브레이커/재시도 포함)", failing_upstream),
+    ]
+    return {scenario.name: scenario for scenario in scenarios}
@@ -0,0 +1,85 @@
+import os
+import sys
+import json
+import random
+import asyncio
+from typing import List
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from app.domain.discovery.model.service_type import ServiceType
+
+# 벤치마크용 가짜 업스트림 서비스
+#
+# 모든 ServiceType을 한 프로세스에서 포트만 달리해 띄웁니다 (BENCH_STUB_BASE_PORT부터 ServiceType 순서대로).
+# gateway는 쿼리스트링을 그대로 전달하므로 시나리오마다 쿼리로 지연/본문 크기/오류율을 지정합니다.
+#   latency_ms: 응답 전 대기 시간
+#   size: JSON 응답 본문 크기(바이트, 근사값)
+#   error_rate: 오류 응답 비율 (0~1), error_status: 오류 상태 코드 (기본 500)
+
+
+def create_stub_app(service_name: str) -> FastAPI:
+    app = FastAPI(title=f"stub-{service_name}", docs_url=None, redoc_url=None, openapi_url=None)
+    payload_cache = {}
+
+    def payload(size: int) -> bytes:
+        body = payload_cache.get(size)
+        if body is None:
+            items = [{"id": i, "name": f"item-{i:06d}", "score": i % 100} for i in range(max(1, size // 48))]
+            body = payload_cache[size] = json.dumps({"service": service_name, "items": items}).encode("utf-8")
+        return body
+
+    async def apply_faults(request: Request):
+        params = request.query_params
+        latency_ms = float(params.get("latency_ms", 0))
+        if latency_ms > 0:
+            await asyncio.sleep(latency_ms / 1000)
+        error_rate = float(params.get("error_rate", 0))
+        if error_rate > 0 and random.random() < error_rate:
+            return Response(status_code=int(params.get("error_status", 500)), content=b'{"detail":"stub error"}',
+                            media_type="application/json")
+        return None
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy", "service": service_name}
+
+    @app.get("/bench/json")
+    async def bench_json(request: Request):
+        error = await apply_faults(request)
+        if error is not None:
+            return error
+        return Response(content=payload(int(request.query_params.get("size", 256))), media_type="application/json")
+
+    @app.post("/bench/upload")
+    async def bench_upload(request: Request):
+        # 업로드 본문은 버퍼링하지 않고 읽으면서 크기만 셈
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+        error = await apply_faults(request)
+        if error is not None:
+            return error
+        return {"service": service_name, "received": received}
+
+    return app
+
+
+async def serve(base_port: int) -> None:
+    servers: List[uvicorn.Server] = []
+    for offset, service_type in enumerate(ServiceType):
+        config = uvicorn.Config(
+            create_stub_app(service_type.value),
+            host="127.0.0.1",
+            port=base_port + offset,
+            log_level="warning",
+            access_log=False,
+        )
+        servers.append(uvicorn.Server(config))
+    await asyncio.gather(*(server.serve() for server in servers))
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else int(os.getenv("BENCH_STUB_BASE_PORT", 18100))
+    asyncio.run(serve(port))
@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.common.async_logging import create_log_level_router
+from app.common.metrics import create_metrics_router
+from app.common.utility.constant.settings import Settings
+from app.domain.auth.model.admin_access import require_admin
+from app.domain.auth.model.token_verifier import TokenVerificationError
+from app.router.admin_router import admin_router
+from app.www.jwt_auth_middleware import AuthMiddleware
+
+
+def make_client(monkeypatch, admin_token=None):
+    if admin_token:
+        monkeypatch.setenv("ADMIN_TOKEN", admin_token)
+    else:
+        monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    app = FastAPI()
+    app.state.settings = Settings()
+    app.include_router(create_log_level_router(dependencies=[Depends(require_admin)]))
+    return TestClient(app)
+
+
+def test_log_levels_closed_without_admin_config(monkeypatch):
+    # ADMIN_TOKEN 미설정 + JWT 비활성(역할 헤더 없음)이면 누구도 변경할 수 없음
+    client = make_client(monkeypatch)
+    assert client.get("/admin/log-levels").status_code == 403
+    assert client.put("/admin/log-levels", json={"logger": "x", "level": "DEBUG"}).status_code == 403
+
+
+@pytest.mark.parametrize("token, status", [("secret", 200), ("wrong", 403), ("", 403)])
+def test_admin_token(monkeypatch, token, status):
+    client = make_client(monkeypatch, admin_token="secret")
+    response = client.put(
+        "/admin/log-levels", json={"logger": "test.admin", "level": "INFO"}, headers={"X-Admin-Token": token}
+    )
+    assert response.status_code == status
+
+
+@pytest.mark.parametrize("roles, status", [("admin", 200), ("user,admin", 200), ("user", 403), ("administrator", 403)])
+def test_admin_role_from_verified_token(monkeypatch, roles, status):
+    # x-user-roles는 JWT 미들웨어가 검증된 토큰에서만 붙이는 헤더
+    client = make_client(monkeypatch)
+    assert client.get("/admin/log-levels", headers={"x-user-roles": roles}).status_code == status
+
+
+@pytest.mark.parametrize("path", ["/admin/upstreams", "/admin/cache", "/admin/single-flight", "/admin/auth", "/admin/tracing", "/admin/rate-limits"])
+def test_status_routes_require_admin(monkeypatch, path):
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    app = FastAPI()
+    app.state.settings = Settings()
+    app.include_router(admin_router)
+    client = TestClient(app)
+    assert client.get(path).status_code == 403
+    assert client.get(path, headers={"x-user-roles": "user"}).status_code == 403
+
+
+async def send_raw(app, method, path, headers=()):
+    """TestClient(httpx)는 요청 URL의 dot 세그먼트를 정규화하므로 ASGI scope를 직접 구성"""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"gateway")] + list(headers), "client": ("127.0.0.1", 1234), "server": ("gateway", 80),
+    }
+    await app(scope, receive, send)
+    return next(message["status"] for message in messages if message["type"] == "http.response.start")
+
+
+@pytest.mark.parametrize("path, status", [
+    ("/gri/admin/log-levels", 403),
+    ("/gri//admin/log-levels", 403),
+    ("/gri/./admin/log-levels", 400),
+    ("/gri/x/../admin/log-levels", 400),
+    ("/gri/%2e/admin/log-levels", 400),
+    ("/auth/admin/sessions/lookup", 403),
+])
+def test_proxy_blocks_service_admin_paths(monkeypatch, path, status):
+    # 업스트림 호출 전에 응답하므로 라우트 테이블(lifespan) 없이 확인 가능
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    from app.main import app, settings
+
+    monkeypatch.setattr(settings, "admin_token", None)
+    app.state.settings = settings
+    assert asyncio.run(send_raw(app, "PUT", path)) == status
+
+
+class ConfiguredVerifier:
+    """키가 설정된 것처럼 보이지만 어떤 JWT도 통과시키지 않는 검증기"""
+
+    class key_set:
+        configured = True
+
+    def verify(self, token):
+        raise TokenVerificationError("invalid")
+
+
+def make_metrics_client(monkeypatch):
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    settings = Settings()
+    app = FastAPI()
+    app.state.settings = settings
+    app.include_router(create_metrics_router(dependencies=[Depends(require_admin)]))
+
+    @app.get("/gri/catalog")
+    async def proxied():
+        return {}
+
+    app.add_middleware(
+        AuthMiddleware,
+        verifier=ConfiguredVerifier(),
+        public_paths=settings.jwt_public_paths,
+        admin_token=settings.admin_token,
+    )
+    return TestClient(app)
+
+
+def test_metrics_require_admin(monkeypatch):
+    # 메트릭 라벨에 업스트림 인스턴스 URL이 들어가므로 공개하지 않음
+    client = make_metrics_client(monkeypatch)
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    assert client.get("/metrics", headers={"X-Admin-Token": "secret"}).status_code == 200
+
+
+def test_admin_token_does_not_bypass_jwt_on_proxied_routes(monkeypatch):
+    client = make_metrics_client(monkeypatch)
+    assert client.get("/gri/catalog", headers={"X-Admin-Token": "secret"}).status_code == 401
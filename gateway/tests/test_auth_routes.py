@@ -0,0 +1,42 @@
+import re
+
+import pytest
+
+from app.common.utility.constant.settings import Settings
+from app.domain.discovery.model.service_type import ServiceType
+from app.www.rate_limit_middleware import is_login_route, split_route
+
+
+@pytest.fixture
+def public_path():
+    settings = Settings()
+    return re.compile("|".join(f"(?:{pattern})" for pattern in settings.jwt_public_paths))
+
+
+@pytest.mark.parametrize("path", ["/auth/login", "/auth/signup", "/auth/refresh", "/auth/logout", "/auth/login/"])
+def test_auth_entry_points_are_public(public_path, path):
+    # gateway /auth/login → auth-service /login (auth-service 라우터는 prefix 없음)
+    assert public_path.fullmatch(path)
+
+
+@pytest.mark.parametrize("path", ["/auth/profile", "/auth/admin/sessions/lookup", "/auth/auth/login", "/gri/catalog", "/metrics"])
+def test_other_routes_require_token(public_path, path):
+    assert not public_path.fullmatch(path)
+
+
+@pytest.mark.parametrize("path", ["/auth/login", "/auth/signup", "/auth/login/", "//auth//login"])
+def test_login_bucket_matches_normalized_paths(path):
+    assert is_login_route(path)
+
+
+@pytest.mark.parametrize("path", ["/auth/login/extra", "/auth/signup/x/y", "/auth/auth/login"])
+def test_login_bucket_ignores_nested_paths(path):
+    assert not is_login_route(path)
+
+
+def test_split_route():
+    assert split_route("/auth/refresh") == (ServiceType.AUTH, "refresh")
+    assert split_route("/gri//catalog/search/") == (ServiceType.GRI, "catalog/search")
+    assert split_route("/unknown/login") == (None, "login")
+    assert split_route("/") == (None, "")
+    assert not is_login_route("/auth/refresh")
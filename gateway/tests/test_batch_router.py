@@ -0,0 +1,75 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.common.utility.constant.settings import Settings
+from app.domain.discovery.model.service_type import ServiceType
+from app.domain.ratelimit.model.concurrency_limiter import ConcurrencyLimiter
+from app.domain.ratelimit.model.rate_limiter import RateLimiter
+from app.router.batch_router import batch_router
+from app.www.rate_limit_middleware import RateLimitRules
+
+
+class RecordingDiscovery:
+    """업스트림 대신 호출(경로, 쿼리, 헤더)만 기록"""
+
+    def __init__(self):
+        self.calls = []
+
+    def forward_headers(self, items):
+        return list(items)
+
+    async def stream(self, method, path, headers, content=None, params=None, query=""):
+        self.calls.append((method, path, query, dict(headers)))
+        return httpx.Response(200, json={"path": path})
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_PER_USER", "")
+    monkeypatch.setenv("RATE_LIMIT_GRI", "0.001:3")
+    settings = Settings()
+    app = FastAPI()
+    app.state.settings = settings
+    app.state.route_table = {service_type: RecordingDiscovery() for service_type in ServiceType}
+    app.state.rate_limiter = RateLimiter()
+    app.state.rate_limit_rules = RateLimitRules(settings)
+    app.state.concurrency_limiter = ConcurrencyLimiter(settings)
+    app.include_router(batch_router)
+    return app, TestClient(app)
+
+
+def run_batch(client, *items, headers=None):
+    response = client.post("/batch", json={"requests": list(items)}, headers=headers or {})
+    assert response.status_code == 200
+    return [result["status"] for result in response.json()["results"]]
+
+
+@pytest.mark.parametrize("path", ["login", "login?x=1", "/login/", "%6Cogin", "signup#x", "x/../login"])
+def test_login_variants_rejected(gateway, path):
+    app, client = gateway
+    assert run_batch(client, {"service": "auth", "method": "POST", "path": path}) == [400]
+    assert app.state.route_table[ServiceType.AUTH].calls == []
+
+
+@pytest.mark.parametrize("header", ["Authorization", "cookie", "X-Admin-Token"])
+def test_auth_header_overrides_rejected(gateway, header):
+    app, client = gateway
+    assert run_batch(client, {"service": "gri", "path": "catalog", "headers": {header: "x"}}) == [400]
+    assert app.state.route_table[ServiceType.GRI].calls == []
+
+
+def test_each_item_debits_service_bucket(gateway):
+    # RATE_LIMIT_GRI 버스트 3 → 5개 항목 중 2개는 429
+    app, client = gateway
+    statuses = run_batch(client, *({"service": "gri", "path": f"catalog/{i}"} for i in range(5)))
+    assert sorted(statuses) == [200, 200, 200, 429, 429]
+    assert len(app.state.route_table[ServiceType.GRI].calls) == 3
+
+
+def test_inline_query_is_forwarded(gateway):
+    app, client = gateway
+    assert run_batch(client, {"service": "gri", "path": "/catalog//search?q=ghg", "query": "limit=5"}) == [200]
+    (_, path, query, _), = app.state.route_table[ServiceType.GRI].calls
+    assert (path, query) == ("catalog/search", "q=ghg&limit=5")
@@ -0,0 +1,26 @@
+from app.common.utility.constant.settings import Settings
+from app.domain.cache.model.response_cache import ResponseCache
+
+
+def test_cookie_authenticated_users_get_separate_cache_entries(monkeypatch):
+    monkeypatch.delenv("CACHE_KEY_HEADERS", raising=False)
+    cache = ResponseCache(Settings())
+    base_key = "gri/catalog?"
+    alice = cache._variant_key(base_key, [], {"cookie": "access_token=a", "x-user-id": "alice"})
+    bob = cache._variant_key(base_key, [], {"cookie": "access_token=b", "x-user-id": "bob"})
+    anonymous = cache._variant_key(base_key, [], {})
+    assert len({alice, bob, anonymous}) == 3
+    # 같은 사용자가 같은 자격 증명으로 보내면 같은 항목
+    assert alice == cache._variant_key(base_key, [], {"cookie": "access_token=a", "x-user-id": "alice"})
+
+
+def test_accept_encoding_always_splits_entries(monkeypatch):
+    # 업스트림이 Vary 없이 gzip 본문을 보내도 identity만 받는 클라이언트에게 압축 본문을 주지 않음
+    monkeypatch.delenv("CACHE_KEY_HEADERS", raising=False)
+    cache = ResponseCache(Settings())
+    base_key = "gri/catalog?"
+    gzip = cache._variant_key(base_key, [], {"accept-encoding": "gzip"})
+    identity = cache._variant_key(base_key, [], {})
+    assert gzip != identity
+    # 응답 Vary에 Accept-Encoding이 있어도 같은 키
+    assert gzip == cache._variant_key(base_key, ["accept-encoding"], {"accept-encoding": "gzip"})
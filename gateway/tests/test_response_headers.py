@@ -0,0 +1,32 @@
+import asyncio
+
+import httpx
+
+from app.common.utility.factory.response_factory import ResponseFactory
+from app.domain.cache.model.cached_response import CachedResponse
+
+UPSTREAM_HEADERS = [
+    ("date", "Mon, 01 Jan 2024 00:00:00 GMT"),
+    ("server", "uvicorn"),
+    ("connection", "keep-alive"),
+    ("etag", '"abc"'),
+    ("set-cookie", "a=1"),
+    ("set-cookie", "b=2"),
+]
+
+
+def header_names(raw_headers):
+    return [key.decode("latin-1") for key, _ in raw_headers]
+
+
+def test_streaming_response_drops_upstream_date_and_server():
+    response = ResponseFactory.create_streaming_response(httpx.Response(304, headers=UPSTREAM_HEADERS))
+    assert header_names(response.raw_headers) == ["etag", "set-cookie", "set-cookie"]
+
+
+def test_cached_response_drops_upstream_date_and_server():
+    entry = asyncio.run(CachedResponse.from_upstream(httpx.Response(200, headers=UPSTREAM_HEADERS, stream=httpx.ByteStream(b"{}"))))
+    response = ResponseFactory.create_cached_response(entry, if_none_match=entry.etag)
+    assert response.status_code == 304
+    assert "date" not in header_names(response.raw_headers)
+    assert "server" not in header_names(response.raw_headers)
@@ -0,0 +1,62 @@
+import asyncio
+
+import httpx
+
+from app.common.utility.constant.settings import Settings
+from app.domain.discovery.model.service_discovery import ServiceDiscovery
+from app.domain.discovery.model.service_type import ServiceType
+from app.domain.discovery.model.upstream_pool import UpstreamClientPool
+
+
+def echo_cookie_transport(seen: list) -> httpx.MockTransport:
+    """받은 Cookie 헤더를 기록하고, refresh 쿠키를 받으면 새 refresh 쿠키를 내려주는 업스트림"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cookie = request.headers.get("cookie")
+        seen.append(cookie)
+        headers = {}
+        if cookie and "refresh_token=" in cookie:
+            headers["set-cookie"] = "refresh_token=rotated-victim; Path=/; HttpOnly"
+        return httpx.Response(200, headers=headers, json={"cookie": cookie})
+
+    return httpx.MockTransport(handler)
+
+
+async def send(pool: UpstreamClientPool, client_headers: list) -> httpx.Response:
+    client = pool.get(ServiceType.AUTH)
+    headers = ServiceDiscovery.forward_headers(client_headers)
+    return await client.post("http://auth-service:8008/auth/refresh", headers=headers)
+
+
+def test_shared_client_does_not_replay_upstream_cookies():
+    seen = []
+
+    async def scenario():
+        pool = UpstreamClientPool(Settings(), transport=echo_cookie_transport(seen))
+        try:
+            victim = await send(pool, [("cookie", "refresh_token=victim")])
+            assert "rotated-victim" in victim.headers["set-cookie"]
+            attacker = await send(pool, [("authorization", "Bearer attacker")])
+            assert len(pool.get(ServiceType.AUTH).cookies.jar) == 0
+            return attacker
+        finally:
+            await pool.aclose()
+
+    attacker = asyncio.run(scenario())
+    assert seen == ["refresh_token=victim", None]
+    assert attacker.json() == {"cookie": None}
+
+
+def test_each_caller_only_sends_its_own_cookie():
+    seen = []
+
+    async def scenario():
+        pool = UpstreamClientPool(Settings(), transport=echo_cookie_transport(seen))
+        try:
+            await send(pool, [("cookie", "refresh_token=alice")])
+            await send(pool, [("cookie", "refresh_token=bob")])
+        finally:
+            await pool.aclose()
+
+    asyncio.run(scenario())
+    assert seen == ["refresh_token=alice", "refresh_token=bob"]
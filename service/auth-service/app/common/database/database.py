@@ -0,0 +1,43 @@
+import logging
+from typing import Any, Dict
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.common.utility.constant.settings import Settings
+
+logger = logging.getLogger("auth_service")
+
+
+def normalize_database_url(url: str) -> str:
+    """postgres:// / postgresql:// 주소를 async 드라이버(asyncpg) 주소로 변환"""
+    for prefix in ("postgres://", "postgresql://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+def create_database_engine(settings: Settings) -> AsyncEngine:
+    """앱 수명 동안 하나만 쓰는 AsyncEngine 생성
+
+    - Postgres(asyncpg): 커넥션 풀 크기/오버플로/대기 시간, pre-ping, 연결별 prepared statement 캐시
+    - SQLite(aiosqlite): 로컬 개발용, 풀 설정 없이 기본값 사용
+    """
+    url = normalize_database_url(settings.database_url)
+    options: Dict[str, Any] = {"echo": settings.db_echo}
+    if url.startswith("postgresql+asyncpg"):
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
+            connect_args={"prepared_statement_cache_size": settings.db_statement_cache_size},
+        )
+    engine = create_async_engine(url, **options)
+    logger.info(f"🗄️ 데이터베이스 엔진 생성: {engine.url.render_as_string(hide_password=True)}")
+    return engine
+
+
+def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    # 커밋 후에도 엔티티 속성을 다시 조회하지 않도록 expire_on_commit=False
+    return async_sessionmaker(engine, expire_on_commit=False)
@@ -0,0 +1,27 @@
+import logging
+
+import redis.asyncio as redis
+
+from app.common.utility.constant.settings import Settings
+
+logger = logging.getLogger("auth_service")
+
+
+def create_redis_client(settings: Settings) -> redis.Redis:
+    """세션 저장소용 Redis 클라이언트 생성 (연결은 첫 명령 시점에 맺어짐)
+
+    REDIS_URL이 있으면 우선 사용하고, 없으면 REDIS_HOST/PORT/DB로 구성합니다.
+    """
+    if settings.redis_url:
+        return redis.Redis.from_url(
+            settings.redis_url,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_timeout,
+        )
+    return redis.Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_db,
+        socket_timeout=settings.redis_socket_timeout,
+        socket_connect_timeout=settings.redis_socket_timeout,
+    )
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple, Dict, Any
+
+from passlib.context import CryptContext
+
+from app.common.utility.constant.settings import Settings
+
+logger = logging.getLogger("auth_service")
+
+
+# ---- 워커에서 실행되는 함수 (ProcessPoolExecutor로 넘기므로 모듈 최상위에 두어 pickle 가능하게) ----
+
+@lru_cache(maxsize=8)
+def _context(rounds: int) -> CryptContext:
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+def hash_password_sync(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def verify_password_sync(password: str, hashed: str, rounds: int) -> Tuple[bool, Optional[str]]:
+    """(일치 여부, 새 해시) 반환 - 비용 설정이 바뀐 해시면 같은 워커에서 바로 다시 해시"""
+    return _context(rounds).verify_and_update(password, hashed)
+
+
+def _warm_up(rounds: int) -> None:
+    _context(rounds)
+
+
+class PasswordHasherOverloaded(Exception):
+    """대기 중인 해시 작업이 너무 많아 즉시 거부"""
+
+
+class PasswordHasher:
+    """bcrypt 해시/검증을 이벤트 루프 밖 워커 풀에서 실행
+
+    - PASSWORD_HASH_EXECUTOR=process(기본)면 GIL과 무관하게 CPU 코어 수만큼 병렬 처리
+    - 대기 중인 작업이 max_pending을 넘으면 큐에 쌓지 않고 PasswordHasherOverloaded
+    - 검증 시 해시의 비용(rounds)이 현재 설정과 다르면 새 해시를 함께 돌려줌 (로그인 시 재해시)
+    """
+
+    def __init__(self, settings: Settings):
+        self.rounds = settings.password_hash_rounds
+        self.executor_type = settings.password_hash_executor
+        self.workers = settings.password_hash_workers
+        self.max_pending = settings.password_hash_max_pending
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        # 없는 사용자 로그인도 실제 검증과 같은 시간이 걸리도록 비교할 더미 해시
+        self._dummy_hash: Optional[str] = None
+
+        self.rejected = 0
+        self.rehashed = 0
+
+    async def start(self) -> None:
+        if self._executor is not None:
+            return
+        if self.executor_type == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        else:
+            # 이벤트 루프가 도는 프로세스를 fork하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        loop = asyncio.get_running_loop()
+        # 워커를 미리 띄워 첫 로그인 요청이 프로세스 시작 비용을 내지 않도록
+        await asyncio.gather(*[loop.run_in_executor(self._executor, _warm_up, self.rounds) for _ in range(self.workers)])
+        self._dummy_hash = await loop.run_in_executor(self._executor, hash_password_sync, "dummy-password", self.rounds)
+        logger.info(f"🔐 비밀번호 해시 워커 {self.workers}개 시작 ({self.executor_type}, rounds={self.rounds})")
+
+    async def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, fn, *args):
+        if self._executor is None:
+            raise RuntimeError("PasswordHasher.start()가 호출되지 않았습니다")
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHasherOverloaded()
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password_sync, password, self.rounds)
+
+    async def verify(self, password: str, hashed: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """(일치 여부, 재해시가 필요하면 새 해시) 반환, hashed가 없으면 더미 해시로 같은 비용을 치르고 False"""
+        if hashed is None:
+            await self._run(verify_password_sync, password, self._dummy_hash, self.rounds)
+            return False, None
+        valid, new_hash = await self._run(verify_password_sync, password, hashed, self.rounds)
+        if valid and new_hash is not None:
+            self.rehashed += 1
+        return valid, new_hash if valid else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "executor": self.executor_type,
+            "workers": self.workers,
+            "rounds": self.rounds,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+        }
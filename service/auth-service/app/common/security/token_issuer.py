@@ -0,0 +1,88 @@
+import time
+import hmac
+import hashlib
+import secrets
+import logging
+from typing import Dict, Any, Optional, Tuple
+
+from jose import jwt
+from jose.exceptions import JOSEError
+
+from app.common.utility.constant.settings import Settings
+
+logger = logging.getLogger("auth_service")
+
+
+class InvalidTokenError(Exception):
+    """토큰이 없거나 유효하지 않음"""
+
+
+class TokenIssuer:
+    """access 토큰(JWT)과 refresh 토큰 발급/검증
+
+    - access 토큰: 짧은 수명의 HS JWT, sid 클레임으로 세션을 가리킴 (gateway가 같은 JWT_SECRET으로 검증)
+    - refresh 토큰: "<세션 ID>.<랜덤 비밀값>" 형식, 저장소에는 비밀값의 해시만 보관
+    """
+
+    def __init__(self, settings: Settings):
+        self.secret = settings.jwt_secret
+        if not self.secret:
+            # 재시작하면 기존 토큰이 모두 무효가 되므로 배포 환경에서는 반드시 설정
+            logger.warning("⚠️ JWT_SECRET이 설정되지 않아 임시 비밀키로 토큰을 서명합니다")
+            self.secret = secrets.token_urlsafe(32)
+        self.algorithm = settings.jwt_algorithm
+        self.issuer = settings.jwt_issuer
+        self.access_token_ttl = settings.access_token_ttl
+
+    def issue_access_token(self, claims: Dict[str, Any], session_id: str) -> str:
+        now = int(time.time())
+        payload = dict(claims, sid=session_id, type="access", iat=now, exp=now + self.access_token_ttl)
+        if self.issuer:
+            payload["iss"] = self.issuer
+        return jwt.encode(payload, self.secret, algorithm=self.algorithm)
+
+    def decode_access_token(self, token: Optional[str]) -> Dict[str, Any]:
+        if not token:
+            raise InvalidTokenError("missing token")
+        try:
+            claims = jwt.decode(
+                token,
+                self.secret,
+                algorithms=[self.algorithm],
+                issuer=self.issuer,
+                options={"verify_aud": False},
+            )
+        except JOSEError as e:
+            raise InvalidTokenError(str(e))
+        if claims.get("type") != "access" or not claims.get("sid"):
+            raise InvalidTokenError("not an access token")
+        return claims
+
+    # ---- refresh 토큰 ----
+
+    @staticmethod
+    def new_session_id() -> str:
+        return secrets.token_urlsafe(18)
+
+    @staticmethod
+    def new_refresh_secret() -> str:
+        return secrets.token_urlsafe(32)
+
+    @staticmethod
+    def hash_secret(secret: str) -> str:
+        return hashlib.sha256(secret.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def refresh_token(session_id: str, secret: str) -> str:
+        return f"{session_id}.{secret}"
+
+    @staticmethod
+    def split_refresh_token(token: Optional[str]) -> Tuple[str, str]:
+        session_id, _, secret = (token or "").partition(".")
+        if not session_id or not secret:
+            raise InvalidTokenError("malformed refresh token")
+        return session_id, secret
+
+    @staticmethod
+    def secret_matches(secret: str, secret_hash: str) -> bool:
+        return hmac.compare_digest(TokenIssuer.hash_secret(secret), secret_hash or "")
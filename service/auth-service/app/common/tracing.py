@@ -0,0 +1,394 @@
+import os
+import json
+import time
+import queue
+import random
+import atexit
+import logging
+import threading
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# gateway와 모든 서비스가 같은 파일을 사용합니다 (app/common/tracing.py).
+#
+# W3C Trace Context(traceparent) 기반 분산 추적. gateway가 trace를 시작하거나 클라이언트의 trace를 이어받고,
+# 업스트림 호출마다 traceparent를 새로 붙여 보내면 각 서비스가 같은 trace를 이어갑니다.
+# 샘플링은 trace 시작 시점(head) 한 번만 결정하고 traceparent의 sampled 플래그로 하위 서비스에 전달합니다.
+# 샘플링되지 않은 요청은 span을 기록/내보내지 않고 ID만 만들어 전파하므로 비용이 거의 없습니다.
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT_HEADER = "traceparent"
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+_HEX = frozenset("0123456789abcdef")
+
+
+def _new_trace_id() -> str:
+    return f"{random.getrandbits(128):032x}"
+
+
+def _new_span_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+class SpanContext:
+    """trace 전파에 필요한 값 (trace ID, span ID, sampled 플래그)"""
+
+    __slots__ = ("trace_id", "span_id", "sampled")
+
+    def __init__(self, trace_id: str, span_id: str, sampled: bool):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[SpanContext]:
+    """traceparent 헤더 파싱, 형식이 틀리면 None (새 trace 시작)"""
+    if not value:
+        return None
+    parts = value.strip().lower().split("-")
+    if len(parts) < 4:
+        return None
+    version, trace_id, span_id, flags = parts[:4]
+    if (
+        len(version) != 2 or version == "ff"
+        or len(trace_id) != 32 or len(span_id) != 16 or len(flags) != 2
+        or not _HEX.issuperset(version + trace_id + span_id + flags)
+        or trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID
+    ):
+        return None
+    return SpanContext(trace_id, span_id, bool(int(flags, 16) & 0x01))
+
+
+class Span:
+    """기록되는 span (샘플링된 trace에서만 생성)"""
+
+    __slots__ = ("tracer", "name", "context", "parent_id", "kind", "start_ns", "end_ns", "attributes", "status", "_token")
+
+    recording = True
+
+    def __init__(self, tracer: "Tracer", name: str, context: SpanContext, parent_id: Optional[str], kind: str):
+        self.tracer = tracer
+        self.name = name
+        self.context = context
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.status = "ok"
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, error: BaseException) -> None:
+        self.status = "error"
+        self.attributes["error"] = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self.tracer.export(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.context.trace_id,
+            "span_id": self.context.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "service": self.tracer.service_name,
+            "start_time_unix_ns": self.start_ns,
+            "duration_ms": round(((self.end_ns or time.time_ns()) - self.start_ns) / 1e6, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None and not isinstance(exc, GeneratorExit):
+            self.set_error(exc)
+        _current_span.reset(self._token)
+        self.end()
+
+
+class NonRecordingSpan:
+    """샘플링되지 않은 trace의 span: ID만 전파하고 아무것도 기록하지 않음"""
+
+    __slots__ = ("context", "_token")
+
+    recording = False
+
+    def __init__(self, context: SpanContext):
+        self.context = context
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, error: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "NonRecordingSpan":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current_span.reset(self._token)
+
+
+_current_span: ContextVar[Optional[Any]] = ContextVar("current_span", default=None)
+
+
+def current_span():
+    """현재 요청 컨텍스트의 span (없으면 None)"""
+    return _current_span.get()
+
+
+# ---- exporter: export(span_dict)만 구현하면 교체 가능 ----
+
+class InMemorySpanExporter:
+    """최근 span을 메모리에 보관 (테스트/로컬 확인용)"""
+
+    def __init__(self, max_spans: int = 10000):
+        self.spans: Deque[Dict[str, Any]] = deque(maxlen=max_spans)
+
+    def export(self, span: Dict[str, Any]) -> None:
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class LoggingSpanExporter:
+    """span을 "tracing" 로거로 기록 (큐 기반 비동기 로깅을 그대로 사용, JSON lines의 span 필드)"""
+
+    def __init__(self):
+        self.logger = logging.getLogger("tracing")
+
+    def export(self, span: Dict[str, Any]) -> None:
+        self.logger.info("span %s %.1fms", span["name"], span["duration_ms"], extra={"span": span})
+
+    def shutdown(self) -> None:
+        pass
+
+
+class FileSpanExporter:
+    """span을 JSON lines 파일에 기록 (파일 쓰기는 백그라운드 스레드, 큐가 가득 차면 버림)"""
+
+    def __init__(self, path: str, max_queue: int = 10000):
+        self.path = path
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="span-file-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        with open(self.path, "a", encoding="utf-8") as file:
+            while True:
+                span = self._queue.get()
+                if span is None:
+                    break
+                file.write(json.dumps(span, ensure_ascii=False, default=str) + "\n")
+                if self._queue.empty():
+                    file.flush()
+
+    def shutdown(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+
+class Tracer:
+    """span 생성/샘플링/내보내기
+
+    - sample_rate: 새로 시작하는 trace를 기록할 비율 (이어받은 trace는 부모의 sampled 플래그를 따름)
+    - exporter가 None이면 추적을 끄고, 미들웨어/업스트림 호출은 traceparent를 건드리지 않습니다.
+    """
+
+    def __init__(self, service_name: str = "unknown", exporter=None, sample_rate: float = 1.0):
+        self.service_name = service_name
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.exported = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def start_span(
+        self,
+        name: str,
+        parent: Optional[SpanContext] = None,
+        kind: str = "internal",
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        """span 생성 (with 블록으로 쓰면 현재 span으로 설정되고 블록이 끝날 때 종료)
+
+        parent가 없으면 현재 컨텍스트의 span을 부모로, 그것도 없으면 새 trace를 시작합니다.
+        """
+        if parent is None:
+            span = _current_span.get()
+            parent = span.context if span is not None else None
+        if parent is None:
+            trace_id, parent_id = _new_trace_id(), None
+            sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+        else:
+            trace_id, parent_id, sampled = parent.trace_id, parent.span_id, parent.sampled
+        context = SpanContext(trace_id, _new_span_id(), sampled)
+        if not sampled or not self.enabled:
+            return NonRecordingSpan(context)
+        span = Span(self, name, context, parent_id, kind)
+        if attributes:
+            span.attributes.update(attributes)
+        return span
+
+    def span(self, name: str, **attributes: Any):
+        """현재 span의 자식 span (현재 span이 없거나 샘플링되지 않았으면 기록 없이 통과)"""
+        parent = _current_span.get()
+        if parent is None or not parent.recording:
+            return _NOOP_SCOPE
+        return self.start_span(name, parent=parent.context, attributes=attributes)
+
+    def export(self, span: Span) -> None:
+        exporter = self.exporter
+        if exporter is None:
+            return
+        try:
+            exporter.export(span.to_dict())
+            self.exported += 1
+        except Exception as e:
+            logger.warning(f"⚠️ span 내보내기 실패: {str(e)}")
+
+    def shutdown(self) -> None:
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "exporter": type(self.exporter).__name__ if self.exporter is not None else None,
+            "sample_rate": self.sample_rate,
+            "exported": self.exported,
+        }
+
+
+class _NoopScope:
+    """기록할 부모 span이 없을 때 Tracer.span()이 돌려주는 빈 with 블록"""
+
+    recording = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, error: BaseException) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopScope":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_SCOPE = _NoopScope()
+
+# 프로세스 전체에서 공유하는 tracer (setup_tracing으로 설정)
+tracer = Tracer()
+
+
+def create_exporter(kind: str, file_path: str):
+    kind = kind.lower()
+    if kind in ("", "none", "off"):
+        return None
+    if kind == "memory":
+        return InMemorySpanExporter()
+    if kind == "log":
+        return LoggingSpanExporter()
+    if kind == "file":
+        return FileSpanExporter(file_path)
+    raise ValueError(f"Unknown TRACE_EXPORTER: {kind}")
+
+
+def setup_tracing(service_name: str, exporter=None) -> Tracer:
+    """공유 tracer 설정 (exporter를 넘기지 않으면 환경 변수 사용)
+
+    - TRACE_EXPORTER: none(기본) | log | file | memory
+    - TRACE_FILE: file exporter 경로 (기본 ./spans.jsonl)
+    - TRACE_SAMPLE_RATE: 새 trace 샘플링 비율 (기본 0.01)
+    """
+    tracer.service_name = service_name
+    tracer.sample_rate = float(os.getenv("TRACE_SAMPLE_RATE", 0.01))
+    if exporter is None:
+        exporter = create_exporter(os.getenv("TRACE_EXPORTER", "none"), os.getenv("TRACE_FILE", "./spans.jsonl"))
+    tracer.exporter = exporter
+    if exporter is not None:
+        atexit.register(tracer.shutdown)
+    return tracer
+
+
+class TracingMiddleware:
+    """들어온 요청마다 server span을 만들고 요청 처리 동안 현재 span으로 설정하는 pure ASGI 미들웨어
+
+    traceparent 헤더가 있으면 그 trace를 이어가고(sampled 플래그 포함), 없으면 새 trace를 시작합니다.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer = tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.tracer.enabled:
+            return await self.app(scope, receive, send)
+
+        parent = None
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                parent = parse_traceparent(value.decode("latin-1"))
+                break
+        span = self.tracer.start_span(
+            f"{scope['method']} {scope['path']}",
+            parent=parent,
+            kind="server",
+        )
+        if not span.recording:
+            with span:
+                return await self.app(scope, receive, send)
+
+        span.set_attribute("http.method", scope["method"])
+        span.set_attribute("http.target", scope["path"])
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                span.set_attribute("http.status_code", message["status"])
+                if message["status"] >= 500:
+                    span.status = "error"
+            await send(message)
+
+        with span:
+            await self.app(scope, receive, send_wrapper)
+
@@ -0,0 +1 @@
+# Constant package
@@ -0,0 +1,48 @@
+import os
+
+
+class Settings:
+    def __init__(self):
+        self.service_port = int(os.getenv("SERVICE_PORT", 8008))
+        self.environment = os.getenv("ENVIRONMENT", "local")
+
+        # Database (로컬은 SQLite(aiosqlite), 배포는 Postgres(asyncpg))
+        self.database_url = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./auth.db")
+        self.db_pool_size = int(os.getenv("DB_POOL_SIZE", 10))
+        self.db_max_overflow = int(os.getenv("DB_MAX_OVERFLOW", 10))
+        self.db_pool_timeout = float(os.getenv("DB_POOL_TIMEOUT", 5.0))
+        self.db_pool_recycle = int(os.getenv("DB_POOL_RECYCLE", 1800))
+        self.db_pool_pre_ping = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+        # asyncpg 연결별 prepared statement 캐시 크기
+        self.db_statement_cache_size = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100))
+        self.db_echo = os.getenv("DB_ECHO", "false").lower() == "true"
+        # 시작 시 테이블 생성 (마이그레이션 도구를 쓰는 환경에서는 false)
+        self.db_create_tables = os.getenv("DB_CREATE_TABLES", "true").lower() == "true"
+
+        # Redis (세션 저장소)
+        self.redis_host = os.getenv("REDIS_HOST", "redis")
+        self.redis_port = int(os.getenv("REDIS_PORT", 6379))
+        self.redis_db = int(os.getenv("REDIS_DB", 0))
+        self.redis_url = os.getenv("REDIS_URL")
+        self.redis_socket_timeout = float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.5))
+        # redis | memory (memory는 로컬/테스트용, 프로세스 재시작 시 세션 소멸)
+        self.session_backend = os.getenv("SESSION_BACKEND", "redis").lower()
+
+        # 토큰 (JWT_SECRET은 gateway와 같은 값을 사용해야 gateway에서 검증 가능)
+        self.jwt_secret = os.getenv("JWT_SECRET")
+        self.jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
+        self.jwt_issuer = os.getenv("JWT_ISSUER")
+        self.access_token_ttl = int(os.getenv("ACCESS_TOKEN_TTL", 900))
+        # 세션(리프레시 토큰) 유휴 만료 시간, 조회/갱신할 때마다 연장
+        self.session_ttl = int(os.getenv("SESSION_TTL", 7 * 24 * 3600))
+        self.cookie_secure = os.getenv("COOKIE_SECURE", "false").lower() == "true"
+        # 관리 API 역할 (gateway가 검증한 JWT 역할을 x-user-roles로 전달, gateway ADMIN_ROLE과 같은 값)
+        self.admin_role = os.getenv("ADMIN_ROLE", "admin")
+
+        # 비밀번호 해시 (bcrypt는 CPU를 많이 쓰므로 이벤트 루프 밖 워커 풀에서 실행)
+        self.password_hash_rounds = int(os.getenv("PASSWORD_HASH_ROUNDS", 12))
+        # process(기본) | thread
+        self.password_hash_executor = os.getenv("PASSWORD_HASH_EXECUTOR", "process").lower()
+        self.password_hash_workers = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 2))
+        # 대기 중인 해시 작업이 이 수를 넘으면 즉시 503 (0이면 workers * 8)
+        self.password_hash_max_pending = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 0)) or self.password_hash_workers * 8
@@ -1,6 +1,13 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.common.security.password_hasher import PasswordHasherOverloaded
+from app.domain.model.auth_model import AuthModel
+from app.domain.repository.auth_repository import DuplicateUserError
+from app.common.security.token_issuer import InvalidTokenError
+from app.domain.service.auth_service import AuthService
+from app.domain.service.session_service import SessionService
 
 class LoginRequest(BaseModel):
     username: str
@@ -14,40 +21,91 @@ class SignupRequest(BaseModel):
     auth_id: str
     auth_pw: str
 
+class RefreshRequest(BaseModel):
+    refresh_token: Optional[str] = None
+
+class SessionLookupRequest(BaseModel):
+    # 한 번에 확인할 수 있는 세션 수 제한 (Redis 파이프라인 크기)
+    session_ids: List[str] = Field(..., max_length=100)
+
 class AuthController:
-    def __init__(self):
-        pass
+    def __init__(self, auth_service: AuthService, session_service: SessionService):
+        self.auth_service = auth_service
+        self.session_service = session_service
     
     async def login(self, login_data: LoginRequest):
         """
         사용자명과 비밀번호로 로그인을 처리합니다.
         """
-        # 간단한 인증 로직 (실제로는 데이터베이스에서 확인해야 함)
-        # 임시로 모든 로그인을 성공으로 처리
+        try:
+            user = await self.auth_service.authenticate(login_data.username, login_data.password)
+        except PasswordHasherOverloaded:
+            raise HTTPException(status_code=503, detail="로그인 요청이 많습니다. 잠시 후 다시 시도해주세요.", headers={"Retry-After": "1"})
+        if user is None:
+            raise HTTPException(status_code=401, detail="아이디 또는 비밀번호가 올바르지 않습니다.")
+        tokens = await self.session_service.start(user)
         return {
             "success": True,
             "message": "로그인 성공",
             "user": {
-                "username": login_data.username,
-                "email": f"{login_data.username}@example.com"
+                "username": user.auth_id,
+                "email": user.email,
+                "name": user.name,
             },
-            "token": "sample_jwt_token_here"
+            "token": tokens["access_token"],
+            **tokens
         }
     
     async def signup(self, signup_data: SignupRequest):
         """
         회원가입을 처리합니다.
         """
-        # 임시로 모든 회원가입을 성공으로 처리
+        user = signup_data.model_dump(exclude={"auth_pw"})
+        try:
+            created = await self.auth_service.signup(user, signup_data.auth_pw)
+        except DuplicateUserError:
+            raise HTTPException(status_code=409, detail="이미 사용 중인 아이디 또는 이메일입니다.")
+        except PasswordHasherOverloaded:
+            raise HTTPException(status_code=503, detail="회원가입 요청이 많습니다. 잠시 후 다시 시도해주세요.", headers={"Retry-After": "1"})
         return {
             "success": True,
             "message": "회원가입 성공",
-            "user": {
-                "industry": signup_data.industry,
-                "email": signup_data.email,
-                "name": signup_data.name,
-                "age": signup_data.age,
-                "auth_id": signup_data.auth_id,
-                "id": "user_" + str(hash(signup_data.auth_id))[-8:]
-            }
-        }
\ No newline at end of file
+            "user": AuthModel.model_validate(created).model_dump()
+        }
+    
+    async def refresh(self, refresh_token: Optional[str]):
+        """
+        refresh 토큰으로 새 access/refresh 토큰을 발급합니다. (이전 refresh 토큰은 무효)
+        """
+        try:
+            tokens = await self.session_service.refresh(refresh_token)
+        except InvalidTokenError as e:
+            raise HTTPException(status_code=401, detail=str(e))
+        return {"success": True, "token": tokens["access_token"], **tokens}
+    
+    async def logout(self, access_token: Optional[str], refresh_token: Optional[str]):
+        """
+        현재 세션을 삭제합니다. 이후 refresh와 프로필 조회는 실패합니다.
+        """
+        try:
+            await self.session_service.logout(access_token, refresh_token)
+        except InvalidTokenError:
+            # 세션 정보가 없어도 쿠키는 지워야 하므로 성공으로 응답
+            pass
+        return {"success": True, "message": "로그아웃되었습니다."}
+    
+    async def profile(self, access_token: Optional[str]):
+        """
+        세션에 저장된 사용자 프로필을 반환합니다. (DB 조회 없음)
+        """
+        try:
+            user = await self.session_service.profile(access_token)
+        except InvalidTokenError as e:
+            raise HTTPException(status_code=401, detail=str(e))
+        return {"success": True, "user": user}
+    
+    async def lookup_sessions(self, lookup: SessionLookupRequest):
+        """
+        여러 세션의 유효 여부를 한 번에 확인합니다.
+        """
+        return {"sessions": await self.session_service.active_sessions(lookup.session_ids)}
@@ -1,15 +1,25 @@
 from datetime import datetime
 from sqlalchemy import (
-    Column, String, DateTime, func, text
+    Column, Integer, String, DateTime, Index
 )
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
 class AuthEntity(Base):
     __tablename__ = "auth"
     id = Column(Integer, primary_key=True)
-    email = Column(String, nullable=False)
-    password = Column(String, nullable=False)
+    auth_id = Column(String(100), nullable=False)
+    email = Column(String(255), nullable=True)
+    password = Column(String(255), nullable=False)
+    industry = Column(String(100), nullable=False)
+    name = Column(String(100), nullable=True)
+    age = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
\ No newline at end of file
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    # 로그인/중복 확인은 auth_id, email 유니크 인덱스로 한 번에 조회
+    __table_args__ = (
+        Index("ix_auth_auth_id", "auth_id", unique=True),
+        Index("ix_auth_email", "email", unique=True),
+    )
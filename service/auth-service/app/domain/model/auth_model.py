@@ -1,9 +1,15 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
-from datetime import date, datetime
+from datetime import datetime
 
 class AuthModel(BaseModel):
+    """응답용 사용자 정보 (비밀번호 해시 제외)"""
+    model_config = ConfigDict(from_attributes=True)
 
-class AuthModel:
-    def __init__(self):
-        pass    
\ No newline at end of file
+    id: int
+    auth_id: str
+    industry: str
+    email: Optional[str] = None
+    name: Optional[str] = None
+    age: Optional[int] = None
+    created_at: Optional[datetime] = None
@@ -1,5 +1,42 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Dict, Any
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entity.auth_entity import AuthEntity
+
+
+class DuplicateUserError(Exception):
+    """auth_id 또는 email 유니크 인덱스 위반"""
+
 
 class AuthRepository:
-    def __init__(self):
-        pass
\ No newline at end of file
+    """사용자 계정 저장소 (요청마다 세션 하나, 조회는 유니크 인덱스 한 번)"""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+
+    async def find_by_auth_id(self, auth_id: str) -> Optional[AuthEntity]:
+        async with self.session_factory() as session:
+            result = await session.execute(select(AuthEntity).where(AuthEntity.auth_id == auth_id))
+            return result.scalar_one_or_none()
+
+    async def create(self, user: Dict[str, Any]) -> AuthEntity:
+        """중복 확인은 별도 조회 없이 유니크 인덱스에 맡김 (동시 가입에도 안전)"""
+        entity = AuthEntity(**user)
+        async with self.session_factory() as session:
+            session.add(entity)
+            try:
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+                raise DuplicateUserError(user.get("auth_id"))
+        return entity
+
+    async def update_password(self, auth_id: str, password_hash: str) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                update(AuthEntity).where(AuthEntity.auth_id == auth_id).values(password=password_hash)
+            )
+            await session.commit()
@@ -0,0 +1,103 @@
+import json
+import time
+from typing import Optional, Dict, Any, List
+
+
+# 저장된 refresh 해시가 일치할 때만 새 해시로 교체하고 만료를 연장 (동시 refresh 중 하나만 성공)
+# KEYS[1] = 세션 키, ARGV = {이전 해시, 새 해시, TTL(초)}
+ROTATE_REFRESH_SCRIPT = """
+local raw = redis.call('GET', KEYS[1])
+if not raw then
+    return false
+end
+local data = cjson.decode(raw)
+if data['refresh_hash'] ~= ARGV[1] then
+    return false
+end
+data['refresh_hash'] = ARGV[2]
+local encoded = cjson.encode(data)
+redis.call('SET', KEYS[1], encoded, 'EX', tonumber(ARGV[3]))
+return encoded
+"""
+
+
+class RedisSessionRepository:
+    """Redis 세션 저장소 (세션 하나 = 키 하나, 조회할 때마다 TTL 연장)
+
+    조회는 GET + EXPIRE를 한 파이프라인으로 보내 왕복 한 번에 끝나며, 여러 세션도 한 번에 조회합니다.
+    """
+
+    KEY_PREFIX = "auth:session:"
+
+    def __init__(self, redis_client, ttl: int):
+        self.redis = redis_client
+        self.ttl = ttl
+        self._rotate = redis_client.register_script(ROTATE_REFRESH_SCRIPT)
+
+    def _key(self, session_id: str) -> str:
+        return self.KEY_PREFIX + session_id
+
+    async def create(self, session_id: str, data: Dict[str, Any]) -> None:
+        await self.redis.set(self._key(session_id), json.dumps(data), ex=self.ttl)
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return (await self.get_many([session_id]))[session_id]
+
+    async def get_many(self, session_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        pipe = self.redis.pipeline(transaction=False)
+        for session_id in session_ids:
+            pipe.get(self._key(session_id))
+            pipe.expire(self._key(session_id), self.ttl)
+        results = await pipe.execute()
+        return {
+            session_id: json.loads(raw) if raw is not None else None
+            for session_id, raw in zip(session_ids, results[::2])
+        }
+
+    async def rotate_refresh(self, session_id: str, old_hash: str, new_hash: str) -> Optional[Dict[str, Any]]:
+        raw = await self._rotate(keys=[self._key(session_id)], args=[old_hash, new_hash, self.ttl])
+        return json.loads(raw) if raw else None
+
+    async def delete(self, session_id: str) -> bool:
+        return bool(await self.redis.delete(self._key(session_id)))
+
+
+class MemorySessionRepository:
+    """프로세스 내 세션 저장소 (로컬 개발/테스트용, RedisSessionRepository와 같은 인터페이스)"""
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self._sessions: Dict[str, tuple] = {}
+
+    def _live(self, session_id: str) -> Optional[Dict[str, Any]]:
+        item = self._sessions.get(session_id)
+        if item is None:
+            return None
+        data, expires_at = item
+        if expires_at <= time.monotonic():
+            del self._sessions[session_id]
+            return None
+        return data
+
+    async def create(self, session_id: str, data: Dict[str, Any]) -> None:
+        self._sessions[session_id] = (dict(data), time.monotonic() + self.ttl)
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        data = self._live(session_id)
+        if data is not None:
+            self._sessions[session_id] = (data, time.monotonic() + self.ttl)
+        return dict(data) if data is not None else None
+
+    async def get_many(self, session_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        return {session_id: await self.get(session_id) for session_id in session_ids}
+
+    async def rotate_refresh(self, session_id: str, old_hash: str, new_hash: str) -> Optional[Dict[str, Any]]:
+        data = self._live(session_id)
+        if data is None or data.get("refresh_hash") != old_hash:
+            return None
+        data = dict(data, refresh_hash=new_hash)
+        self._sessions[session_id] = (data, time.monotonic() + self.ttl)
+        return dict(data)
+
+    async def delete(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id, None) is not None
@@ -1,4 +1,30 @@
+import logging
+from typing import Optional, Dict, Any
+
+from app.common.security.password_hasher import PasswordHasher
+from app.domain.entity.auth_entity import AuthEntity
+from app.domain.repository.auth_repository import AuthRepository
+
+logger = logging.getLogger("auth_service")
+
+
 class AuthService:
-    def __init__(self):
-        pass    
-        
\ No newline at end of file
+    def __init__(self, password_hasher: PasswordHasher, repository: AuthRepository):
+        self.password_hasher = password_hasher
+        self.repository = repository
+
+    async def signup(self, user: Dict[str, Any], password: str) -> AuthEntity:
+        """중복 auth_id/email이면 DuplicateUserError"""
+        password_hash = await self.password_hasher.hash(password)
+        return await self.repository.create(dict(user, password=password_hash))
+
+    async def authenticate(self, auth_id: str, password: str) -> Optional[AuthEntity]:
+        """비밀번호가 맞으면 사용자 반환, 해시 비용 설정이 바뀌었으면 새 해시로 교체"""
+        user = await self.repository.find_by_auth_id(auth_id)
+        valid, new_hash = await self.password_hasher.verify(password, user.password if user else None)
+        if not valid:
+            return None
+        if new_hash is not None:
+            await self.repository.update_password(auth_id, new_hash)
+            logger.info("🔁 비밀번호 해시 갱신: %s", auth_id)
+        return user
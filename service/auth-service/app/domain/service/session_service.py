@@ -0,0 +1,81 @@
+import time
+import logging
+from typing import Optional, Dict, Any, List
+
+from app.common.security.token_issuer import TokenIssuer, InvalidTokenError
+from app.domain.entity.auth_entity import AuthEntity
+
+logger = logging.getLogger("auth_service")
+
+
+class SessionService:
+    """로그인 세션과 access/refresh 토큰 관리
+
+    세션에 프로필을 함께 저장하므로 프로필/세션 확인은 DB를 조회하지 않습니다.
+    refresh할 때마다 refresh 토큰을 새로 발급하고(rotation), 이전 토큰은 즉시 무효가 됩니다.
+    """
+
+    def __init__(self, token_issuer: TokenIssuer, session_repository):
+        self.token_issuer = token_issuer
+        self.sessions = session_repository
+
+    @staticmethod
+    def _profile(user: AuthEntity) -> Dict[str, Any]:
+        return {
+            "id": user.id,
+            "auth_id": user.auth_id,
+            "email": user.email,
+            "name": user.name,
+            "industry": user.industry,
+        }
+
+    def _tokens(self, session_id: str, profile: Dict[str, Any], refresh_secret: str) -> Dict[str, Any]:
+        claims = {"sub": str(profile["id"]), "auth_id": profile["auth_id"], "email": profile["email"]}
+        return {
+            "access_token": self.token_issuer.issue_access_token(claims, session_id),
+            "refresh_token": self.token_issuer.refresh_token(session_id, refresh_secret),
+            "token_type": "bearer",
+            "expires_in": self.token_issuer.access_token_ttl,
+        }
+
+    async def start(self, user: AuthEntity) -> Dict[str, Any]:
+        session_id = self.token_issuer.new_session_id()
+        refresh_secret = self.token_issuer.new_refresh_secret()
+        profile = self._profile(user)
+        await self.sessions.create(session_id, {
+            "user": profile,
+            "refresh_hash": self.token_issuer.hash_secret(refresh_secret),
+            "created_at": int(time.time()),
+        })
+        return self._tokens(session_id, profile, refresh_secret)
+
+    async def refresh(self, refresh_token: Optional[str]) -> Dict[str, Any]:
+        session_id, secret = self.token_issuer.split_refresh_token(refresh_token)
+        new_secret = self.token_issuer.new_refresh_secret()
+        session = await self.sessions.rotate_refresh(
+            session_id,
+            self.token_issuer.hash_secret(secret),
+            self.token_issuer.hash_secret(new_secret),
+        )
+        if session is None:
+            raise InvalidTokenError("refresh token expired or already used")
+        return self._tokens(session_id, session["user"], new_secret)
+
+    async def profile(self, access_token: Optional[str]) -> Dict[str, Any]:
+        claims = self.token_issuer.decode_access_token(access_token)
+        session = await self.sessions.get(claims["sid"])
+        if session is None:
+            raise InvalidTokenError("session revoked")
+        return session["user"]
+
+    async def logout(self, access_token: Optional[str], refresh_token: Optional[str]) -> bool:
+        """access 토큰 또는 refresh 토큰이 가리키는 세션 삭제"""
+        try:
+            session_id = self.token_issuer.decode_access_token(access_token)["sid"]
+        except InvalidTokenError:
+            session_id, _ = self.token_issuer.split_refresh_token(refresh_token)
+        return await self.sessions.delete(session_id)
+
+    async def active_sessions(self, session_ids: List[str]) -> Dict[str, bool]:
+        sessions = await self.sessions.get_many(session_ids)
+        return {session_id: session is not None for session_id, session in sessions.items()}
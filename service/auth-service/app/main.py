@@ -1,28 +1,80 @@
-from fastapi import FastAPI, APIRouter, Request
+from fastapi import FastAPI, Depends, APIRouter, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 import os
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
+from app.common.async_logging import setup_logging, create_log_level_router, require_admin_token
+from app.common.metrics import MetricsMiddleware, create_metrics_router
+from app.common.tracing import setup_tracing, TracingMiddleware
+from app.common.utility.constant.settings import Settings
+from app.common.security.password_hasher import PasswordHasher
+from app.common.database.database import create_database_engine, create_session_factory
+from app.common.database.redis_client import create_redis_client
+from app.common.security.token_issuer import TokenIssuer
+from app.domain.repository.session_repository import RedisSessionRepository, MemorySessionRepository
+from app.domain.service.session_service import SessionService
+from app.domain.entity.auth_entity import Base
+from app.domain.repository.auth_repository import AuthRepository
+from app.domain.service.auth_service import AuthService
+from app.domain.controller.auth_controller import AuthController
+
 # 환경 변수 로드
 if os.getenv("RAILWAY_ENVIRONMENT") != "true":
     load_dotenv()
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# 로깅 설정 (QueueHandler + 백그라운드 리스너, JSON lines)
+setup_logging("auth-service")
+# 분산 추적 (gateway가 보낸 traceparent를 이어감, TRACE_EXPORTER=none이면 꺼짐)
+setup_tracing("auth-service")
 logger = logging.getLogger("auth_service")
 
+# 앱 생명주기 이벤트
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = Settings()
+    app.state.settings = settings
+    # bcrypt 해시/검증은 이벤트 루프 밖 워커 풀에서 실행
+    password_hasher = PasswordHasher(settings)
+    await password_hasher.start()
+    app.state.password_hasher = password_hasher
+    # AsyncEngine(커넥션 풀)은 앱 수명 동안 하나만 생성
+    engine = create_database_engine(settings)
+    if settings.db_create_tables:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    repository = AuthRepository(create_session_factory(engine))
+    # 세션/refresh 토큰 저장소 (SESSION_BACKEND=memory면 프로세스 내 저장)
+    redis_client = None
+    if settings.session_backend == "memory":
+        session_repository = MemorySessionRepository(settings.session_ttl)
+    else:
+        redis_client = create_redis_client(settings)
+        session_repository = RedisSessionRepository(redis_client, settings.session_ttl)
+    session_service = SessionService(TokenIssuer(settings), session_repository)
+    app.state.auth_controller = AuthController(AuthService(password_hasher, repository), session_service)
+    yield
+    await password_hasher.shutdown()
+    await engine.dispose()
+    if redis_client is not None:
+        await redis_client.aclose()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="Auth Service",
     description="Authentication service for ESG Mate",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
 )
 
+# 요청 수/지연 히스토그램, 이벤트 루프 지연 (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# 요청마다 server span 생성
+app.add_middleware(TracingMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -38,6 +90,10 @@ from app.router.auth_router import auth_router
 # 라우터 등록
 app.include_router(auth_router)
 
+# 실행 중 로그 레벨 조회/변경
+app.include_router(create_log_level_router(dependencies=[Depends(require_admin_token)]))
+app.include_router(create_metrics_router())
+
 # 헬스 체크 엔드포인트
 @app.get("/health")
 async def health_check():
@@ -1,57 +1,118 @@
-from fastapi import APIRouter, Cookie, HTTPException, Query
+import logging
+from typing import Optional
+from fastapi import APIRouter, Cookie, Depends, Header, HTTPException, Query, Request, Response
 from fastapi.responses import JSONResponse
-from app.domain.controller.auth_controller import AuthController, LoginRequest, SignupRequest
+from app.common.async_logging import route_logger, require_admin_token
+from app.domain.controller.auth_controller import (
+    AuthController, LoginRequest, SignupRequest, RefreshRequest, SessionLookupRequest
+)
 
 # Google OAuth는 나중에 구현
 # from app.domain.auth.controller.google_controller import GoogleController
 
-auth_router = APIRouter(prefix="/auth", tags=["auth"])
+# gateway가 /auth/{path}의 서비스 세그먼트를 떼고 {path}만 전달하므로 prefix 없이 루트에 등록
+# (gateway 경유 /auth/login → 여기 /login, JWT_PUBLIC_PATHS / 로그인 rate limit과 같은 경로)
+auth_router = APIRouter(tags=["auth"])
 # google_controller = GoogleController()
-auth_controller = AuthController()
+
+logger = logging.getLogger("auth_service")
+login_payload_logger = route_logger("auth_service", "login")
+signup_payload_logger = route_logger("auth_service", "signup")
+
+def mask(secret: str) -> str:
+    return "*" * len(secret) if secret else "N/A"
+
+def get_auth_controller(request: Request) -> AuthController:
+    """lifespan에서 만든 AuthController 반환"""
+    return request.app.state.auth_controller
+
+def get_access_token(
+    authorization: Optional[str] = Header(None),
+    access_token: Optional[str] = Cookie(None),
+) -> Optional[str]:
+    """Authorization: Bearer 헤더 우선, 없으면 access_token 쿠키"""
+    if authorization and authorization.lower().startswith("bearer "):
+        return authorization[7:].strip()
+    return access_token
+
+async def require_admin(
+    request: Request,
+    x_user_roles: Optional[str] = Header(None),
+    x_admin_token: Optional[str] = Header(None),
+) -> None:
+    """관리자만 통과 (gateway가 검증한 JWT 역할에 ADMIN_ROLE 포함 또는 X-Admin-Token 일치)
+
+    gateway는 클라이언트가 보낸 x-user-* 헤더를 항상 제거하고 검증한 토큰의 역할만 전달함.
+    """
+    admin_role = request.app.state.settings.admin_role
+    if admin_role and admin_role in (role.strip() for role in (x_user_roles or "").split(",")):
+        return
+    await require_admin_token(x_admin_token)
+
+def set_auth_cookies(request: Request, response: Response, tokens: dict) -> None:
+    settings = request.app.state.settings
+    response.set_cookie(
+        key="access_token",
+        value=tokens["access_token"],
+        max_age=tokens["expires_in"],
+        httponly=True,
+        secure=settings.cookie_secure,
+        samesite="lax",
+        path="/",
+    )
+    response.set_cookie(
+        key="refresh_token",
+        value=tokens["refresh_token"],
+        max_age=settings.session_ttl,
+        httponly=True,
+        secure=settings.cookie_secure,
+        samesite="lax",
+        path="/",
+    )
 
 @auth_router.post("/login", summary="사용자 로그인")
-async def login(login_data: LoginRequest):
+async def login(
+    login_data: LoginRequest,
+    request: Request,
+    response: Response,
+    auth_controller: AuthController = Depends(get_auth_controller),
+):
     """
     사용자명과 비밀번호로 로그인을 처리합니다.
     """
-    import logging
-    import json
-    logger = logging.getLogger("auth_service")
-    
-    logger.info("🔐 === Auth Service 로그인 요청 ===")
-    logger.info(f"👤 사용자명: {login_data.username}")
-    logger.info(f"🔑 비밀번호: {'*' * len(login_data.password) if login_data.password else 'N/A'}")
-    logger.info(f"📦 전체 로그인 데이터: {json.dumps(login_data.dict(), ensure_ascii=False, indent=2)}")
+    logger.info("🔐 Auth Service 로그인 요청: %s", login_data.username)
+    # 페이로드 덤프는 라우트 로거(auth_service.route.login)가 DEBUG일 때만
+    if login_payload_logger.isEnabledFor(logging.DEBUG):
+        login_payload_logger.debug(
+            "📦 로그인 데이터",
+            extra={"payload": {"username": login_data.username, "password": mask(login_data.password)}},
+        )
     
     result = await auth_controller.login(login_data)
+    set_auth_cookies(request, response, result)
     
-    logger.info("✅ === Auth Service 로그인 처리 완료 ===")
-    logger.info(f"📤 응답 데이터: {json.dumps(result, ensure_ascii=False, indent=2)}")
+    logger.info("✅ Auth Service 로그인 처리 완료: %s", login_data.username)
+    if login_payload_logger.isEnabledFor(logging.DEBUG):
+        login_payload_logger.debug("📤 응답 데이터", extra={"payload": {"user": result["user"]}})
     
     return result
 
 @auth_router.post("/signup", summary="사용자 회원가입")
-async def signup(signup_data: SignupRequest):
+async def signup(signup_data: SignupRequest, auth_controller: AuthController = Depends(get_auth_controller)):
     """
     회원가입을 처리합니다.
     """
-    import logging
-    import json
-    logger = logging.getLogger("auth_service")
-    
-    logger.info("📝 === Auth Service 회원가입 요청 ===")
-    logger.info(f"🏭 업종: {signup_data.industry}")
-    logger.info(f"📧 이메일: {signup_data.email}")
-    logger.info(f"👤 이름: {signup_data.name}")
-    logger.info(f"🎂 나이: {signup_data.age}")
-    logger.info(f"🆔 아이디: {signup_data.auth_id}")
-    logger.info(f"🔑 비밀번호: {'*' * len(signup_data.auth_pw) if signup_data.auth_pw else 'N/A'}")
-    logger.info(f"📦 전체 회원가입 데이터: {json.dumps(signup_data.dict(), ensure_ascii=False, indent=2)}")
+    logger.info("📝 Auth Service 회원가입 요청: %s", signup_data.auth_id)
+    # 페이로드 덤프는 라우트 로거(auth_service.route.signup)가 DEBUG일 때만
+    if signup_payload_logger.isEnabledFor(logging.DEBUG):
+        payload = signup_data.model_dump()
+        payload["auth_pw"] = mask(signup_data.auth_pw)
+        signup_payload_logger.debug("📦 회원가입 데이터", extra={"payload": payload})
     
     result = await auth_controller.signup(signup_data)
     
-    logger.info("✅ === Auth Service 회원가입 처리 완료 ===")
-    logger.info(f"📤 응답 데이터: {json.dumps(result, ensure_ascii=False, indent=2)}")
+    logger.info("✅ Auth Service 회원가입 처리 완료: %s", signup_data.auth_id)
+    signup_payload_logger.debug("📤 응답 데이터", extra={"payload": result})
     
     return result
 
@@ -79,41 +140,55 @@ async def signup(signup_data: SignupRequest):
 #     """
 #     return await google_controller.handle_google_callback(code, state)
 
-# @auth_router.post("/logout", summary="로그아웃")
-# async def logout(session_token: str | None = Cookie(None)):
-#     """
-#     사용자를 로그아웃하고 인증 쿠키를 삭제합니다.
-#     """
-#     print(f"로그아웃 요청 - 받은 세션 토큰: {session_token}")
-#     
-#     # 로그아웃 응답 생성
-#     response = JSONResponse({
-#         "success": True,
-#         "message": "로그아웃되었습니다."
-#     })
-#     
-#     # 인증 쿠키 삭제
-#     response.delete_cookie(
-#         key="session_token",
-#         path="/",
-#         # domain 설정 제거 (로컬 환경)
-#     )
-#     
-#     print("✅ 로그아웃 완료 - 인증 쿠키 삭제됨")
-#     return response
+@auth_router.post("/refresh", summary="토큰 갱신")
+async def refresh(
+    request: Request,
+    response: Response,
+    refresh_data: Optional[RefreshRequest] = None,
+    refresh_token: Optional[str] = Cookie(None),
+    auth_controller: AuthController = Depends(get_auth_controller),
+):
+    """
+    refresh 토큰(본문 또는 쿠키)으로 새 access/refresh 토큰을 발급합니다.
+    """
+    token = refresh_data.refresh_token if refresh_data and refresh_data.refresh_token else refresh_token
+    result = await auth_controller.refresh(token)
+    set_auth_cookies(request, response, result)
+    return result
 
-# @auth_router.get("/profile", summary="사용자 프로필 조회")
-# async def get_profile(session_token: str | None = Cookie(None)):
-#     """
-#     세션 토큰으로 사용자 프로필을 조회합니다.
-#     세션 토큰이 없거나 유효하지 않으면 401 에러를 반환합니다.
-#     """
-#     print(f"프로필 요청 - 받은 세션 토큰: {session_token}")
-#     
-#     if not session_token:
-#         raise HTTPException(status_code=401, detail="인증 쿠키가 없습니다.")
-#     try:
-#         return await google_controller.get_user_profile(session_token)
-#     except Exception as e:
-#         print(f"프로필 조회 오류: {e}")
-#         raise HTTPException(status_code=401, detail=str(e))
\ No newline at end of file
+@auth_router.post("/logout", summary="로그아웃")
+async def logout(
+    response: Response,
+    access_token: Optional[str] = Depends(get_access_token),
+    refresh_token: Optional[str] = Cookie(None),
+    auth_controller: AuthController = Depends(get_auth_controller),
+):
+    """
+    세션을 삭제하고 인증 쿠키를 지웁니다.
+    """
+    result = await auth_controller.logout(access_token, refresh_token)
+    response.delete_cookie(key="access_token", path="/")
+    response.delete_cookie(key="refresh_token", path="/")
+    return result
+
+@auth_router.get("/profile", summary="사용자 프로필 조회")
+async def get_profile(
+    access_token: Optional[str] = Depends(get_access_token),
+    auth_controller: AuthController = Depends(get_auth_controller),
+):
+    """
+    세션에 저장된 사용자 프로필을 조회합니다. (DB 조회 없음)
+    토큰이 없거나 세션이 만료/폐기되었으면 401 에러를 반환합니다.
+    """
+    return await auth_controller.profile(access_token)
+
+@auth_router.post("/admin/sessions/lookup", summary="세션 일괄 확인", dependencies=[Depends(require_admin)])
+async def lookup_sessions(
+    lookup: SessionLookupRequest,
+    auth_controller: AuthController = Depends(get_auth_controller),
+):
+    """
+    여러 세션 ID의 유효 여부를 한 번의 Redis 파이프라인으로 확인합니다.
+    관리자 전용이며(gateway /auth/admin/* 경로 보호 + 역할 확인) 한 번에 최대 100개까지 확인합니다.
+    """
+    return await auth_controller.lookup_sessions(lookup)
@@ -0,0 +1,12 @@
+import os
+import sys
+
+# 테스트는 메모리 세션 저장소, 임시 SQLite, 낮은 bcrypt 비용으로 실행
+os.environ.setdefault("SESSION_BACKEND", "memory")
+os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ.setdefault("PASSWORD_HASH_ROUNDS", "4")
+os.environ.setdefault("PASSWORD_HASH_EXECUTOR", "thread")
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "2")
+os.environ.setdefault("TRACE_EXPORTER", "none")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
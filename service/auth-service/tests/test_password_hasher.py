@@ -0,0 +1,97 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.common.security.password_hasher import PasswordHasher, PasswordHasherOverloaded, hash_password_sync
+from app.common.utility.constant.settings import Settings
+
+
+def make_hasher(monkeypatch, **env) -> PasswordHasher:
+    monkeypatch.setenv("PASSWORD_HASH_EXECUTOR", "thread")
+    for name, value in env.items():
+        monkeypatch.setenv(name, str(value))
+    return PasswordHasher(Settings())
+
+
+def test_verify_unknown_user_checks_dummy_hash(monkeypatch):
+    hasher = make_hasher(monkeypatch)
+    calls = []
+    run = hasher._run
+
+    async def recording_run(fn, *args):
+        calls.append(args)
+        return await run(fn, *args)
+
+    hasher._run = recording_run
+
+    async def scenario():
+        await hasher.start()
+        try:
+            assert await hasher.verify("secret", None) == (False, None)
+        finally:
+            await hasher.shutdown()
+
+    asyncio.run(scenario())
+    # 없는 사용자도 더미 해시로 실제 bcrypt 검증을 한 번 수행 (응답 시간으로 사용자 존재 여부를 알 수 없도록)
+    assert calls == [("secret", hasher._dummy_hash, hasher.rounds)]
+    assert hasher._dummy_hash is not None
+
+
+def test_rejects_when_max_pending_reached(monkeypatch):
+    hasher = make_hasher(monkeypatch, PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_MAX_PENDING=1)
+    release = threading.Event()
+
+    async def scenario():
+        await hasher.start()
+        try:
+            blocked = asyncio.ensure_future(hasher._run(release.wait, 5))
+            await asyncio.sleep(0)
+            with pytest.raises(PasswordHasherOverloaded):
+                await hasher.hash("secret")
+            release.set()
+            await blocked
+            # 대기 작업이 끝나면 다시 받음
+            assert await hasher.hash("secret")
+        finally:
+            release.set()
+            await hasher.shutdown()
+
+    asyncio.run(scenario())
+    assert hasher.rejected == 1
+    assert hasher.snapshot()["pending"] == 0
+
+
+def test_verify_rehashes_when_rounds_changed(monkeypatch):
+    old_hash = hash_password_sync("secret", 4)
+    hasher = make_hasher(monkeypatch, PASSWORD_HASH_ROUNDS=5)
+
+    async def scenario():
+        await hasher.start()
+        try:
+            valid, new_hash = await hasher.verify("secret", old_hash)
+            current = await hasher.verify("secret", new_hash)
+        finally:
+            await hasher.shutdown()
+        return valid, new_hash, current
+
+    valid, new_hash, current = asyncio.run(scenario())
+    assert valid and new_hash.startswith("$2b$05$")
+    assert current == (True, None)
+    assert hasher.rehashed == 1
+
+
+def test_verify_wrong_password_does_not_rehash(monkeypatch):
+    old_hash = hash_password_sync("secret", 4)
+    hasher = make_hasher(monkeypatch, PASSWORD_HASH_ROUNDS=5)
+
+    async def scenario():
+        await hasher.start()
+        try:
+            return await hasher.verify("wrong", old_hash)
+        finally:
+            await hasher.shutdown()
+
+    # 비밀번호가 틀리면 비용이 달라도 새 해시를 만들지 않음
+    assert asyncio.run(scenario()) == (False, None)
+    assert hasher.rehashed == 0
@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.common.security.token_issuer import InvalidTokenError, TokenIssuer
+from app.common.utility.constant.settings import Settings
+from app.domain.entity.auth_entity import AuthEntity
+from app.domain.repository.session_repository import MemorySessionRepository
+from app.domain.service.session_service import SessionService
+
+
+def make_user() -> AuthEntity:
+    return AuthEntity(id=1, auth_id="alice", email="alice@example.com", name="Alice", industry="energy")
+
+
+def make_service(ttl: int = 60) -> SessionService:
+    return SessionService(TokenIssuer(Settings()), MemorySessionRepository(ttl))
+
+
+def test_memory_store_slides_and_expires(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.domain.repository.session_repository.time.monotonic", lambda: now[0])
+    store = MemorySessionRepository(ttl=10)
+
+    async def scenario():
+        await store.create("s1", {"user": {"id": 1}})
+        now[0] += 8
+        assert await store.get("s1") is not None  # 조회하면 만료가 10초 연장됨
+        now[0] += 8
+        assert (await store.get_many(["s1", "missing"])) == {"s1": {"user": {"id": 1}}, "missing": None}
+        now[0] += 11
+        assert await store.get("s1") is None
+        assert await store.delete("s1") is False
+
+    asyncio.run(scenario())
+
+
+def test_refresh_rotates_and_invalidates_previous_token():
+    service = make_service()
+
+    async def scenario():
+        first = await service.start(make_user())
+        second = await service.refresh(first["refresh_token"])
+        assert second["refresh_token"] != first["refresh_token"]
+        # 이미 사용한 refresh 토큰은 재사용 불가 (rotation)
+        with pytest.raises(InvalidTokenError):
+            await service.refresh(first["refresh_token"])
+        third = await service.refresh(second["refresh_token"])
+        profile = await service.profile(third["access_token"])
+        assert profile["auth_id"] == "alice"
+
+    asyncio.run(scenario())
+
+
+def test_logout_revokes_session():
+    service = make_service()
+
+    async def scenario():
+        tokens = await service.start(make_user())
+        assert await service.logout(tokens["access_token"], None) is True
+        with pytest.raises(InvalidTokenError):
+            await service.profile(tokens["access_token"])
+        with pytest.raises(InvalidTokenError):
+            await service.refresh(tokens["refresh_token"])
+        assert await service.logout(None, tokens["refresh_token"]) is False
+
+    asyncio.run(scenario())
+
+
+def test_auth_routes_through_gateway_paths(tmp_path, monkeypatch):
+    """gateway는 /auth/{path}에서 서비스 세그먼트를 떼고 /{path}로 전달하므로 라우트는 루트에 있어야 함"""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path}/auth.db")
+    from app.main import app
+
+    with TestClient(app) as client:
+        signup = client.post("/signup", json={"auth_id": "bob", "auth_pw": "pw-123456", "industry": "it", "email": "bob@example.com"})
+        assert signup.status_code == 200, signup.text
+        login = client.post("/login", json={"username": "bob", "password": "pw-123456"})
+        assert login.status_code == 200, login.text
+        tokens = login.json()
+
+        refreshed = client.post("/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert refreshed.status_code == 200
+        assert client.post("/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+
+        access = refreshed.json()["access_token"]
+        assert client.get("/profile", headers={"Authorization": f"Bearer {access}"}).json()["user"]["auth_id"] == "bob"
+        assert client.post("/logout", headers={"Authorization": f"Bearer {access}"}).status_code == 200
+        assert client.get("/profile", headers={"Authorization": f"Bearer {access}"}).status_code == 401
+        assert client.post("/auth/login", json={"username": "bob", "password": "pw-123456"}).status_code == 404
+
+
+def test_log_level_router_requires_admin_token(tmp_path, monkeypatch):
+    # 서비스 포트에 직접 접근해도 ADMIN_TOKEN 없이는 로그 레벨을 바꿀 수 없음
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path}/auth.db")
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    from app.main import app
+
+    update = {"logger": "auth_service", "level": "INFO"}
+    with TestClient(app) as client:
+        assert client.put("/admin/log-levels", json=update).status_code == 403
+        assert client.put("/admin/log-levels", json=update, headers={"X-Admin-Token": "wrong"}).status_code == 403
+        assert client.put("/admin/log-levels", json=update, headers={"X-Admin-Token": "secret"}).status_code == 200
+        monkeypatch.delenv("ADMIN_TOKEN")
+        assert client.put("/admin/log-levels", json=update, headers={"X-Admin-Token": "secret"}).status_code == 403
+
+
+def test_session_lookup_requires_admin_and_caps_ids(tmp_path, monkeypatch):
+    # 로그인한 일반 사용자는 다른 세션 ID를 확인할 수 없고, 한 번에 확인할 수 있는 수도 제한됨
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path}/auth.db")
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    from app.main import app
+
+    lookup = {"session_ids": ["s1", "s2"]}
+    with TestClient(app) as client:
+        assert client.post("/sessions/lookup", json=lookup).status_code == 404
+        assert client.post("/admin/sessions/lookup", json=lookup).status_code == 403
+        assert client.post("/admin/sessions/lookup", json=lookup, headers={"X-User-Roles": "user"}).status_code == 403
+        admin = {"X-User-Roles": "user, admin"}
+        response = client.post("/admin/sessions/lookup", json=lookup, headers=admin)
+        assert response.status_code == 200, response.text
+        assert set(response.json()["sessions"]) <= {"s1", "s2"}
+        too_many = {"session_ids": [f"s{i}" for i in range(101)]}
+        assert client.post("/admin/sessions/lookup", json=too_many, headers=admin).status_code == 422
@@ -0,0 +1,44 @@
+import os
+
+
+class Settings:
+    def __init__(self):
+        self.service_port = int(os.getenv("SERVICE_PORT", 8001))
+        self.environment = os.getenv("ENVIRONMENT", "local")
+
+        # 답변 생성 백엔드: "stub"(결정적 로컬 스텁) 또는 "패키지.모듈:클래스" (ChatBackend 구현, Settings를 인자로 받음)
+        self.chat_backend = os.getenv("CHAT_BACKEND", "stub")
+        self.chat_max_tokens = int(os.getenv("CHAT_MAX_TOKENS", 512))
+        # 토큰이 한동안 없을 때 보내는 SSE 주석(: keep-alive) 간격 (gateway read timeout보다 짧게)
+        self.chat_heartbeat_interval = float(os.getenv("CHAT_HEARTBEAT_INTERVAL", 15.0))
+        # 생성기와 전송 사이 버퍼 (클라이언트가 느리면 생성도 이만큼 앞서간 뒤 대기)
+        self.chat_stream_buffer_tokens = int(os.getenv("CHAT_STREAM_BUFFER_TOKENS", 64))
+
+        # 스텁 모델 지연 (첫 토큰 / 토큰 사이)
+        self.chat_stub_first_token_delay_ms = float(os.getenv("CHAT_STUB_FIRST_TOKEN_DELAY_MS", 50.0))
+        self.chat_stub_token_delay_ms = float(os.getenv("CHAT_STUB_TOKEN_DELAY_MS", 30.0))
+
+        # 검색 색인 (BM25 + 밀집 벡터, 세그먼트 파일을 memory-map으로 열어 워커 간 페이지 공유)
+        self.retrieval_index_dir = os.getenv("RETRIEVAL_INDEX_DIR", "./index")
+        # 임베딩: "hashing"(결정적 feature hashing) 또는 "패키지.모듈:클래스" (Embedder 구현, Settings를 인자로 받음)
+        self.retrieval_embedder = os.getenv("RETRIEVAL_EMBEDDER", "hashing")
+        self.retrieval_dim = int(os.getenv("RETRIEVAL_DIM", 256))
+        self.retrieval_top_k = int(os.getenv("RETRIEVAL_TOP_K", 5))
+        self.retrieval_max_top_k = int(os.getenv("RETRIEVAL_MAX_TOP_K", 50))
+        self.retrieval_max_batch = int(os.getenv("RETRIEVAL_MAX_BATCH", 32))
+        # 최종 점수 = alpha * BM25(질의별 최댓값으로 정규화) + (1 - alpha) * 코사인 유사도
+        self.retrieval_alpha = float(os.getenv("RETRIEVAL_ALPHA", 0.5))
+        self.retrieval_bm25_k1 = float(os.getenv("RETRIEVAL_BM25_K1", 1.2))
+        self.retrieval_bm25_b = float(os.getenv("RETRIEVAL_BM25_B", 0.75))
+        # 문서를 이 길이(문자)의 passage로 나눠 색인
+        self.retrieval_chunk_chars = int(os.getenv("RETRIEVAL_CHUNK_CHARS", 800))
+        self.retrieval_chunk_overlap = int(os.getenv("RETRIEVAL_CHUNK_OVERLAP", 100))
+        # 세그먼트가 이보다 많아지면 문서 추가 후 하나로 병합
+        self.retrieval_max_segments = int(os.getenv("RETRIEVAL_MAX_SEGMENTS", 8))
+        # 병합/대체로 빠진 세그먼트·삭제 마스크는 이 세대 수와 시간(초)이 모두 지난 뒤 지움 (다른 워커가 아직 열 수 있음)
+        self.retrieval_retain_generations = int(os.getenv("RETRIEVAL_RETAIN_GENERATIONS", 2))
+        self.retrieval_retain_seconds = float(os.getenv("RETRIEVAL_RETAIN_SECONDS", 60.0))
+        # 다른 프로세스가 추가한 세그먼트를 확인하는 간격 (manifest mtime)
+        self.retrieval_reload_interval = float(os.getenv("RETRIEVAL_RELOAD_INTERVAL", 1.0))
+        # 채팅 답변 전에 관련 passage를 검색해 sources 이벤트로 보내고 백엔드에 전달
+        self.chat_retrieval_enabled = os.getenv("CHAT_RETRIEVAL_ENABLED", "true").lower() == "true"
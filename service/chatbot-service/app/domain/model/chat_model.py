@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+
+from app.domain.model.retrieval_model import SearchHit
+
+
+class ChatMessage(BaseModel):
+    role: Literal["system", "user", "assistant"]
+    content: str
+
+
+class ChatRequest(BaseModel):
+    """채팅 요청 (history는 이전 대화, message는 이번 질문)"""
+    message: str = Field(..., min_length=1, max_length=8000)
+    history: List[ChatMessage] = Field(default_factory=list)
+    conversation_id: Optional[str] = None
+    max_tokens: Optional[int] = Field(None, ge=1)
+
+
+class ChatResponse(BaseModel):
+    """스트리밍하지 않는 채팅 응답 (POST /chat)"""
+    conversation_id: str
+    answer: str
+    tokens: int
+    finish_reason: str
+    duration_ms: float
+    sources: List[SearchHit] = Field(default_factory=list)
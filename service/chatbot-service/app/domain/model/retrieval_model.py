@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class IndexDocument(BaseModel):
+    """색인할 원문 문서 (같은 doc_id를 다시 넣으면 이전 passage를 대체)"""
+    doc_id: str = Field(..., min_length=1)
+    title: str = ""
+    text: str = Field(..., min_length=1)
+    source: Optional[str] = None
+
+
+class AddDocumentsRequest(BaseModel):
+    documents: List[IndexDocument] = Field(..., min_length=1)
+
+
+class AddDocumentsResult(BaseModel):
+    segment: Optional[str] = None
+    documents: int
+    chunks: int
+    replaced: int
+    compacted: bool = False
+    duration_ms: float
+
+
+class SearchRequest(BaseModel):
+    """질의 여러 개를 한 번에 검색 (행렬 연산 한 번으로 처리)"""
+    queries: List[str] = Field(..., min_length=1)
+    top_k: Optional[int] = Field(None, ge=1)
+    alpha: Optional[float] = Field(None, ge=0.0, le=1.0)
+
+
+class SearchHit(BaseModel):
+    """검색된 passage 하나 (score = alpha * bm25 + (1 - alpha) * dense)"""
+    id: str
+    doc_id: str
+    chunk: int
+    title: str
+    source: Optional[str] = None
+    text: str
+    score: float
+    bm25: float
+    dense: float
+
+
+class SearchResponse(BaseModel):
+    results: List[List[SearchHit]]
+    took_ms: float
@@ -0,0 +1,94 @@
+import re
+import asyncio
+import hashlib
+import importlib
+import logging
+from typing import AsyncIterator, Sequence
+
+from app.common.utility.constant.settings import Settings
+from app.domain.model.chat_model import ChatRequest
+from app.domain.model.retrieval_model import SearchHit
+
+logger = logging.getLogger("chatbot_service")
+
+# 공백을 뒤에 붙인 단어 단위 토큰 (이어 붙이면 원문과 동일)
+_TOKEN_PATTERN = re.compile(r"\S+\s*")
+
+# 스텁 답변 (질문 키워드로 고르고, 없으면 질문 해시로 결정)
+_STUB_ANSWERS = {
+    "gri": "GRI 기준은 조직이 경제, 환경, 사회에 미치는 영향을 보고하기 위한 국제 표준입니다. "
+           "공통 기준(GRI 1~3)으로 보고 원칙과 일반 공시를 작성한 뒤, 중대 주제별로 주제 기준(GRI 200/300/400 시리즈)을 적용합니다.",
+    "tcfd": "TCFD 권고안은 지배구조, 전략, 위험관리, 지표 및 목표의 네 가지 축으로 기후 관련 재무 정보를 공개하도록 합니다. "
+            "시나리오 분석을 통해 전환 위험과 물리적 위험이 재무에 미치는 영향을 설명하는 것이 핵심입니다.",
+    "중대성": "중대성 평가는 이해관계자 설문과 미디어 분석, 산업 벤치마크를 바탕으로 ESG 이슈의 영향도와 재무적 중요도를 평가해 "
+             "보고서에서 다룰 중대 주제를 선정하는 과정입니다.",
+}
+_STUB_DEFAULT_ANSWERS = [
+    "ESG 보고서 작성은 중대 이슈 선정, 데이터 수집, 공시 기준 매핑, 검증의 순서로 진행하는 것이 일반적입니다. "
+    "어떤 단계에 대해 더 알고 싶으신가요?",
+    "질문하신 내용은 지속가능경영 보고 범위에 따라 달라질 수 있습니다. "
+    "보고 기준(GRI, TCFD 등)과 대상 기간을 알려주시면 더 구체적으로 안내해 드리겠습니다.",
+]
+
+
+class ChatBackend:
+    """답변을 토큰(텍스트 조각) 단위로 생성하는 모델 백엔드 인터페이스
+
+    generate()는 토큰이 만들어지는 대로 yield하는 async generator여야 합니다.
+    contexts는 검색 색인에서 찾은 관련 passage (답변 근거로 프롬프트에 넣는 용도, 없으면 빈 목록).
+    클라이언트가 연결을 끊으면 generator가 취소/aclose() 되므로 외부 모델 호출도 그때 정리하면 됩니다.
+    """
+
+    name = "base"
+
+    def generate(self, request: ChatRequest, max_tokens: int, contexts: Sequence[SearchHit] = ()) -> AsyncIterator[str]:
+        raise NotImplementedError
+
+
+class StubChatBackend(ChatBackend):
+    """외부 모델 없이 질문에 따라 정해진 답변을 일정한 간격으로 흘려보내는 결정적 스텁"""
+
+    name = "stub"
+
+    def __init__(self, first_token_delay: float, token_delay: float):
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+
+    def answer(self, request: ChatRequest, contexts: Sequence[SearchHit] = ()) -> str:
+        if contexts:
+            # 가장 관련 있는 passage를 근거로 인용
+            best = contexts[0]
+            excerpt = best.text if len(best.text) <= 200 else best.text[:200].rsplit(" ", 1)[0] + " …"
+            return f"'{best.title or best.doc_id}' 문서에 따르면, {excerpt}"
+        message = request.message.lower()
+        for keyword, answer in _STUB_ANSWERS.items():
+            if keyword in message:
+                return answer
+        digest = hashlib.sha256(request.message.encode("utf-8")).digest()
+        return _STUB_DEFAULT_ANSWERS[digest[0] % len(_STUB_DEFAULT_ANSWERS)]
+
+    async def generate(self, request: ChatRequest, max_tokens: int, contexts: Sequence[SearchHit] = ()) -> AsyncIterator[str]:
+        if self.first_token_delay > 0:
+            await asyncio.sleep(self.first_token_delay)
+        for index, token in enumerate(_TOKEN_PATTERN.findall(self.answer(request, contexts))):
+            if index >= max_tokens:
+                return
+            if index and self.token_delay > 0:
+                await asyncio.sleep(self.token_delay)
+            yield token
+
+
+def create_chat_backend(settings: Settings) -> ChatBackend:
+    """CHAT_BACKEND 설정으로 백엔드 생성 ("stub" 또는 "패키지.모듈:클래스")"""
+    if settings.chat_backend == "stub":
+        backend: ChatBackend = StubChatBackend(
+            settings.chat_stub_first_token_delay_ms / 1000,
+            settings.chat_stub_token_delay_ms / 1000,
+        )
+    else:
+        module_name, _, class_name = settings.chat_backend.partition(":")
+        if not class_name:
+            raise ValueError(f"CHAT_BACKEND must be 'stub' or 'module:Class', got {settings.chat_backend!r}")
+        backend = getattr(importlib.import_module(module_name), class_name)(settings)
+    logger.info(f"🤖 채팅 백엔드: {backend.name}")
+    return backend
@@ -0,0 +1,192 @@
+import json
+import time
+import uuid
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from app.common.metrics import REGISTRY
+from app.common.utility.constant.settings import Settings
+from app.domain.model.chat_model import ChatRequest, ChatResponse
+from app.domain.model.retrieval_model import SearchHit
+from app.domain.service.chat_backend import ChatBackend
+from app.domain.service.retrieval_index import RetrievalIndex
+
+logger = logging.getLogger("chatbot_service")
+
+CHAT_STREAMS = REGISTRY.counter(
+    "chat_streams_total",
+    "끝난 채팅 스트림 수 (completed / cancelled / error)",
+    ("result",),
+)
+CHAT_STREAMS_ACTIVE = REGISTRY.gauge(
+    "chat_streams_active",
+    "전송 중인 채팅 스트림 수",
+)
+CHAT_FIRST_TOKEN = REGISTRY.histogram(
+    "chat_time_to_first_token_seconds",
+    "요청을 받은 뒤 첫 토큰 이벤트를 보내기까지 걸린 시간",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+CHAT_TOKENS = REGISTRY.counter(
+    "chat_tokens_total",
+    "생성해 보낸 토큰 수",
+)
+
+# SSE 주석 줄: 브라우저 EventSource는 무시하고, 프록시/gateway read timeout은 갱신됨
+HEARTBEAT = b": keep-alive\n\n"
+
+
+def sse_event(event: str, data: Dict[str, Any], event_id: Optional[str] = None) -> bytes:
+    """SSE 이벤트 하나 (data는 한 줄 JSON)"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append("data: " + json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+class ChatStreamService:
+    """백엔드가 만드는 토큰을 SSE 이벤트로 바꿔 흘려보냄
+
+    이벤트 순서: start → sources(검색 사용 시) → token* → done (실패 시 error)
+    - 헤더와 start 이벤트를 바로 보내 클라이언트/gateway가 연결을 즉시 확인할 수 있고,
+      토큰은 생성되는 즉시 하나씩 전송합니다 (모아서 보내지 않음).
+    - 생성(백엔드)과 전송은 크기 제한 큐로 분리해, 느린 클라이언트에는 생성이 큐 크기만큼만 앞서갑니다.
+    - 토큰 사이가 heartbeat_interval보다 길면 keep-alive 주석을 보냅니다.
+    - 클라이언트가 끊으면 StreamingResponse가 generator를 취소하고, 생성 task도 함께 취소됩니다.
+    """
+
+    def __init__(self, backend: ChatBackend, settings: Settings, retriever: Optional[RetrievalIndex] = None):
+        self.backend = backend
+        self.retriever = retriever
+        self.retrieval_top_k = settings.retrieval_top_k
+        self.retrieval_alpha = settings.retrieval_alpha
+        self.max_tokens = settings.chat_max_tokens
+        self.heartbeat_interval = settings.chat_heartbeat_interval
+        self.buffer_tokens = settings.chat_stream_buffer_tokens
+
+    def _token_limit(self, request: ChatRequest) -> int:
+        return min(request.max_tokens or self.max_tokens, self.max_tokens)
+
+    def _retrieve(self, request: ChatRequest) -> List[SearchHit]:
+        """질문과 관련된 passage 검색 (색인이 없거나 검색이 실패하면 근거 없이 답변)"""
+        if self.retriever is None:
+            return []
+        try:
+            return self.retriever.search([request.message], self.retrieval_top_k, self.retrieval_alpha)[0]
+        except Exception as e:
+            logger.warning(f"⚠️ 근거 검색 실패 - 검색 없이 답변: {str(e)}")
+            return []
+
+    async def _produce(
+        self,
+        request: ChatRequest,
+        max_tokens: int,
+        contexts: Sequence[SearchHit],
+        queue: asyncio.Queue,
+    ) -> None:
+        """백엔드 토큰을 큐에 넣고 마지막에 ("done", finish_reason) 또는 ("error", 메시지)"""
+        tokens = self.backend.generate(request, max_tokens, contexts)
+        finish_reason = "stop"
+        try:
+            count = 0
+            async for token in tokens:
+                await queue.put(("token", token))
+                count += 1
+                if count >= max_tokens:
+                    finish_reason = "length"
+                    break
+            await queue.put(("done", finish_reason))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ 답변 생성 실패: {str(e)}")
+            await queue.put(("error", str(e)))
+        finally:
+            await tokens.aclose()
+
+    async def stream(self, request: ChatRequest) -> AsyncIterator[bytes]:
+        conversation_id = request.conversation_id or uuid.uuid4().hex
+        max_tokens = self._token_limit(request)
+        started = time.perf_counter()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.buffer_tokens)
+        producer: Optional[asyncio.Task] = None
+        tokens = 0
+        first_token_ms = None
+        result = "error"
+        CHAT_STREAMS_ACTIVE.inc()
+        try:
+            yield sse_event("start", {"conversation_id": conversation_id, "backend": self.backend.name})
+            # 검색은 start 이벤트를 보낸 뒤에 (첫 바이트가 검색 시간만큼 늦어지지 않도록)
+            contexts = self._retrieve(request)
+            producer = asyncio.create_task(self._produce(request, max_tokens, contexts, queue))
+            if self.retriever is not None:
+                yield sse_event("sources", {"sources": [
+                    {"id": hit.id, "doc_id": hit.doc_id, "title": hit.title, "source": hit.source, "score": hit.score}
+                    for hit in contexts
+                ]})
+            while True:
+                try:
+                    kind, value = await asyncio.wait_for(queue.get(), self.heartbeat_interval)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT
+                    continue
+                if kind == "token":
+                    if tokens == 0:
+                        elapsed = time.perf_counter() - started
+                        first_token_ms = round(elapsed * 1000, 2)
+                        CHAT_FIRST_TOKEN.observe((), elapsed)
+                    yield sse_event("token", {"delta": value, "index": tokens}, event_id=str(tokens))
+                    tokens += 1
+                    CHAT_TOKENS.inc()
+                elif kind == "done":
+                    result = "completed"
+                    yield sse_event("done", {
+                        "conversation_id": conversation_id,
+                        "finish_reason": value,
+                        "tokens": tokens,
+                        "first_token_ms": first_token_ms,
+                        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                    })
+                    return
+                else:
+                    yield sse_event("error", {"detail": value})
+                    return
+        except (asyncio.CancelledError, GeneratorExit):
+            result = "cancelled"
+            logger.info(f"🔌 클라이언트 연결 끊김 - 답변 생성 중단 ({conversation_id}, 토큰 {tokens}개 전송)")
+            raise
+        finally:
+            if producer is not None:
+                producer.cancel()
+            CHAT_STREAMS_ACTIVE.dec()
+            CHAT_STREAMS.inc((result,))
+
+    async def complete(self, request: ChatRequest) -> ChatResponse:
+        """스트리밍 없이 전체 답변을 모아서 반환"""
+        conversation_id = request.conversation_id or uuid.uuid4().hex
+        max_tokens = self._token_limit(request)
+        started = time.perf_counter()
+        parts = []
+        finish_reason = "stop"
+        contexts = self._retrieve(request)
+        tokens = self.backend.generate(request, max_tokens, contexts)
+        try:
+            async for token in tokens:
+                parts.append(token)
+                if len(parts) >= max_tokens:
+                    finish_reason = "length"
+                    break
+        finally:
+            await tokens.aclose()
+        CHAT_TOKENS.inc(amount=len(parts))
+        return ChatResponse(
+            conversation_id=conversation_id,
+            answer="".join(parts),
+            tokens=len(parts),
+            finish_reason=finish_reason,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            sources=contexts,
+        )
@@ -0,0 +1,81 @@
+import re
+import math
+import zlib
+import importlib
+import logging
+from collections import Counter
+from typing import List, Sequence
+
+import numpy as np
+
+from app.common.utility.constant.settings import Settings
+
+logger = logging.getLogger("chatbot_service")
+
+# 영문/숫자 단어, 한글 어절
+_WORD_PATTERN = re.compile(r"[0-9a-z]+|[가-힣]+")
+# 색인 용어 최대 길이 (용어 사전을 고정 폭 배열로 저장하므로 이보다 긴 단어는 잘라서 사용)
+MAX_TERM_CHARS = 32
+
+
+def tokenize(text: str) -> List[str]:
+    """BM25/해싱 임베딩 공용 토크나이저
+
+    형태소 분석기 없이 한글 어절은 문자 bigram으로 쪼개 조사가 붙은 형태("기준은")도 "기준"과 맞도록 하고,
+    영문/숫자는 소문자 단어 그대로 사용합니다.
+    """
+    tokens = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        if word[0] >= "가" and len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word[:MAX_TERM_CHARS])
+    return tokens
+
+
+class Embedder:
+    """텍스트 묶음을 (n, dim) float32 단위 벡터 행렬로 바꾸는 임베딩 인터페이스"""
+
+    name = "base"
+    dim = 0
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        raise NotImplementedError
+
+
+class HashingEmbedder(Embedder):
+    """외부 모델 없이 토큰을 해시해 고정 차원에 흩뿌리는 결정적 임베딩 (feature hashing)
+
+    crc32를 쓰므로 프로세스/워커가 달라도 같은 벡터가 나옵니다 (파이썬 hash()는 프로세스마다 다름).
+    """
+
+    name = "hashing"
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        rows, columns, values = [], [], []
+        for row, text in enumerate(texts):
+            for token, count in Counter(tokenize(text)).items():
+                digest = zlib.crc32(token.encode("utf-8"))
+                rows.append(row)
+                columns.append(digest % self.dim)
+                values.append((1.0 + math.log(count)) * (1.0 if digest & 0x80000000 else -1.0))
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        np.add.at(matrix, (rows, columns), values)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
+
+
+def create_embedder(settings: Settings) -> Embedder:
+    """RETRIEVAL_EMBEDDER 설정으로 임베딩 생성 ("hashing" 또는 "패키지.모듈:클래스")"""
+    if settings.retrieval_embedder == "hashing":
+        embedder: Embedder = HashingEmbedder(settings.retrieval_dim)
+    else:
+        module_name, _, class_name = settings.retrieval_embedder.partition(":")
+        if not class_name:
+            raise ValueError(f"RETRIEVAL_EMBEDDER must be 'hashing' or 'module:Class', got {settings.retrieval_embedder!r}")
+        embedder = getattr(importlib.import_module(module_name), class_name)(settings)
+    logger.info(f"🧭 임베딩: {embedder.name} (dim={embedder.dim})")
+    return embedder
@@ -0,0 +1,114 @@
+import os
+import sys
+import json
+import argparse
+import logging
+from typing import Iterator, List, Optional
+
+from app.common.utility.constant.settings import Settings
+from app.domain.model.retrieval_model import IndexDocument
+from app.domain.service.embedder import create_embedder
+from app.domain.service.retrieval_index import IndexWriter
+
+# 오프라인 색인 빌더
+#
+#   cd service/chatbot-service
+#   python -m app.domain.service.index_builder docs/gri docs/tcfd --index ./index
+#
+# .txt/.md 파일은 파일 하나가 문서 하나(첫 줄이 제목), .jsonl은 한 줄에 {"doc_id", "title", "text", "source"} 하나.
+# 이미 있는 색인에는 새 세그먼트로 추가되고, 같은 doc_id는 새 내용으로 대체됩니다.
+# 실행 중인 서비스는 RETRIEVAL_RELOAD_INTERVAL 안에 새 세그먼트를 자동으로 반영합니다.
+
+logger = logging.getLogger("chatbot_service")
+
+TEXT_EXTENSIONS = (".txt", ".md")
+
+
+def _text_document(path: str, root: str) -> Optional[IndexDocument]:
+    with open(path, encoding="utf-8") as file:
+        content = file.read()
+    if not content.strip():
+        return None
+    first_line = content.strip().splitlines()[0]
+    relative = os.path.relpath(path, root) if root != path else os.path.basename(path)
+    return IndexDocument(
+        doc_id=os.path.splitext(relative)[0].replace(os.sep, "/"),
+        title=first_line.lstrip("# ").strip()[:200],
+        text=content,
+        source=relative.replace(os.sep, "/"),
+    )
+
+
+def _jsonl_documents(path: str) -> Iterator[IndexDocument]:
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            record.setdefault("doc_id", record.pop("id", f"{os.path.basename(path)}:{line_number}"))
+            record.setdefault("source", os.path.basename(path))
+            yield IndexDocument(**record)
+
+
+def load_documents(paths: List[str]) -> Iterator[IndexDocument]:
+    """파일/디렉터리 경로들에서 문서 읽기 (디렉터리는 하위까지)"""
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(
+                os.path.join(directory, name)
+                for directory, _, names in os.walk(path)
+                for name in names
+            )
+            root = path
+        else:
+            files, root = [path], path
+        for file_path in files:
+            if file_path.endswith(".jsonl"):
+                yield from _jsonl_documents(file_path)
+            elif file_path.endswith(TEXT_EXTENSIONS):
+                document = _text_document(file_path, root)
+                if document is not None:
+                    yield document
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    settings = Settings()
+    parser = argparse.ArgumentParser(description="챗봇 검색 색인 빌더 (BM25 + 밀집 벡터)")
+    parser.add_argument("inputs", nargs="*", help="문서 파일/디렉터리 (.txt, .md, .jsonl)")
+    parser.add_argument("--index", default=settings.retrieval_index_dir, help="색인 디렉터리 (기본 RETRIEVAL_INDEX_DIR)")
+    parser.add_argument("--batch", type=int, default=1000, help="세그먼트 하나에 넣을 최대 문서 수")
+    parser.add_argument("--compact", action="store_true", help="추가 후 모든 세그먼트를 하나로 병합")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = parse_args(argv)
+    settings = Settings()
+    writer = IndexWriter(
+        args.index,
+        create_embedder(settings),
+        chunk_chars=settings.retrieval_chunk_chars,
+        chunk_overlap=settings.retrieval_chunk_overlap,
+        max_segments=settings.retrieval_max_segments,
+        retain_generations=settings.retrieval_retain_generations,
+        retain_seconds=settings.retrieval_retain_seconds,
+    )
+    batch: List[IndexDocument] = []
+    documents = chunks = 0
+    for document in load_documents(args.inputs):
+        batch.append(document)
+        if len(batch) >= args.batch:
+            chunks += writer.add_documents(batch)["chunks"]
+            documents += len(batch)
+            batch = []
+    if batch:
+        chunks += writer.add_documents(batch)["chunks"]
+        documents += len(batch)
+    if args.compact:
+        writer.compact()
+    print(f"💾 {args.index}: 문서 {documents}개, passage {chunks}개 색인", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,564 @@
+import os
+import re
+import json
+import mmap
+import time
+import fcntl
+import shutil
+import logging
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.domain.model.retrieval_model import IndexDocument, SearchHit
+from app.domain.service.embedder import MAX_TERM_CHARS, Embedder, tokenize
+
+logger = logging.getLogger("chatbot_service")
+
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+# 용어 사전은 고정 폭 유니코드 배열(정렬)로 저장해 np.searchsorted로 찾음 (memory-map 가능)
+TERM_DTYPE = f"<U{MAX_TERM_CHARS}"
+
+# 세그먼트 디렉터리 구성 (모두 쓰고 나면 바뀌지 않음, 삭제 표시는 manifest가 가리키는 별도 파일)
+#   terms.npy        정렬된 용어 (T,)
+#   term_ptr.npy     용어별 posting 구간 (T + 1,) int64
+#   post_docs.npy    posting 문서 번호 (P,) int32 (세그먼트 내 번호)
+#   post_tf.npy      posting 용어 빈도 (P,) float32
+#   doc_len.npy      passage 길이(토큰 수) (N,) float32
+#   vectors.npy      단위 벡터 (N, dim) float32
+#   docs.jsonl       passage 원문/메타데이터, doc_offsets.npy (N + 1,) int64로 바로 찾아 읽음
+#
+# 병합으로 빠진 세그먼트와 대체된 삭제 마스크는 바로 지우지 않고 manifest의 "retired"에 기록했다가,
+# 세대가 retain_generations 이상 지나고 retain_seconds가 흐른 뒤 다음 쓰기 때 지움
+# (이전 manifest를 읽은 워커가 아직 파일을 열기 전일 수 있으므로)
+
+
+def chunk_text(text: str, chunk_chars: int, overlap: int) -> List[str]:
+    """공백을 정리한 뒤 단어 경계에서 chunk_chars 길이로 자르고 overlap만큼 겹치게 나눔"""
+    text = re.sub(r"\s+", " ", text).strip()
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(len(text), start + chunk_chars)
+        if end < len(text):
+            cut = text.rfind(" ", start + chunk_chars // 2, end)
+            if cut > start:
+                end = cut
+        chunks.append(text[start:end].strip())
+        if end >= len(text):
+            break
+        next_start = max(end - overlap, start + 1)
+        space = text.find(" ", next_start, end)
+        start = space + 1 if space != -1 else next_start
+    return [chunk for chunk in chunks if chunk]
+
+
+def _read_manifest(index_dir: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(index_dir, MANIFEST), encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def _write_manifest(index_dir: str, manifest: Dict[str, Any]) -> None:
+    """임시 파일에 쓴 뒤 rename해 읽는 쪽이 반쯤 쓴 manifest를 보지 않도록"""
+    path = os.path.join(index_dir, MANIFEST)
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    os.replace(temporary, path)
+
+
+@contextmanager
+def _index_lock(index_dir: str) -> Iterator[None]:
+    """여러 워커/빌더가 동시에 세그먼트를 추가하지 않도록 파일 잠금"""
+    with open(os.path.join(index_dir, ".lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _posting_positions(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """[start, start + length) 구간들을 이어 붙인 인덱스 배열 (반복문 없이)"""
+    total = int(lengths.sum())
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.repeat(starts, lengths) + (np.arange(total, dtype=np.int64) - offsets)
+
+
+class Segment:
+    """디스크의 세그먼트 하나를 memory-map으로 연 읽기 전용 뷰
+
+    np.load(mmap_mode="r")는 파일을 페이지 캐시에 매핑만 하므로 여는 비용이 거의 없고,
+    같은 색인을 여는 워커들은 같은 물리 페이지를 공유합니다.
+    """
+
+    def __init__(self, path: str, name: str, deleted_file: Optional[str] = None):
+        self.path = path
+        self.name = name
+        load = lambda file_name: np.load(os.path.join(path, file_name), mmap_mode="r")
+        self.terms = load("terms.npy")
+        self.term_ptr = load("term_ptr.npy")
+        self.post_docs = load("post_docs.npy")
+        self.post_tf = load("post_tf.npy")
+        self.doc_len = load("doc_len.npy")
+        self.vectors = load("vectors.npy")
+        self.doc_offsets = load("doc_offsets.npy")
+        self.deleted = load(deleted_file) if deleted_file else None
+        with open(os.path.join(path, "docs.jsonl"), "rb") as file:
+            self._docs = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(file.fileno()).st_size else b""
+
+    @property
+    def size(self) -> int:
+        return len(self.doc_len)
+
+    def lookup(self, terms: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(사전에 있는지, 용어 번호) — 정렬된 사전에서 이진 탐색"""
+        if len(self.terms) == 0:
+            return np.zeros(len(terms), dtype=bool), np.zeros(len(terms), dtype=np.int64)
+        index = np.minimum(np.searchsorted(self.terms, terms), len(self.terms) - 1)
+        return self.terms[index] == terms, index
+
+    def document(self, local: int) -> Dict[str, Any]:
+        return json.loads(self._docs[int(self.doc_offsets[local]):int(self.doc_offsets[local + 1])])
+
+    def documents(self) -> Iterator[Dict[str, Any]]:
+        for local in range(self.size):
+            yield self.document(local)
+
+    def live_mask(self) -> np.ndarray:
+        if self.deleted is None:
+            return np.ones(self.size, dtype=bool)
+        return ~np.asarray(self.deleted, dtype=bool)
+
+
+class _Snapshot:
+    """manifest 한 세대에 해당하는 세그먼트 묶음 (검색 중에는 바뀌지 않음)"""
+
+    def __init__(self, index_dir: str, manifest: Dict[str, Any]):
+        self.generation = manifest["generation"]
+        self.segments = [
+            Segment(os.path.join(index_dir, entry["name"]), entry["name"], entry.get("deleted"))
+            for entry in manifest["segments"]
+        ]
+        sizes = [segment.size for segment in self.segments]
+        self.bases = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64) if sizes else np.zeros(1, dtype=np.int64)
+        self.size = int(self.bases[-1])
+        # 삭제 표시가 없는 세그먼트는 None (posting을 거르지 않음)
+        self.live_masks = [segment.live_mask() if segment.deleted is not None else None for segment in self.segments]
+        self.vectors = [segment.vectors for segment in self.segments]
+        self.dead = np.flatnonzero(np.concatenate([~segment.live_mask() for segment in self.segments])) if sizes else np.zeros(0, dtype=np.int64)
+        self.live = self.size - len(self.dead)
+        # BM25 통계(N, 평균 길이)는 살아 있는 passage만으로 계산
+        total_len = sum(
+            float(np.sum(segment.doc_len if live is None else np.asarray(segment.doc_len)[live]))
+            for segment, live in zip(self.segments, self.live_masks)
+        )
+        self.avgdl = total_len / self.live if self.live else 1.0
+
+    def locate(self, position: int) -> Tuple[Segment, int]:
+        index = int(np.searchsorted(self.bases, position, side="right")) - 1
+        return self.segments[index], position - int(self.bases[index])
+
+
+class RetrievalIndex:
+    """BM25 + 밀집 벡터 하이브리드 검색 (세그먼트 기반, 증분 추가)
+
+    - 문서 추가는 새 세그먼트를 쓰고 manifest를 교체할 뿐 기존 파일을 다시 쓰지 않습니다.
+      같은 doc_id의 이전 passage는 삭제 표시(별도 마스크 파일)로 가리고, 세그먼트가 많아지면 하나로 병합합니다.
+    - BM25 가중치는 질의 시점에 전체 세그먼트 통계(N, df, 평균 길이)로 계산하므로 세그먼트를 나눠도 점수가 같습니다.
+    - 질의 묶음(Q개)은 posting을 한 번에 모아 np.bincount로 (Q, N) BM25 행렬을, 질의 벡터와 문서 행렬의 곱으로
+      (Q, N) 코사인 행렬을 만든 뒤 np.argpartition으로 top-k를 고릅니다.
+    - 다른 프로세스(빌더, 다른 워커)가 추가한 세그먼트는 manifest mtime을 reload_interval마다 확인해 반영합니다.
+    """
+
+    def __init__(
+        self,
+        index_dir: str,
+        embedder: Embedder,
+        k1: float = 1.2,
+        b: float = 0.75,
+        reload_interval: float = 1.0,
+    ):
+        self.index_dir = index_dir
+        self.embedder = embedder
+        self.k1 = k1
+        self.b = b
+        self.reload_interval = reload_interval
+        self._snapshot: Optional[_Snapshot] = None
+        self._manifest_mtime = None
+        self._checked_at = 0.0
+        self._reload_lock = threading.Lock()
+        os.makedirs(index_dir, exist_ok=True)
+        self.reload(force=True)
+
+    # ---- 로드 ----
+
+    def reload(self, force: bool = False) -> None:
+        """manifest가 바뀌었으면 새 세그먼트 묶음으로 교체 (진행 중인 검색은 이전 묶음을 계속 사용)"""
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.reload_interval:
+            return
+        with self._reload_lock:
+            self._checked_at = now
+            try:
+                mtime = os.stat(os.path.join(self.index_dir, MANIFEST)).st_mtime_ns
+            except FileNotFoundError:
+                return
+            if not force and mtime == self._manifest_mtime:
+                return
+            manifest = _read_manifest(self.index_dir)
+            self._check_embedder(manifest)
+            self._snapshot = _Snapshot(self.index_dir, manifest)
+            self._manifest_mtime = mtime
+            logger.info(
+                f"📚 검색 색인 로드: 세대 {self._snapshot.generation}, 세그먼트 {len(self._snapshot.segments)}개, "
+                f"passage {self._snapshot.live}개"
+            )
+
+    def _check_embedder(self, manifest: Dict[str, Any]) -> None:
+        if manifest["embedder"] != self.embedder.name or manifest["dim"] != self.embedder.dim:
+            raise ValueError(
+                f"index was built with {manifest['embedder']} (dim={manifest['dim']}), "
+                f"but the configured embedder is {self.embedder.name} (dim={self.embedder.dim})"
+            )
+
+    # ---- 검색 ----
+
+    def _bm25(self, snapshot: _Snapshot, queries: Sequence[Sequence[str]]) -> np.ndarray:
+        """(Q, N) BM25 점수 — 질의 묶음 전체의 posting을 모아 bincount 한 번으로 누적"""
+        scores_shape = (len(queries), snapshot.size)
+        vocabulary = sorted({term for terms in queries for term in terms})
+        if not vocabulary or snapshot.size == 0:
+            return np.zeros(scores_shape, dtype=np.float32)
+        term_ids = {term: index for index, term in enumerate(vocabulary)}
+        unique_terms = np.array(vocabulary, dtype=TERM_DTYPE)
+
+        # 질의별 용어 빈도 (Q, U)
+        query_tf = np.zeros((len(queries), len(vocabulary)), dtype=np.float32)
+        rows = [row for row, terms in enumerate(queries) for _ in terms]
+        columns = [term_ids[term] for terms in queries for term in terms]
+        np.add.at(query_tf, (rows, columns), 1.0)
+
+        # 세그먼트별로 질의 용어의 posting을 모으고 삭제된 passage의 posting은 버림 (df도 살아 있는 passage 기준)
+        df = np.zeros(len(vocabulary), dtype=np.float64)
+        gathered = []
+        for segment, base, live in zip(snapshot.segments, snapshot.bases, snapshot.live_masks):
+            found, index = segment.lookup(unique_terms)
+            present = np.flatnonzero(found)
+            if len(present) == 0:
+                continue
+            starts = segment.term_ptr[index[present]]
+            lengths = segment.term_ptr[index[present] + 1] - starts
+            positions = _posting_positions(starts, lengths)
+            docs = segment.post_docs[positions]
+            terms = np.repeat(present, lengths)
+            if live is not None:
+                keep = live[docs]
+                positions, docs, terms = positions[keep], docs[keep], terms[keep]
+            df += np.bincount(terms, minlength=len(vocabulary))
+            gathered.append((segment, base, positions, docs, terms))
+        idf = np.log1p((snapshot.live - df + 0.5) / (df + 0.5))
+
+        post_terms, post_docs, post_weights = [], [], []
+        for segment, base, positions, docs, terms in gathered:
+            tf = segment.post_tf[positions]
+            norm = self.k1 * (1.0 - self.b + self.b * segment.doc_len[docs] / snapshot.avgdl)
+            post_terms.append(terms)
+            post_docs.append(docs.astype(np.int64) + base)
+            post_weights.append(idf[terms] * tf * (self.k1 + 1.0) / (tf + norm))
+        if not post_terms:
+            return np.zeros(scores_shape, dtype=np.float32)
+        terms = np.concatenate(post_terms)
+        docs = np.concatenate(post_docs)
+        weights = np.concatenate(post_weights)
+
+        # 질의 q의 점수 행에 (질의 용어 빈도 × posting 가중치)를 누적: flat index = q * N + doc
+        contributions = query_tf[:, terms] * weights
+        flat = (np.arange(len(queries), dtype=np.int64)[:, None] * snapshot.size + docs).ravel()
+        scores = np.bincount(flat, weights=contributions.ravel(), minlength=scores_shape[0] * scores_shape[1])
+        return scores.reshape(scores_shape).astype(np.float32)
+
+    def _dense(self, snapshot: _Snapshot, query_vectors: np.ndarray) -> np.ndarray:
+        """(Q, N) 코사인 유사도 (벡터가 모두 단위 벡터이므로 행렬 곱)"""
+        if snapshot.size == 0:
+            return np.zeros((len(query_vectors), 0), dtype=np.float32)
+        return np.hstack([query_vectors @ vectors.T for vectors in snapshot.vectors])
+
+    def search(self, queries: Sequence[str], top_k: int = 5, alpha: float = 0.5) -> List[List[SearchHit]]:
+        """질의마다 점수 상위 top_k passage (점수 0 이하는 제외)"""
+        self.reload()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.live == 0:
+            return [[] for _ in queries]
+
+        bm25 = self._bm25(snapshot, [tokenize(query) for query in queries])
+        peak = bm25.max(axis=1, keepdims=True)
+        bm25_normalized = np.divide(bm25, peak, out=np.zeros_like(bm25), where=peak > 0)
+        dense = self._dense(snapshot, self.embedder.embed(queries))
+        scores = alpha * bm25_normalized + (1.0 - alpha) * np.maximum(dense, 0.0)
+        scores[:, snapshot.dead] = -np.inf
+
+        k = min(top_k, snapshot.size)
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+        ranked = np.take_along_axis(candidates, order, axis=1)
+
+        results = []
+        for row in range(len(queries)):
+            hits = []
+            for position in ranked[row]:
+                score = float(scores[row, position])
+                if score <= 0.0:
+                    break
+                segment, local = snapshot.locate(int(position))
+                record = segment.document(local)
+                hits.append(SearchHit(
+                    id=record["id"],
+                    doc_id=record["doc_id"],
+                    chunk=record["chunk"],
+                    title=record["title"],
+                    source=record.get("source"),
+                    text=record["text"],
+                    score=round(score, 6),
+                    bm25=round(float(bm25[row, position]), 6),
+                    dense=round(float(dense[row, position]), 6),
+                ))
+            results.append(hits)
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        self.reload()
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {"generation": 0, "segments": [], "passages": 0, "embedder": self.embedder.name, "dim": self.embedder.dim}
+        return {
+            "generation": snapshot.generation,
+            "segments": [{"name": segment.name, "passages": segment.size, "terms": len(segment.terms)} for segment in snapshot.segments],
+            "passages": snapshot.live,
+            "deleted": len(snapshot.dead),
+            "avg_passage_tokens": round(snapshot.avgdl, 2),
+            "embedder": self.embedder.name,
+            "dim": self.embedder.dim,
+        }
+
+
+class IndexWriter:
+    """문서를 passage로 나눠 새 세그먼트로 추가 (오프라인 빌더와 POST /retrieval/documents 공용)"""
+
+    def __init__(
+        self,
+        index_dir: str,
+        embedder: Embedder,
+        chunk_chars: int = 800,
+        chunk_overlap: int = 100,
+        max_segments: int = 8,
+        embed_batch: int = 256,
+        retain_generations: int = 2,
+        retain_seconds: float = 60.0,
+    ):
+        self.index_dir = index_dir
+        self.embedder = embedder
+        self.chunk_chars = chunk_chars
+        self.chunk_overlap = chunk_overlap
+        self.max_segments = max_segments
+        self.embed_batch = embed_batch
+        self.retain_generations = retain_generations
+        self.retain_seconds = retain_seconds
+        os.makedirs(index_dir, exist_ok=True)
+
+    def _new_manifest(self) -> Dict[str, Any]:
+        return {
+            "version": FORMAT_VERSION,
+            "embedder": self.embedder.name,
+            "dim": self.embedder.dim,
+            "generation": 0,
+            "next_segment": 1,
+            "segments": [],
+            "retired": [],
+        }
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.embedder.dim), dtype=np.float32)
+        return np.vstack([
+            self.embedder.embed(texts[start:start + self.embed_batch])
+            for start in range(0, len(texts), self.embed_batch)
+        ]).astype(np.float32)
+
+    def add_documents(self, documents: Sequence[IndexDocument]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        records = []
+        for document in documents:
+            for chunk, text in enumerate(chunk_text(document.text, self.chunk_chars, self.chunk_overlap)):
+                records.append({
+                    "id": f"{document.doc_id}#{chunk}",
+                    "doc_id": document.doc_id,
+                    "chunk": chunk,
+                    "title": document.title,
+                    "source": document.source,
+                    "text": text,
+                })
+        vectors = self._embed([f"{record['title']} {record['text']}" for record in records])
+        doc_ids = {document.doc_id for document in documents}
+
+        with _index_lock(self.index_dir):
+            manifest = _read_manifest(self.index_dir) or self._new_manifest()
+            if manifest["embedder"] != self.embedder.name or manifest["dim"] != self.embedder.dim:
+                raise ValueError(
+                    f"index was built with {manifest['embedder']} (dim={manifest['dim']}), "
+                    f"cannot add documents with {self.embedder.name} (dim={self.embedder.dim})"
+                )
+            manifest["generation"] += 1
+            replaced = self._mark_replaced(manifest, doc_ids)
+            name = None
+            if records:
+                name = f"seg-{manifest['next_segment']:06d}"
+                manifest["next_segment"] += 1
+                _write_segment(os.path.join(self.index_dir, name), records, vectors)
+                manifest["segments"].append({"name": name, "passages": len(records)})
+            compacted = len(manifest["segments"]) > self.max_segments
+            if compacted:
+                self._compact(manifest)
+            self._purge_retired(manifest)
+            _write_manifest(self.index_dir, manifest)
+
+        duration = time.perf_counter() - started
+        logger.info(
+            f"📚 색인 추가: 문서 {len(documents)}개, passage {len(records)}개, 대체 {replaced}개"
+            f"{', 세그먼트 병합' if compacted else ''} ({duration:.2f}s)"
+        )
+        return {
+            "segment": name,
+            "documents": len(documents),
+            "chunks": len(records),
+            "replaced": replaced,
+            "compacted": compacted,
+            "duration_ms": round(duration * 1000, 2),
+        }
+
+    def compact(self) -> None:
+        """모든 세그먼트를 삭제 표시된 passage를 뺀 세그먼트 하나로 병합"""
+        with _index_lock(self.index_dir):
+            manifest = _read_manifest(self.index_dir)
+            if manifest is None or not manifest["segments"]:
+                return
+            manifest["generation"] += 1
+            self._compact(manifest)
+            self._purge_retired(manifest)
+            _write_manifest(self.index_dir, manifest)
+
+    def _mark_replaced(self, manifest: Dict[str, Any], doc_ids: set) -> int:
+        """기존 세그먼트에서 같은 doc_id의 passage에 삭제 표시 (새 마스크 파일을 쓰고 manifest가 가리킴)"""
+        replaced = 0
+        for entry in manifest["segments"]:
+            segment = Segment(os.path.join(self.index_dir, entry["name"]), entry["name"], entry.get("deleted"))
+            deleted = ~segment.live_mask()
+            matches = np.array([record["doc_id"] in doc_ids for record in segment.documents()], dtype=bool)
+            newly = matches & ~deleted
+            if not newly.any():
+                continue
+            replaced += int(newly.sum())
+            # 이전 세대 마스크는 아직 그 manifest로 검색 중인 워커가 있을 수 있으므로 새 파일로 기록
+            mask_name = f"deleted-{manifest['generation']:06d}.npy"
+            np.save(os.path.join(segment.path, mask_name), deleted | newly)
+            if entry.get("deleted"):
+                self._retire(manifest, os.path.join(entry["name"], entry["deleted"]))
+            entry["deleted"] = mask_name
+        return replaced
+
+    def _retire(self, manifest: Dict[str, Any], path: str) -> None:
+        """더 이상 manifest가 가리키지 않는 세그먼트/마스크를 삭제 대기 목록에 기록 (색인 디렉터리 기준 상대 경로)"""
+        manifest.setdefault("retired", []).append({
+            "path": path,
+            "generation": manifest["generation"],
+            "retired_at": time.time(),
+        })
+
+    def _purge_retired(self, manifest: Dict[str, Any]) -> None:
+        """유예 기간(세대 수와 시간)이 지난 세그먼트/마스크 파일 삭제"""
+        now = time.time()
+        kept = []
+        for item in manifest.get("retired", []):
+            expired = (
+                manifest["generation"] - item["generation"] >= self.retain_generations
+                and now - item["retired_at"] >= self.retain_seconds
+            )
+            if not expired:
+                kept.append(item)
+                continue
+            path = os.path.join(self.index_dir, item["path"])
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        manifest["retired"] = kept
+
+    def _compact(self, manifest: Dict[str, Any]) -> None:
+        old_entries = manifest["segments"]
+        records, vectors = [], []
+        for entry in old_entries:
+            segment = Segment(os.path.join(self.index_dir, entry["name"]), entry["name"], entry.get("deleted"))
+            live = segment.live_mask()
+            records.extend(record for record, keep in zip(segment.documents(), live) if keep)
+            vectors.append(np.asarray(segment.vectors)[live])
+        manifest["segments"] = []
+        if records:
+            name = f"seg-{manifest['next_segment']:06d}"
+            manifest["next_segment"] += 1
+            _write_segment(os.path.join(self.index_dir, name), records, np.vstack(vectors))
+            manifest["segments"].append({"name": name, "passages": len(records)})
+        # 이전 manifest를 읽고 아직 세그먼트를 열지 않은 워커가 있을 수 있으므로 바로 지우지 않음
+        # (이미 연 memory-map은 파일이 지워져도 유효)
+        names = {entry["name"] for entry in old_entries}
+        # 세그먼트 디렉터리를 지울 때 그 안의 이전 마스크도 함께 지워지므로 따로 기록하지 않음
+        manifest["retired"] = [
+            item for item in manifest.get("retired", []) if item["path"].split(os.sep, 1)[0] not in names
+        ]
+        for entry in old_entries:
+            self._retire(manifest, entry["name"])
+
+
+def _write_segment(path: str, records: List[Dict[str, Any]], vectors: np.ndarray) -> None:
+    """passage 목록으로 세그먼트 파일 작성 (임시 디렉터리에 다 쓴 뒤 rename)"""
+    postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    doc_len = np.zeros(len(records), dtype=np.float32)
+    for local, record in enumerate(records):
+        counts = Counter(tokenize(f"{record['title']} {record['text']}"))
+        doc_len[local] = sum(counts.values())
+        for term, count in counts.items():
+            postings[term].append((local, count))
+
+    terms = sorted(postings)
+    term_ptr = np.zeros(len(terms) + 1, dtype=np.int64)
+    term_ptr[1:] = np.cumsum([len(postings[term]) for term in terms])
+    post_docs = np.fromiter((local for term in terms for local, _ in postings[term]), dtype=np.int32, count=int(term_ptr[-1]))
+    post_tf = np.fromiter((count for term in terms for _, count in postings[term]), dtype=np.float32, count=int(term_ptr[-1]))
+
+    temporary = f"{path}.tmp"
+    shutil.rmtree(temporary, ignore_errors=True)
+    os.makedirs(temporary)
+    np.save(os.path.join(temporary, "terms.npy"), np.array(terms, dtype=TERM_DTYPE))
+    np.save(os.path.join(temporary, "term_ptr.npy"), term_ptr)
+    np.save(os.path.join(temporary, "post_docs.npy"), post_docs)
+    np.save(os.path.join(temporary, "post_tf.npy"), post_tf)
+    np.save(os.path.join(temporary, "doc_len.npy"), doc_len)
+    np.save(os.path.join(temporary, "vectors.npy"), np.ascontiguousarray(vectors, dtype=np.float32))
+    offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    with open(os.path.join(temporary, "docs.jsonl"), "wb") as file:
+        for local, record in enumerate(records):
+            line = json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+            file.write(line)
+            offsets[local + 1] = offsets[local] + len(line)
+    np.save(os.path.join(temporary, "doc_offsets.npy"), offsets)
+    os.rename(temporary, path)
@@ -1,13 +1,23 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 import os
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from app.common.async_logging import setup_logging, create_log_level_router, require_admin_token
+from app.common.metrics import MetricsMiddleware, create_metrics_router
+from app.common.tracing import setup_tracing, TracingMiddleware
+from app.common.utility.constant.settings import Settings
+from app.domain.service.chat_backend import create_chat_backend
+from app.domain.service.chat_service import ChatStreamService
+from app.domain.service.embedder import create_embedder
+from app.domain.service.retrieval_index import IndexWriter, RetrievalIndex
+from app.router.chat_router import chat_router
+from app.router.retrieval_router import retrieval_router
+
+# 로깅 설정 (QueueHandler + 백그라운드 리스너, JSON lines)
+setup_logging("chatbot-service")
+# 분산 추적 (gateway가 보낸 traceparent를 이어감, TRACE_EXPORTER=none이면 꺼짐)
+setup_tracing("chatbot-service")
 logger = logging.getLogger("chatbot_service")
 
 # FastAPI 앱 생성
@@ -17,6 +27,39 @@ app = FastAPI(
     version="0.1.0"
 )
 
+settings = Settings()
+app.state.settings = settings
+# 검색 색인 (세그먼트를 memory-map으로 열기만 하므로 시작 비용이 거의 없음)
+embedder = create_embedder(settings)
+app.state.retrieval_index = RetrievalIndex(
+    settings.retrieval_index_dir,
+    embedder,
+    k1=settings.retrieval_bm25_k1,
+    b=settings.retrieval_bm25_b,
+    reload_interval=settings.retrieval_reload_interval,
+)
+app.state.index_writer = IndexWriter(
+    settings.retrieval_index_dir,
+    embedder,
+    chunk_chars=settings.retrieval_chunk_chars,
+    chunk_overlap=settings.retrieval_chunk_overlap,
+    max_segments=settings.retrieval_max_segments,
+    retain_generations=settings.retrieval_retain_generations,
+    retain_seconds=settings.retrieval_retain_seconds,
+)
+# 답변 생성 백엔드 (CHAT_BACKEND, 기본 결정적 스텁) + SSE 스트리밍
+app.state.chat_service = ChatStreamService(
+    create_chat_backend(settings),
+    settings,
+    retriever=app.state.retrieval_index if settings.chat_retrieval_enabled else None,
+)
+
+# 요청 수/지연 히스토그램, 이벤트 루프 지연 (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# 요청마다 server span 생성
+app.add_middleware(TracingMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -26,6 +69,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우터 등록
+app.include_router(chat_router)
+app.include_router(retrieval_router)
+
+# 실행 중 로그 레벨 조회/변경
+app.include_router(create_log_level_router(dependencies=[Depends(require_admin_token)]))
+app.include_router(create_metrics_router())
+
 # 헬스 체크 엔드포인트
 @app.get("/health")
 async def health_check():
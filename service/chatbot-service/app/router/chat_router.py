@@ -0,0 +1,41 @@
+import logging
+from typing import Optional
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.domain.model.chat_model import ChatRequest, ChatResponse
+from app.domain.service.chat_service import ChatStreamService
+
+chat_router = APIRouter(prefix="/chat", tags=["chat"])
+
+logger = logging.getLogger("chatbot_service")
+
+# 중간 프록시(nginx 등)가 버퍼링/캐시하지 않도록
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+def get_chat_service(request: Request) -> ChatStreamService:
+    return request.app.state.chat_service
+
+def event_stream_response(service: ChatStreamService, chat_request: ChatRequest) -> StreamingResponse:
+    return StreamingResponse(service.stream(chat_request), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@chat_router.post("/stream", summary="답변을 토큰 단위 SSE로 스트리밍")
+async def chat_stream(chat_request: ChatRequest, request: Request):
+    """start → token* → done 이벤트 (text/event-stream)"""
+    logger.info(f"💬 스트리밍 채팅 요청 (history {len(chat_request.history)}개)")
+    return event_stream_response(get_chat_service(request), chat_request)
+
+@chat_router.get("/stream", summary="답변을 토큰 단위 SSE로 스트리밍 (EventSource용 GET)")
+async def chat_stream_get(
+    request: Request,
+    message: str = Query(..., min_length=1, max_length=8000),
+    conversation_id: Optional[str] = Query(None),
+    max_tokens: Optional[int] = Query(None, ge=1),
+):
+    """브라우저 EventSource는 GET만 지원하므로 질문을 쿼리로 받음"""
+    chat_request = ChatRequest(message=message, conversation_id=conversation_id, max_tokens=max_tokens)
+    return event_stream_response(get_chat_service(request), chat_request)
+
+@chat_router.post("", response_model=ChatResponse, summary="전체 답변을 한 번에 반환")
+async def chat(chat_request: ChatRequest, request: Request):
+    return await get_chat_service(request).complete(chat_request)
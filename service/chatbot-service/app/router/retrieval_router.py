@@ -0,0 +1,42 @@
+import time
+import asyncio
+import logging
+from fastapi import APIRouter, HTTPException, Request
+
+from app.domain.model.retrieval_model import AddDocumentsRequest, AddDocumentsResult, SearchRequest, SearchResponse
+from app.domain.service.retrieval_index import IndexWriter, RetrievalIndex
+
+retrieval_router = APIRouter(prefix="/retrieval", tags=["retrieval"])
+
+logger = logging.getLogger("chatbot_service")
+
+def get_retrieval_index(request: Request) -> RetrievalIndex:
+    return request.app.state.retrieval_index
+
+@retrieval_router.post("/search", response_model=SearchResponse, summary="ESG/GRI/TCFD 문서 passage 검색 (BM25 + 벡터)")
+async def search(search_request: SearchRequest, request: Request):
+    """질의 여러 개를 한 번에 검색 (질의 묶음 전체를 행렬 연산 한 번으로 처리)"""
+    settings = request.app.state.settings
+    if len(search_request.queries) > settings.retrieval_max_batch:
+        raise HTTPException(status_code=400, detail=f"Too many queries (max {settings.retrieval_max_batch})")
+    top_k = min(search_request.top_k or settings.retrieval_top_k, settings.retrieval_max_top_k)
+    alpha = settings.retrieval_alpha if search_request.alpha is None else search_request.alpha
+    started = time.perf_counter()
+    # 수 ms 걸리는 NumPy 연산이므로 이벤트 루프에서 바로 실행
+    results = get_retrieval_index(request).search(search_request.queries, top_k, alpha)
+    return SearchResponse(results=results, took_ms=round((time.perf_counter() - started) * 1000, 3))
+
+@retrieval_router.post("/documents", response_model=AddDocumentsResult, summary="문서 추가 (새 세그먼트로 증분 색인)")
+async def add_documents(add_request: AddDocumentsRequest, request: Request):
+    writer: IndexWriter = request.app.state.index_writer
+    try:
+        # 토큰화/임베딩/파일 쓰기는 워커 스레드에서
+        result = await asyncio.to_thread(writer.add_documents, add_request.documents)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    get_retrieval_index(request).reload(force=True)
+    return result
+
+@retrieval_router.get("/stats", summary="색인 세그먼트/passage 수")
+async def stats(request: Request):
+    return get_retrieval_index(request).stats()
@@ -0,0 +1,71 @@
+import os
+
+import numpy as np
+import pytest
+
+from app.domain.model.retrieval_model import IndexDocument
+from app.domain.service.embedder import HashingEmbedder
+from app.domain.service.retrieval_index import IndexWriter, RetrievalIndex, _read_manifest
+
+
+@pytest.fixture
+def embedder():
+    return HashingEmbedder(64)
+
+
+def make_writer(index_dir, embedder, **options):
+    options.setdefault("max_segments", 100)
+    return IndexWriter(str(index_dir), embedder, **options)
+
+
+def test_bm25_statistics_ignore_deleted_passages(tmp_path, embedder):
+    # 같은 문서를 여러 번 대체해도 살아 있는 passage가 같으면 점수가 같아야 함
+    fresh_dir, replaced_dir = tmp_path / "fresh", tmp_path / "replaced"
+    documents = [
+        IndexDocument(doc_id="a", text="scope one emissions from owned sources"),
+        IndexDocument(doc_id="b", text="water withdrawal by source and stress area"),
+    ]
+    make_writer(fresh_dir, embedder).add_documents(documents)
+    writer = make_writer(replaced_dir, embedder)
+    for _ in range(3):
+        writer.add_documents([IndexDocument(doc_id="a", text="scope one emissions emissions emissions " * 20)])
+    writer.add_documents(documents)
+
+    fresh = RetrievalIndex(str(fresh_dir), embedder)
+    replaced = RetrievalIndex(str(replaced_dir), embedder)
+    assert replaced.stats()["passages"] == fresh.stats()["passages"] == 2
+    assert replaced.stats()["avg_passage_tokens"] == fresh.stats()["avg_passage_tokens"]
+    queries = [["emissions", "source"]]
+    np.testing.assert_allclose(
+        fresh._bm25(fresh._snapshot, queries)[:, :2],
+        replaced._bm25(replaced._snapshot, queries)[:, -2:],
+        rtol=1e-6,
+    )
+
+
+def test_retired_segments_and_masks_are_removed_after_grace_period(tmp_path, embedder):
+    writer = make_writer(tmp_path, embedder, retain_generations=2, retain_seconds=0.0)
+    writer.add_documents([
+        IndexDocument(doc_id="a", text="first version"),
+        IndexDocument(doc_id="b", text="other document"),
+    ])
+    writer.add_documents([IndexDocument(doc_id="a", text="second version")])
+    writer.add_documents([IndexDocument(doc_id="b", text="other document again")])
+
+    # seg-000001의 세대 2 마스크는 세대 3 마스크로 대체되어 삭제 대기 (아직 유예 기간)
+    writer.add_documents([IndexDocument(doc_id="c", text="later document")])
+    superseded = os.path.join("seg-000001", "deleted-000002.npy")
+    assert [item["path"] for item in _read_manifest(str(tmp_path))["retired"]] == [superseded]
+    assert os.path.exists(tmp_path / superseded)
+
+    index = RetrievalIndex(str(tmp_path), embedder)
+    writer.compact()
+    # 병합 직후에는 이전 세그먼트를 지우지 않음 (다른 워커가 이전 manifest로 열 수 있음)
+    writer.add_documents([IndexDocument(doc_id="d", text="another document")])
+    assert os.path.isdir(tmp_path / "seg-000001")
+    assert index.search(["second version"])[0][0].doc_id == "a"
+
+    writer.add_documents([IndexDocument(doc_id="e", text="one more document")])
+    remaining = sorted(name for name in os.listdir(tmp_path) if name.startswith("seg-"))
+    assert remaining == ["seg-000005", "seg-000006", "seg-000007"]
+    assert _read_manifest(str(tmp_path))["retired"] == []
@@ -0,0 +1,15 @@
+import os
+
+
+class Settings:
+    def __init__(self):
+        self.service_port = int(os.getenv("SERVICE_PORT", 8003))
+        self.environment = os.getenv("ENVIRONMENT", "local")
+
+        # GRI 카탈로그 원본(JSON)과 미리 빌드한 바이너리 스냅샷 (스냅샷이 원본과 같은 버전이면 원본을 파싱하지 않음)
+        self.catalog_source = os.getenv("GRI_CATALOG_SOURCE", "./data/gri_catalog.json")
+        self.catalog_snapshot = os.getenv("GRI_CATALOG_SNAPSHOT", "./data/gri_catalog.snapshot")
+        # 카탈로그 응답 Cache-Control max-age (ETag로 재검증)
+        self.catalog_cache_max_age = int(os.getenv("GRI_CACHE_MAX_AGE", 300))
+        self.catalog_search_limit = int(os.getenv("GRI_SEARCH_LIMIT", 20))
+        self.catalog_max_limit = int(os.getenv("GRI_MAX_LIMIT", 200))
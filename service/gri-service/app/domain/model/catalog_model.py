@@ -0,0 +1,71 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class DisclosureSummary(BaseModel):
+    code: str
+    title: str
+
+
+class DisclosureOut(BaseModel):
+    """공시 항목 하나 (예: 305-1 Direct (Scope 1) GHG emissions)"""
+    code: str
+    standard: str
+    title: str
+    topic: str
+    series: str
+    sectors: List[str]
+    requirements: List[str]
+    guidance: Optional[str] = None
+
+
+class StandardOut(BaseModel):
+    """GRI 표준 하나 (예: GRI 305 Emissions)와 소속 공시 항목"""
+    code: str
+    title: str
+    year: Optional[int] = None
+    series: str
+    topic: str
+    disclosures: List[DisclosureSummary]
+
+
+class SectorOut(BaseModel):
+    """섹터 표준 (예: GRI 11 Oil and Gas)과 적용되는 공시 항목 코드"""
+    code: str
+    title: str
+    year: Optional[int] = None
+    disclosures: List[str]
+
+
+class DisclosurePage(BaseModel):
+    total: int
+    offset: int
+    limit: int
+    items: List[DisclosureOut]
+
+
+class SearchHit(BaseModel):
+    code: str
+    standard: str
+    title: str
+    score: float
+    # 일치한 질의어 수 (전부 일치한 결과가 먼저)
+    matched: int
+
+
+class SearchResponse(BaseModel):
+    query: str
+    total: int
+    hits: List[SearchHit]
+
+
+class CatalogInfo(BaseModel):
+    name: str
+    edition: str
+    # 원본 내용 해시 (ETag에 사용, 원본이 바뀌면 달라짐)
+    version: str
+    standards: int
+    disclosures: int
+    sectors: int
+    series: List[str]
+    topics: List[str]
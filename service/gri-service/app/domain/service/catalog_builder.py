@@ -0,0 +1,46 @@
+import sys
+import json
+import hashlib
+import argparse
+import logging
+from typing import List, Optional
+
+from app.common.utility.constant.settings import Settings
+from app.domain.service.gri_catalog import build_catalog, write_snapshot
+
+# GRI 카탈로그 스냅샷 빌더 (Docker 이미지 빌드 때 실행)
+#
+#   cd service/gri-service
+#   python -m app.domain.service.catalog_builder --source ./data/gri_catalog.json --snapshot ./data/gri_catalog.snapshot
+#
+# 원본 JSON을 읽어 색인/응답 JSON까지 계산한 카탈로그를 스냅샷으로 저장합니다.
+# 서비스는 시작할 때 원본 해시가 같은 스냅샷이면 원본을 파싱하지 않고 스냅샷만 읽습니다.
+
+logger = logging.getLogger("gri_service")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    settings = Settings()
+    parser = argparse.ArgumentParser(description="GRI 카탈로그 스냅샷 빌더")
+    parser.add_argument("--source", default=settings.catalog_source, help="카탈로그 원본 JSON (기본 GRI_CATALOG_SOURCE)")
+    parser.add_argument("--snapshot", default=settings.catalog_snapshot, help="스냅샷 경로 (기본 GRI_CATALOG_SNAPSHOT)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = parse_args(argv)
+    with open(args.source, "rb") as file:
+        raw = file.read()
+    digest = hashlib.sha256(raw).digest()
+    catalog = build_catalog(json.loads(raw), digest.hex()[:16])
+    write_snapshot(catalog, args.snapshot, digest)
+    print(
+        f"💾 {args.snapshot}: 표준 {len(catalog.standards)}개, 공시 {len(catalog.disclosures)}개, "
+        f"섹터 {len(catalog.sectors)}개 (version {catalog.version})",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import json
+import logging
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from app.domain.model.catalog_model import CatalogInfo, DisclosureOut, DisclosurePage, SearchResponse, SectorOut, StandardOut
+from app.domain.service.gri_catalog import GriCatalog
+
+catalog_router = APIRouter(prefix="/catalog", tags=["catalog"])
+
+logger = logging.getLogger("gri_service")
+
+def get_catalog(request: Request) -> GriCatalog:
+    return request.app.state.gri_catalog
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match와 ETag 비교 (weak 비교, gateway 압축이 붙인 W/도 같은 것으로 봄)"""
+    if not if_none_match:
+        return False
+    etag = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers(request, etag))
+    return None
+
+def cache_headers(request: Request, etag: str) -> dict:
+    max_age = request.app.state.settings.catalog_cache_max_age
+    return {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+def json_response(request: Request, body: bytes, etag: str) -> Response:
+    """미리 직렬화한 JSON 바이트를 그대로 응답 (pydantic 직렬화 없음)"""
+    return Response(content=body, media_type="application/json", headers=cache_headers(request, etag))
+
+def page_limit(request: Request, limit: Optional[int], default: int) -> int:
+    return min(limit or default, request.app.state.settings.catalog_max_limit)
+
+@catalog_router.get("", response_model=CatalogInfo, summary="GRI 카탈로그 정보 (버전, 개수, 주제/시리즈 목록)")
+async def catalog_info(request: Request):
+    catalog = get_catalog(request)
+    return not_modified(request, catalog.etag) or json_response(request, catalog.info_json, catalog.etag)
+
+@catalog_router.get("/standards", response_model=List[StandardOut], summary="GRI 표준 목록")
+async def list_standards(request: Request, series: Optional[str] = Query(None, description="universal / economic / environmental / social")):
+    catalog = get_catalog(request)
+    return not_modified(request, catalog.etag) or json_response(request, catalog.standards_json(series), catalog.etag)
+
+@catalog_router.get("/standards/{code}", response_model=StandardOut, summary="GRI 표준 조회 (예: 305, GRI 305)")
+async def get_standard(code: str, request: Request):
+    found = get_catalog(request).standard(code)
+    if found is None:
+        raise HTTPException(status_code=404, detail=f"GRI standard {code!r} not found")
+    body, etag = found
+    return not_modified(request, etag) or json_response(request, body, etag)
+
+@catalog_router.get("/sectors", response_model=List[SectorOut], summary="섹터 표준 목록")
+async def list_sectors(request: Request):
+    catalog = get_catalog(request)
+    return not_modified(request, catalog.etag) or json_response(request, catalog.sectors_json(), catalog.etag)
+
+@catalog_router.get("/sectors/{code}", response_model=SectorOut, summary="섹터 표준 조회 (예: 11)")
+async def get_sector(code: str, request: Request):
+    found = get_catalog(request).sector(code)
+    if found is None:
+        raise HTTPException(status_code=404, detail=f"GRI sector standard {code!r} not found")
+    body, etag = found
+    return not_modified(request, etag) or json_response(request, body, etag)
+
+@catalog_router.get("/disclosures", response_model=DisclosurePage, summary="공시 항목 필터 (표준/주제/시리즈/섹터, 페이지)")
+async def list_disclosures(
+    request: Request,
+    standard: Optional[str] = Query(None),
+    topic: Optional[str] = Query(None),
+    series: Optional[str] = Query(None),
+    sector: Optional[str] = Query(None),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1),
+):
+    catalog = get_catalog(request)
+    cached = not_modified(request, catalog.etag)
+    if cached is not None:
+        return cached
+    limit = page_limit(request, limit, request.app.state.settings.catalog_max_limit)
+    ids = catalog.filter(standard=standard, topic=topic, series=series, sector=sector)
+    body = (
+        f'{{"total":{len(ids)},"offset":{offset},"limit":{limit},"items":'.encode()
+        + catalog.disclosures_json(ids[offset:offset + limit])
+        + b"}"
+    )
+    return json_response(request, body, catalog.etag)
+
+@catalog_router.get("/disclosures/{code}", response_model=DisclosureOut, summary="공시 항목 조회 (예: 305-1, GRI 305-1)")
+async def get_disclosure(code: str, request: Request):
+    found = get_catalog(request).disclosure(code)
+    if found is None:
+        raise HTTPException(status_code=404, detail=f"GRI disclosure {code!r} not found")
+    body, etag = found
+    return not_modified(request, etag) or json_response(request, body, etag)
+
+@catalog_router.get("/search", response_model=SearchResponse, summary="공시 항목 키워드 검색 (영문/한글, 코드, 입력 중인 단어는 접두어)")
+async def search(request: Request, q: str = Query(..., min_length=1, max_length=200), limit: Optional[int] = Query(None, ge=1)):
+    catalog = get_catalog(request)
+    cached = not_modified(request, catalog.etag)
+    if cached is not None:
+        return cached
+    total, hits = catalog.search(q, page_limit(request, limit, request.app.state.settings.catalog_search_limit))
+    body = json.dumps({
+        "query": q,
+        "total": total,
+        "hits": [
+            {
+                "code": catalog.disclosures[index].code,
+                "standard": catalog.disclosures[index].standard,
+                "title": catalog.disclosures[index].title,
+                "score": score,
+                "matched": matched,
+            }
+            for index, score, matched in hits
+        ],
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json_response(request, body, catalog.etag)
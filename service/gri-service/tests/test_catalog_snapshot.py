@@ -0,0 +1,37 @@
+import pickle
+
+import pytest
+
+from app.domain.service import gri_catalog
+from app.domain.service.gri_catalog import SNAPSHOT_MAGIC, load_catalog, read_snapshot
+
+SOURCE = b'{"name": "GRI Standards", "edition": "2021", "standards": [], "sectors": []}'
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "gri_catalog.json"
+    path.write_bytes(SOURCE)
+    return str(path)
+
+
+def test_snapshot_from_other_code_version_is_rebuilt(source, tmp_path, monkeypatch):
+    snapshot = str(tmp_path / "gri_catalog.snapshot")
+    assert load_catalog(source, snapshot)[1] == "source"
+    assert load_catalog(source, snapshot)[1] == "snapshot"
+
+    monkeypatch.setattr(gri_catalog, "CODE_VERSION", b"\xff" * gri_catalog.CODE_VERSION_BYTES)
+    assert read_snapshot(snapshot) is None
+    assert load_catalog(source, snapshot)[1] == "source"
+
+
+def test_unloadable_snapshot_is_rebuilt(source, tmp_path):
+    # 예전 코드의 모듈/클래스를 참조하는 pickle (ModuleNotFoundError) 등 어떤 오류든 원본에서 다시 빌드
+    snapshot = tmp_path / "gri_catalog.snapshot"
+    header = SNAPSHOT_MAGIC + gri_catalog.CODE_VERSION + bytes(gri_catalog.DIGEST_BYTES)
+    payload = pickle.dumps(object()).replace(b"builtins", b"missing_")
+    snapshot.write_bytes(header + payload)
+    assert read_snapshot(str(snapshot)) is None
+    snapshot.write_bytes(header + pickle.dumps({"not": "a catalog"}))
+    assert read_snapshot(str(snapshot)) is None
+    assert load_catalog(source, str(snapshot))[1] == "source"
@@ -0,0 +1,205 @@
+import os
+import sys
+import hmac
+import json
+import queue
+import atexit
+import random
+import logging
+import logging.handlers
+from datetime import datetime, timezone
+from typing import Dict, Optional, Sequence
+
+from fastapi import APIRouter, Header, HTTPException
+from pydantic import BaseModel
+
+# gateway와 모든 서비스가 같은 파일을 사용합니다 (app/common/async_logging.py).
+#
+# 이벤트 루프에서는 LogRecord를 큐에 넣기만 하고, 메시지 포맷팅(%-args 병합, JSON 직렬화)과
+# stdout 쓰기는 백그라운드 QueueListener 스레드에서 처리합니다.
+
+_STANDARD_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({})).keys()) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional["NonBlockingQueueHandler"] = None
+
+
+class JsonLineFormatter(logging.Formatter):
+    """LogRecord를 JSON 한 줄로 변환 (extra 필드 포함)"""
+
+    def __init__(self, service_name: str):
+        super().__init__()
+        self.service_name = service_name
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "service": self.service_name,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """로거별 INFO 이하 로그 샘플링 (WARNING 이상은 항상 통과)
+
+    LOG_SAMPLING="gateway_api=0.1,request_logger=0.5" 형식, 가장 긴 로거 이름 접두사가 적용됩니다.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+
+    def rate_for(self, name: str) -> float:
+        best, best_rate = "", 1.0
+        for prefix, rate in self.rates.items():
+            if (name == prefix or name.startswith(prefix + ".")) and len(prefix) > len(best):
+                best, best_rate = prefix, rate
+        return best_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self.rate_for(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """호출 스레드에서는 포맷팅하지 않고 큐에 넣기만 하는 핸들러
+
+    큐가 가득 차면 기다리지 않고 버린 뒤 개수만 셉니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 구현은 여기서 self.format()을 호출하므로, 포맷팅은 리스너 스레드로 미룸
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _parse_mapping(raw: str) -> Dict[str, str]:
+    result = {}
+    for item in raw.split(","):
+        if "=" in item:
+            name, value = item.split("=", 1)
+            result[name.strip()] = value.strip()
+    return result
+
+
+def setup_logging(service_name: str) -> None:
+    """큐 기반 비동기 로깅 구성 (여러 번 호출해도 한 번만 적용)
+
+    - LOG_LEVEL: 루트 레벨 (기본 INFO)
+    - LOG_LEVELS: 로거별 레벨 "gateway_api.route.auth.login=DEBUG,..."
+    - LOG_SAMPLING: 로거별 INFO 이하 샘플링 비율
+    - LOG_FORMAT: json(기본) | text
+    - LOG_QUEUE_SIZE: 큐 최대 길이 (가득 차면 버림)
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    if os.getenv("LOG_FORMAT", "json").lower() == "text":
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    else:
+        formatter = JsonLineFormatter(service_name)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=int(os.getenv("LOG_QUEUE_SIZE", 10000)))
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    sampling = {name: float(rate) for name, rate in _parse_mapping(os.getenv("LOG_SAMPLING", "")).items()}
+    _queue_handler.addFilter(SamplingFilter(sampling))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    # 요청마다 INFO를 남기는 HTTP 클라이언트 로거는 기본 WARNING
+    levels = {"httpx": "WARNING", "httpcore": "WARNING"}
+    levels.update(_parse_mapping(os.getenv("LOG_LEVELS", "")))
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level.upper())
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 로그를 모두 내보내고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def set_log_level(logger_name: str, level: str) -> None:
+    """실행 중 로거 레벨 변경 (빈 이름은 루트 로거)"""
+    logging.getLogger(logger_name or None).setLevel(level.upper())
+
+
+def get_log_levels() -> Dict[str, str]:
+    """명시적으로 레벨이 설정된 로거 목록"""
+    levels = {"root": logging.getLevelName(logging.getLogger().level)}
+    for name, logger in logging.Logger.manager.loggerDict.items():
+        if isinstance(logger, logging.Logger) and logger.level != logging.NOTSET:
+            levels[name] = logging.getLevelName(logger.level)
+    return levels
+
+
+def route_logger(base: str, *parts: str) -> logging.Logger:
+    """라우트별 로거 (예: gateway_api.route.auth.login), 페이로드 덤프는 이 로거가 DEBUG일 때만"""
+    return logging.getLogger(".".join([base, "route", *[part.strip("/").replace("/", ".") for part in parts if part]]))
+
+
+class LogLevelUpdate(BaseModel):
+    logger: str = ""
+    level: str
+
+
+async def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """X-Admin-Token이 ADMIN_TOKEN과 일치해야 통과 (ADMIN_TOKEN 미설정이면 항상 403)
+
+    서비스 포트에 직접 접근할 수 있는 경우에도 로그 레벨(DEBUG 본문 로그)을 바꿀 수 없도록 서비스 라우터에 사용.
+    """
+    expected = os.getenv("ADMIN_TOKEN")
+    if not expected or not x_admin_token or not hmac.compare_digest(x_admin_token.encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+
+def create_log_level_router(dependencies: Sequence = ()) -> APIRouter:
+    """실행 중 로그 레벨 조회/변경용 관리 라우터 (dependencies로 관리자 인증 의존성 지정)"""
+    router = APIRouter(prefix="/admin/log-levels", tags=["Admin"], dependencies=list(dependencies))
+
+    @router.get("", summary="로거별 로그 레벨 조회")
+    async def list_log_levels():
+        return {
+            "levels": get_log_levels(),
+            "dropped": _queue_handler.dropped if _queue_handler else 0,
+        }
+
+    @router.put("", summary="로거 로그 레벨 변경")
+    async def update_log_level(update: LogLevelUpdate):
+        if update.level.upper() not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", "NOTSET"):
+            raise HTTPException(status_code=400, detail=f"Invalid log level: {update.level}")
+        set_log_level(update.logger, update.level)
+        return {"logger": update.logger or "root", "level": update.level.upper()}
+
+    return router
@@ -1,13 +1,16 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 import os
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from app.common.async_logging import setup_logging, create_log_level_router, require_admin_token
+from app.common.metrics import MetricsMiddleware, create_metrics_router
+from app.common.tracing import setup_tracing, TracingMiddleware
+
+# 로깅 설정 (QueueHandler + 백그라운드 리스너, JSON lines)
+setup_logging("grireport-service")
+# 분산 추적 (gateway가 보낸 traceparent를 이어감, TRACE_EXPORTER=none이면 꺼짐)
+setup_tracing("grireport-service")
 logger = logging.getLogger("grireport_service")
 
 # FastAPI 앱 생성
@@ -17,6 +20,12 @@ app = FastAPI(
     version="0.1.0"
 )
 
+# 요청 수/지연 히스토그램, 이벤트 루프 지연 (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# 요청마다 server span 생성
+app.add_middleware(TracingMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -26,6 +35,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 실행 중 로그 레벨 조회/변경
+app.include_router(create_log_level_router(dependencies=[Depends(require_admin_token)]))
+app.include_router(create_metrics_router())
+
 # 헬스 체크 엔드포인트
 @app.get("/health")
 async def health_check():
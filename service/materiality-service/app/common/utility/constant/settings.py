@@ -0,0 +1,32 @@
+import os
+
+
+class Settings:
+    def __init__(self):
+        self.service_port = int(os.getenv("SERVICE_PORT", 8002))
+        self.environment = os.getenv("ENVIRONMENT", "local")
+
+        # 업로드 (멀티파트 본문을 스트리밍으로 받아 파일로 바로 기록)
+        self.upload_dir = os.getenv("UPLOAD_DIR", "./uploads")
+        # 요청 본문 전체 최대 크기 (gateway의 UPLOAD_MAX_BYTES와 맞춰 설정)
+        self.upload_max_bytes = int(os.getenv("UPLOAD_MAX_BYTES", 512 * 1024 * 1024))
+        # 파일이 아닌 폼 필드 하나의 최대 크기
+        self.upload_max_field_bytes = int(os.getenv("UPLOAD_MAX_FIELD_BYTES", 64 * 1024))
+        self.upload_max_files = int(os.getenv("UPLOAD_MAX_FILES", 10))
+        # 이만큼 모이면 워커 스레드에서 디스크에 기록
+        self.upload_write_buffer_bytes = int(os.getenv("UPLOAD_WRITE_BUFFER_BYTES", 1024 * 1024))
+
+        # 중대성 평가 (설문 점수 척도, 회사별 누적 집계를 메모리에 보관할 최대 회사 수)
+        self.assessment_score_min = float(os.getenv("ASSESSMENT_SCORE_MIN", 1.0))
+        self.assessment_score_max = float(os.getenv("ASSESSMENT_SCORE_MAX", 5.0))
+        self.assessment_max_companies = int(os.getenv("ASSESSMENT_MAX_COMPANIES", 1000))
+
+        # 엑셀 수집 (요청한 시트만 read-only로 읽어 열 단위 배치로 기록, 시트별로 워커 프로세스에서 병렬 파싱)
+        self.ingest_dir = os.getenv("INGEST_DIR", os.path.join(self.upload_dir, "ingested"))
+        self.ingest_workers = int(os.getenv("INGEST_WORKERS", min(4, os.cpu_count() or 1)))
+        self.ingest_batch_rows = int(os.getenv("INGEST_BATCH_ROWS", 10000))
+        # 시트 하나의 최대 데이터 행 수 (넘으면 잘라내고 invalid)
+        self.ingest_max_rows = int(os.getenv("INGEST_MAX_ROWS", 1000000))
+        # 시트마다 응답에 담을 셀 오류 수 (개수 집계는 전부)
+        self.ingest_max_errors = int(os.getenv("INGEST_MAX_ERRORS", 50))
+        self.ingest_timeout = float(os.getenv("INGEST_TIMEOUT", 300))
@@ -0,0 +1,74 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List, Literal, Optional
+
+# 영향 중대성(inside-out) 평가 항목과 재무 중대성(outside-in) 평가 항목
+IMPACT_CRITERIA = ("scale", "scope", "irremediability", "likelihood")
+FINANCIAL_CRITERIA = ("magnitude", "probability")
+
+
+class Issue(BaseModel):
+    id: str = Field(..., min_length=1)
+    name: str = ""
+    category: Optional[str] = None  # E / S / G 등
+
+
+class StakeholderSurvey(BaseModel):
+    """이해관계자 설문: 응답자 R명 × 이슈 I개 중요도 (issues 순서, None은 무응답)"""
+    respondent_groups: List[str]
+    scores: List[List[Optional[float]]]
+
+
+class ImpactSurvey(BaseModel):
+    """영향/재무 평가: 평가자 R명 × 이슈 I개 × 항목 C개 (criteria는 IMPACT_CRITERIA/FINANCIAL_CRITERIA 중)"""
+    criteria: List[str]
+    scores: List[List[List[Optional[float]]]]
+
+
+class AssessmentWeights(BaseModel):
+    """점수 가중치 (바꿔도 원응답을 다시 집계하지 않고 최종 결합만 다시 계산)"""
+    # 이해관계자 그룹별 가중치 (없는 그룹은 1.0)
+    stakeholder_groups: Dict[str, float] = Field(default_factory=dict)
+    impact_criteria: Dict[str, float] = Field(default_factory=lambda: {name: 1.0 for name in IMPACT_CRITERIA})
+    financial_criteria: Dict[str, float] = Field(default_factory=lambda: {name: 1.0 for name in FINANCIAL_CRITERIA})
+    # 영향 중대성 중 이해관계자 설문 중요도가 차지하는 비율
+    stakeholder_share: float = Field(0.3, ge=0.0, le=1.0)
+    # 이중 중대성 점수: 두 관점 중 큰 값(max) 또는 평균(mean)
+    combine: Literal["max", "mean"] = "max"
+    # 영향/재무 중 하나라도 이 값 이상이면 중대 이슈 (0~1 정규화 점수 기준)
+    threshold: float = Field(0.5, ge=0.0, le=1.0)
+
+
+class SurveyUpload(BaseModel):
+    issues: List[Issue] = Field(..., min_length=1)
+    stakeholder: Optional[StakeholderSurvey] = None
+    impact: Optional[ImpactSurvey] = None
+    weights: Optional[AssessmentWeights] = None
+    # replace: 기존 응답을 버리고 새로 집계 / append: 같은 이슈 목록에 응답 추가 (누적 합계만 갱신)
+    mode: Literal["replace", "append"] = "replace"
+
+
+class IssueScore(BaseModel):
+    id: str
+    name: str
+    category: Optional[str] = None
+    stakeholder: Optional[float] = None
+    impact: Optional[float] = None
+    financial: Optional[float] = None
+    score: Optional[float] = None
+    rank: Optional[int] = None
+    category_rank: Optional[int] = None
+    material: bool
+    responses: int
+
+
+class AssessmentResult(BaseModel):
+    company_id: str
+    issues: int
+    stakeholder_respondents: int
+    impact_respondents: int
+    material_issues: int
+    weights: AssessmentWeights
+    results: List[IssueScore]
+    # 가중치만 바뀌어 누적 집계를 재사용했는지
+    reused_aggregates: bool
+    duration_ms: float
@@ -0,0 +1,57 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional
+
+
+class IngestRequest(BaseModel):
+    """업로드된 워크북에서 읽을 시트 (지정한 시트만 파싱)"""
+    sheet_names: List[str] = Field(..., min_length=1)
+    # 헤더(열 이름)가 있는 행 번호 (1부터), 그 아래부터 데이터
+    header_row: int = Field(1, ge=1)
+    # 시트별 필수 열 (없으면 해당 시트는 invalid)
+    required_columns: Dict[str, List[str]] = Field(default_factory=dict)
+
+
+class ColumnSchema(BaseModel):
+    name: str
+    type: Literal["number", "string", "datetime", "boolean"]
+    nulls: int
+    errors: int
+
+
+class CellError(BaseModel):
+    """열 타입으로 바꿀 수 없는 셀 (결과에서는 null로 저장)"""
+    row: int
+    column: str
+    value: Any = None
+    expected: str
+
+
+class SheetIngestion(BaseModel):
+    sheet: str
+    status: Literal["ok", "invalid", "missing", "failed"]
+    message: Optional[str] = None
+    rows: int = 0
+    columns: List[ColumnSchema] = Field(default_factory=list)
+    # 배치 안의 시트 디렉터리 이름, 열 단위 배치 파일 (npz: "<열 번호>.values" / "<열 번호>.valid")
+    dataset: Optional[str] = None
+    batches: int = 0
+    error_count: int = 0
+    errors: List[CellError] = Field(default_factory=list)
+    duration_ms: float = 0.0
+    rows_per_sec: float = 0.0
+    # 이 시트를 파싱한 워커 프로세스의 최대 RSS
+    peak_rss_mb: Optional[float] = None
+
+
+class IngestionResult(BaseModel):
+    upload_id: str
+    # 이번 수집 결과의 ID (서버 경로 대신 반환, 시트 결과는 batch_id + dataset으로 찾음)
+    batch_id: str
+    file: str
+    sheets: List[SheetIngestion]
+    total_rows: int
+    duration_ms: float
+    rows_per_sec: float
+    # 워커 중 가장 큰 RSS / 서비스 프로세스 자체의 최대 RSS
+    worker_peak_rss_mb: Optional[float] = None
+    service_peak_rss_mb: Optional[float] = None
@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+
+from app.domain.model.ingestion_model import IngestionResult
+
+
+class UploadedFile(BaseModel):
+    """디스크에 기록된 업로드 파일 하나"""
+    field: str
+    filename: Optional[str] = None
+    content_type: Optional[str] = None
+    size: int
+    sha256: str
+    path: str
+
+
+class UploadResult(BaseModel):
+    upload_id: str
+    files: List[UploadedFile]
+    fields: Dict[str, str]
+    bytes_received: int
+    duration_ms: float
+    sheet_name: Optional[str] = None
+    # sheet_names를 지정한 경우 업로드 직후 수행한 시트 파싱 결과
+    ingestion: Optional[IngestionResult] = None
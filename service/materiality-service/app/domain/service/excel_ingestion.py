@@ -0,0 +1,474 @@
+import os
+import re
+import json
+import glob
+import time
+import uuid
+import shutil
+import hashlib
+import asyncio
+import logging
+import resource
+import threading
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time as time_of_day
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.common.utility.constant.settings import Settings
+from app.domain.model.ingestion_model import IngestionResult, IngestRequest, SheetIngestion
+
+logger = logging.getLogger("materiality_service")
+
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm")
+SCHEMA_FILE = "schema.json"
+
+
+class IngestionNotFound(Exception):
+    """upload_id에 해당하는 엑셀 파일이 없음"""
+
+
+class _PeakMemorySampler:
+    """파싱하는 동안 현재 프로세스 RSS를 주기적으로 읽어 최댓값 기록 (리눅스 /proc, 그 외 OS는 ru_maxrss)
+
+    풀 워커는 여러 작업에 재사용되므로 ru_maxrss(프로세스 생애 최댓값) 대신 작업 구간의 RSS를 샘플링합니다.
+    """
+
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.peak_kb = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def _rss_kb() -> Optional[int]:
+        try:
+            with open("/proc/self/status") as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        return int(line.split()[1])
+        except OSError:
+            return None
+        return None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            rss = self._rss_kb()
+            if rss is None:
+                return
+            self.peak_kb = max(self.peak_kb, rss)
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "_PeakMemorySampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        rss = self._rss_kb()
+        if rss is not None:
+            self.peak_kb = max(self.peak_kb, rss)
+        elif self.peak_kb == 0:
+            self.peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    @property
+    def peak_mb(self) -> float:
+        return round(self.peak_kb / 1024, 1)
+
+
+# ---- 셀 값 → 열 타입 ----
+
+_NUMBER_TEXT = re.compile(r"^[+-]?(\d{1,3}(,\d{3})+|\d+)(\.\d+)?%?$|^[+-]?\.\d+%?$")
+
+
+def _value_kind(value: Any) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, (datetime, date)):
+        return "datetime"
+    if isinstance(value, str) and _NUMBER_TEXT.match(value.strip()):
+        # "1,234" / "12.5%" 같은 숫자 텍스트는 숫자로 봄
+        return "number"
+    return "string"
+
+
+def infer_column_types(rows: List[Tuple[Any, ...]], width: int) -> List[str]:
+    """첫 배치에서 열마다 null이 아닌 값의 다수 타입 (전부 비었으면 string)"""
+    types = []
+    for column in range(width):
+        kinds = Counter(
+            _value_kind(row[column]) for row in rows
+            if column < len(row) and row[column] is not None and row[column] != ""
+        )
+        types.append(kinds.most_common(1)[0][0] if kinds else "string")
+    return types
+
+
+def _to_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        text = value.strip()
+        if _NUMBER_TEXT.match(text):
+            number = float(text.replace(",", "").rstrip("%"))
+            return number / 100 if text.endswith("%") else number
+    return None
+
+
+def _to_datetime(value: Any) -> Optional[np.datetime64]:
+    if isinstance(value, (datetime, date)):
+        return np.datetime64(value, "ms")
+    if isinstance(value, str):
+        try:
+            return np.datetime64(datetime.fromisoformat(value.strip()), "ms")
+        except ValueError:
+            return None
+    return None
+
+
+def _to_boolean(value: Any) -> Optional[bool]:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in ("true", "false", "y", "n", "yes", "no"):
+        return value.strip().lower() in ("true", "y", "yes")
+    return None
+
+
+def _to_string(value: Any) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (datetime, date, time_of_day)):
+        return value.isoformat()
+    return str(value)
+
+
+def build_column(values: List[Any], column_type: str) -> Tuple[np.ndarray, np.ndarray, List[int]]:
+    """(값 배열, valid 마스크, 변환 실패한 행 번호들) — 깨끗한 숫자 열은 np.array 한 번으로 변환"""
+    present = np.array([value is not None and value != "" for value in values], dtype=bool)
+    if column_type == "number":
+        try:
+            array = np.array([value if ok else np.nan for value, ok in zip(values, present)], dtype=np.float64)
+            if not any(isinstance(value, (bool, str)) for value in values):
+                return array, present, []
+        except (TypeError, ValueError):
+            pass
+        converted = [_to_number(value) if ok else None for value, ok in zip(values, present)]
+        array = np.array([np.nan if number is None else number for number in converted], dtype=np.float64)
+    elif column_type == "datetime":
+        converted = [_to_datetime(value) if ok else None for value, ok in zip(values, present)]
+        array = np.array([np.datetime64("NaT") if stamp is None else stamp for stamp in converted], dtype="datetime64[ms]")
+    elif column_type == "boolean":
+        converted = [_to_boolean(value) if ok else None for value, ok in zip(values, present)]
+        array = np.array([bool(flag) for flag in converted], dtype=bool)
+    else:
+        converted = [_to_string(value) if ok else None for value, ok in zip(values, present)]
+        array = np.array(["" if text is None else text for text in converted], dtype=str)
+    valid = np.array([item is not None for item in converted], dtype=bool)
+    failed = np.flatnonzero(present & ~valid).tolist()
+    return array, valid, failed
+
+
+def _header_names(header: Tuple[Any, ...]) -> Tuple[List[str], List[str]]:
+    """(열 이름, 경고) — 빈 이름은 column_N, 중복 이름은 _2, _3… 접미사"""
+    names, warnings, seen = [], [], Counter()
+    for index, value in enumerate(header):
+        name = _to_string(value).strip() if value not in (None, "") else f"column_{index + 1}"
+        seen[name] += 1
+        if seen[name] > 1:
+            warnings.append(f"duplicate column {name!r}")
+            name = f"{name}_{seen[name]}"
+        names.append(name)
+    return names, warnings
+
+
+def sheet_dataset(sheet: str) -> str:
+    """시트 이름 → 배치 안의 디렉터리 이름 (slug만으로는 "A B"/"A_B"가 겹치므로 이름 해시를 붙임)"""
+    slug = re.sub(r"[^0-9A-Za-z가-힣_-]+", "_", sheet).strip("_") or "sheet"
+    digest = hashlib.sha1(sheet.encode("utf-8")).hexdigest()[:8]
+    return f"{slug}-{digest}"
+
+
+def parse_sheet(
+    path: str,
+    sheet: str,
+    output_dir: str,
+    header_row: int = 1,
+    batch_rows: int = 10000,
+    max_rows: int = 1000000,
+    max_errors: int = 50,
+    required_columns: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """워커 프로세스에서 시트 하나를 read-only 모드로 한 행씩 읽어 열 단위 배치(npz)로 기록
+
+    openpyxl read_only 모드는 시트 XML을 스트리밍으로 읽으므로 워크북 전체를 메모리에 올리지 않고,
+    batch_rows행씩만 모아 타입이 있는 NumPy 열로 바꿔 바로 파일로 씁니다.
+    반환값은 SheetIngestion 필드 dict (프로세스 간에 pickle로 전달).
+    """
+    from openpyxl import load_workbook
+
+    started = time.perf_counter()
+    result: Dict[str, Any] = {"sheet": sheet, "status": "ok"}
+    with _PeakMemorySampler() as memory:
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            if sheet not in workbook.sheetnames:
+                result.update(status="missing", message=f"sheet {sheet!r} not found (available: {workbook.sheetnames})")
+            else:
+                result.update(_parse_rows(
+                    workbook[sheet].iter_rows(min_row=header_row, values_only=True),
+                    os.path.join(output_dir, sheet_dataset(sheet)),
+                    header_row, batch_rows, max_rows, max_errors, required_columns or [],
+                ))
+        except Exception as e:
+            result.update(status="failed", message=f"{type(e).__name__}: {str(e)}")
+        finally:
+            workbook.close()
+    duration = time.perf_counter() - started
+    rows = result.get("rows", 0)
+    result.update(
+        duration_ms=round(duration * 1000, 2),
+        rows_per_sec=round(rows / duration, 1) if duration > 0 else 0.0,
+        peak_rss_mb=memory.peak_mb,
+    )
+    return result
+
+
+def _parse_rows(
+    rows: Iterator[Tuple[Any, ...]],
+    sheet_dir: str,
+    header_row: int,
+    batch_rows: int,
+    max_rows: int,
+    max_errors: int,
+    required_columns: List[str],
+) -> Dict[str, Any]:
+    header = next(rows, None)
+    if header is None:
+        return {"status": "invalid", "message": "sheet is empty"}
+    # 뒤쪽 빈 헤더 칸은 버림
+    width = len(header)
+    while width and header[width - 1] in (None, ""):
+        width -= 1
+    names, warnings = _header_names(header[:width])
+    missing = [name for name in required_columns if name not in names]
+    if missing:
+        return {"status": "invalid", "message": f"missing required columns: {missing}"}
+
+    os.makedirs(sheet_dir, exist_ok=True)
+    types: Optional[List[str]] = None
+    nulls = np.zeros(width, dtype=np.int64)
+    error_counts = np.zeros(width, dtype=np.int64)
+    errors: List[Dict[str, Any]] = []
+    batch: List[Tuple[Any, ...]] = []
+    row_numbers: List[int] = []
+    batches = total = 0
+    status, message = "ok", "; ".join(warnings) or None
+
+    def flush() -> None:
+        nonlocal types, batches
+        if types is None:
+            types = infer_column_types(batch, width)
+        arrays = {}
+        for column in range(width):
+            values = [row[column] if column < len(row) else None for row in batch]
+            array, valid, failed = build_column(values, types[column])
+            arrays[f"{column}.values"] = array
+            arrays[f"{column}.valid"] = valid
+            nulls[column] += int((~valid).sum()) - len(failed)
+            error_counts[column] += len(failed)
+            for offset in failed[:max(0, max_errors - len(errors))]:
+                errors.append({
+                    "row": row_numbers[offset],
+                    "column": names[column],
+                    "value": _to_string(values[offset]),
+                    "expected": types[column],
+                })
+        np.savez(os.path.join(sheet_dir, f"batch-{batches:05d}.npz"), **arrays)
+        batches += 1
+
+    for row_number, row in enumerate(rows, start=header_row + 1):
+        # 완전히 빈 행은 건너뜀 (서식만 남은 행 등)
+        if all(value is None or value == "" for value in row[:width]):
+            continue
+        if total >= max_rows:
+            status, message = "invalid", f"more than {max_rows} rows, truncated"
+            break
+        batch.append(row[:width])
+        row_numbers.append(row_number)
+        total += 1
+        if len(batch) >= batch_rows:
+            flush()
+            batch, row_numbers = [], []
+    if batch or types is None:
+        flush()
+
+    columns = [
+        {"name": name, "type": column_type, "nulls": int(nulls[index]), "errors": int(error_counts[index])}
+        for index, (name, column_type) in enumerate(zip(names, types))
+    ]
+    with open(os.path.join(sheet_dir, SCHEMA_FILE), "w", encoding="utf-8") as file:
+        json.dump({"columns": columns, "rows": total, "batches": batches}, file, ensure_ascii=False)
+    return {
+        "status": status,
+        "message": message,
+        "rows": total,
+        "columns": columns,
+        "dataset": os.path.basename(sheet_dir),
+        "batches": batches,
+        "error_count": int(error_counts.sum()),
+        "errors": errors,
+    }
+
+
+def read_batches(sheet_dir: str) -> Iterator[Dict[str, Tuple[np.ndarray, np.ndarray]]]:
+    """파싱된 시트의 열 단위 배치를 하나씩 읽기 ({열 이름: (값, valid 마스크)})"""
+    with open(os.path.join(sheet_dir, SCHEMA_FILE), encoding="utf-8") as file:
+        schema = json.load(file)
+    names = [column["name"] for column in schema["columns"]]
+    for index in range(schema["batches"]):
+        with np.load(os.path.join(sheet_dir, f"batch-{index:05d}.npz")) as batch:
+            yield {
+                name: (batch[f"{column}.values"], batch[f"{column}.valid"])
+                for column, name in enumerate(names)
+            }
+
+
+class ExcelIngestionService:
+    """업로드된 워크북에서 요청한 시트만 워커 프로세스 풀로 병렬 파싱/검증
+
+    openpyxl 파싱은 순수 파이썬(CPU)이라 스레드로는 GIL 때문에 병렬화되지 않으므로 프로세스 풀을 쓰고,
+    시트마다 별도 작업으로 나눠 동시에 읽습니다 (각 워커가 같은 파일을 read-only로 열고 자기 시트만 읽음).
+    이벤트 루프는 결과를 기다리기만 하며, 워커는 부모의 스레드/락을 물려받지 않도록 spawn으로 띄웁니다.
+    풀은 수집 요청마다 따로 만들어 시간 초과 시 그 요청의 워커만 종료하고, 동시에 파싱하는 시트 수는
+    요청 전체에서 INGEST_WORKERS개로 제한합니다.
+    """
+
+    def __init__(self, settings: Settings):
+        self.upload_dir = settings.upload_dir
+        self.output_root = settings.ingest_dir
+        self.workers = settings.ingest_workers
+        self.batch_rows = settings.ingest_batch_rows
+        self.max_rows = settings.ingest_max_rows
+        self.max_errors = settings.ingest_max_errors
+        self.timeout = settings.ingest_timeout
+        # 요청 전체에서 동시에 파싱 중인 시트 수 상한
+        self._slots = asyncio.Semaphore(self.workers)
+        # 진행 중인 요청별 풀 (서비스 종료 시 정리)
+        self._executors: Set[ProcessPoolExecutor] = set()
+
+    def _executor(self, sheets: int) -> ProcessPoolExecutor:
+        executor = ProcessPoolExecutor(
+            max_workers=max(1, min(self.workers, sheets)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._executors.add(executor)
+        return executor
+
+    def close(self) -> None:
+        for executor in list(self._executors):
+            self._terminate(executor)
+
+    def _terminate(self, executor: ProcessPoolExecutor) -> None:
+        """요청 하나의 풀을 실행 중인 워커까지 종료 (shutdown은 대기 중 작업만 취소하므로 프로세스를 직접 종료)"""
+        processes = list((getattr(executor, "_processes", None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        self._executors.discard(executor)
+
+    async def _parse(self, executor: ProcessPoolExecutor, *args) -> Dict[str, Any]:
+        async with self._slots:
+            return await asyncio.get_running_loop().run_in_executor(executor, parse_sheet, *args)
+
+    def batch_path(self, upload_id: str, batch_id: str, dataset: Optional[str] = None) -> str:
+        """응답의 batch_id/dataset → 열 단위 배치 디렉터리 (read_batches 입력)"""
+        if not re.fullmatch(r"[0-9a-f]{32}", upload_id) or not re.fullmatch(r"[0-9a-f]{32}", batch_id):
+            raise IngestionNotFound(f"invalid batch {upload_id}/{batch_id}")
+        path = os.path.join(self.output_root, upload_id, batch_id)
+        if dataset is not None:
+            if os.path.basename(dataset) != dataset or dataset in (".", ".."):
+                raise IngestionNotFound(f"invalid dataset {dataset!r}")
+            path = os.path.join(path, dataset)
+        if not os.path.isdir(path):
+            raise IngestionNotFound(f"no ingested batch {upload_id}/{batch_id}")
+        return path
+
+    def find_workbook(self, upload_id: str) -> str:
+        """UPLOAD_DIR에서 upload_id로 저장된 첫 번째 엑셀 파일"""
+        if not re.fullmatch(r"[0-9a-f]{32}", upload_id):
+            raise IngestionNotFound(f"invalid upload id {upload_id!r}")
+        for path in sorted(glob.glob(os.path.join(self.upload_dir, f"{upload_id}-*"))):
+            if path.lower().endswith(EXCEL_EXTENSIONS):
+                return path
+        raise IngestionNotFound(f"no Excel file (.xlsx/.xlsm) for upload {upload_id}")
+
+    async def ingest(self, upload_id: str, request: IngestRequest, path: Optional[str] = None) -> IngestionResult:
+        path = path or self.find_workbook(upload_id)
+        # 수집할 때마다 새 배치 디렉터리 (이전 결과를 덮어쓰거나 남은 배치 파일과 섞이지 않음)
+        batch_id = uuid.uuid4().hex
+        output_dir = os.path.join(self.output_root, upload_id, batch_id)
+        sheet_names = list(dict.fromkeys(request.sheet_names))
+        started = time.perf_counter()
+        executor = self._executor(len(sheet_names))
+        tasks = [
+            self._parse(
+                executor,
+                path, sheet, output_dir, request.header_row,
+                self.batch_rows, self.max_rows, self.max_errors,
+                request.required_columns.get(sheet),
+            )
+            for sheet in sheet_names
+        ]
+        outcomes = None
+        try:
+            outcomes = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), self.timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⏱️ 엑셀 수집 {upload_id} 시간 초과, 워커 종료")
+            raise
+        finally:
+            if outcomes is None:
+                # 시간 초과/취소: wait_for는 기다림만 취소하므로 이 요청의 워커를 종료하고 쓰던 배치도 삭제
+                self._terminate(executor)
+                shutil.rmtree(output_dir, ignore_errors=True)
+            else:
+                executor.shutdown(wait=False)
+                self._executors.discard(executor)
+        sheets = []
+        for sheet, outcome in zip(sheet_names, outcomes):
+            if isinstance(outcome, BaseException):
+                # 워커 프로세스가 죽은 경우(메모리 부족 등), 풀은 요청마다 새로 만들므로 다른 요청에 영향 없음
+                logger.error(f"❌ 시트 {sheet} 파싱 실패: {type(outcome).__name__}: {str(outcome)}")
+                sheets.append(SheetIngestion(sheet=sheet, status="failed", message=str(outcome)))
+            else:
+                sheets.append(SheetIngestion(**outcome))
+
+        duration = time.perf_counter() - started
+        total_rows = sum(sheet.rows for sheet in sheets)
+        worker_peaks = [sheet.peak_rss_mb for sheet in sheets if sheet.peak_rss_mb is not None]
+        result = IngestionResult(
+            upload_id=upload_id,
+            batch_id=batch_id,
+            file=os.path.basename(path),
+            sheets=sheets,
+            total_rows=total_rows,
+            duration_ms=round(duration * 1000, 2),
+            rows_per_sec=round(total_rows / duration, 1) if duration > 0 else 0.0,
+            worker_peak_rss_mb=max(worker_peaks) if worker_peaks else None,
+            service_peak_rss_mb=round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        )
+        logger.info(
+            f"📑 엑셀 수집 {upload_id}: 시트 {len(sheets)}개, {total_rows}행, {result.rows_per_sec:.0f}행/s, "
+            f"워커 최대 {result.worker_peak_rss_mb}MB"
+        )
+        return result
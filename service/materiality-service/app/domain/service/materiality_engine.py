@@ -0,0 +1,335 @@
+import copy
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.domain.model.assessment_model import (
+    FINANCIAL_CRITERIA,
+    IMPACT_CRITERIA,
+    AssessmentResult,
+    AssessmentWeights,
+    Issue,
+    IssueScore,
+)
+
+logger = logging.getLogger("materiality_service")
+
+CRITERIA = IMPACT_CRITERIA + FINANCIAL_CRITERIA
+_CRITERION_INDEX = {name: index for index, name in enumerate(CRITERIA)}
+
+
+class InvalidSurvey(Exception):
+    """설문 행렬 크기/항목이 이슈 목록과 맞지 않음"""
+
+
+def _weighted_mean(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """(I, K) 행렬의 행별 가중 평균 (NaN 칸은 가중치에서 제외, 전부 NaN이면 NaN)"""
+    valid = ~np.isnan(values)
+    total = valid @ weights
+    weighted = np.where(valid, values, 0.0) @ weights
+    return np.divide(weighted, total, out=np.full(len(values), np.nan), where=total > 0)
+
+
+def _rank(scores: np.ndarray) -> np.ndarray:
+    """내림차순 순위 (1부터, NaN은 0)"""
+    ranks = np.zeros(len(scores), dtype=np.int64)
+    valid = np.flatnonzero(~np.isnan(scores))
+    order = valid[np.argsort(-scores[valid], kind="stable")]
+    ranks[order] = np.arange(1, len(order) + 1)
+    return ranks
+
+
+def _category_rank(scores: np.ndarray, categories: np.ndarray) -> np.ndarray:
+    """카테고리 안에서의 내림차순 순위 (카테고리, -점수 순 lexsort 한 번)"""
+    ranks = np.zeros(len(scores), dtype=np.int64)
+    valid = np.flatnonzero(~np.isnan(scores))
+    if len(valid) == 0:
+        return ranks
+    order = valid[np.lexsort((-scores[valid], categories[valid]))]
+    sorted_categories = categories[order]
+    starts = np.flatnonzero(np.r_[True, sorted_categories[1:] != sorted_categories[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    ranks[order] = np.arange(len(order)) - group_start + 1
+    return ranks
+
+
+class SurveyAggregate:
+    """원응답에서 가중치와 무관한 합계/개수만 보관
+
+    - 이해관계자 설문: 그룹 G개 × 이슈 I개의 점수 합계와 응답 수
+    - 영향/재무 평가: 이슈 I개 × 항목 C개의 점수 합계와 응답 수
+    응답을 추가하면 합계만 더하고(원응답은 보관하지 않음), 가중치가 바뀌면 이 합계로 최종 결합만 다시 계산합니다.
+    """
+
+    def __init__(self, issues: Sequence[Issue]):
+        self.issues = list(issues)
+        self.issue_ids = [issue.id for issue in self.issues]
+        if len(set(self.issue_ids)) != len(self.issue_ids):
+            raise InvalidSurvey("issue ids must be unique")
+        size = len(self.issues)
+        self.groups: List[str] = []
+        self.group_sums = np.zeros((0, size))
+        self.group_counts = np.zeros((0, size))
+        self.criteria_sums = np.zeros((size, len(CRITERIA)))
+        self.criteria_counts = np.zeros((size, len(CRITERIA)))
+        self.stakeholder_respondents = 0
+        self.impact_respondents = 0
+        self.categories = np.array([issue.category or "" for issue in self.issues])
+
+    def copy(self) -> "SurveyAggregate":
+        """누적 합계 복사본 (append 요청을 복사본에 적용하고 전부 성공하면 교체)"""
+        clone = copy.copy(self)
+        clone.groups = list(self.groups)
+        for name in ("group_sums", "group_counts", "criteria_sums", "criteria_counts"):
+            setattr(clone, name, getattr(self, name).copy())
+        return clone
+
+    def _group_indices(self, groups: Sequence[str]) -> np.ndarray:
+        """응답자별 그룹 번호 (처음 보는 그룹은 행을 추가)"""
+        names, inverse = np.unique(np.asarray(groups, dtype=str), return_inverse=True)
+        known = {name: index for index, name in enumerate(self.groups)}
+        new = [name for name in names if name not in known]
+        if new:
+            self.groups.extend(new)
+            padding = np.zeros((len(new), len(self.issues)))
+            self.group_sums = np.vstack([self.group_sums, padding])
+            self.group_counts = np.vstack([self.group_counts, padding])
+            known = {name: index for index, name in enumerate(self.groups)}
+        return np.array([known[name] for name in names], dtype=np.int64)[inverse.ravel()]
+
+    def add_stakeholder(self, groups: Sequence[str], scores: np.ndarray) -> None:
+        """(R, I) 중요도 행렬 누적 (NaN = 무응답)"""
+        scores = np.asarray(scores, dtype=np.float64)
+        if scores.ndim != 2 or scores.shape[1] != len(self.issues) or scores.shape[0] != len(groups):
+            raise InvalidSurvey(
+                f"stakeholder scores must be respondents({len(groups)}) x issues({len(self.issues)}), got {scores.shape}"
+            )
+        rows = self._group_indices(groups)
+        # 응답자 → 그룹 one-hot (G, R) 행렬 곱 한 번으로 그룹별 합계/응답 수
+        one_hot = np.zeros((len(self.groups), len(rows)))
+        one_hot[rows, np.arange(len(rows))] = 1.0
+        valid = ~np.isnan(scores)
+        self.group_sums += one_hot @ np.where(valid, scores, 0.0)
+        self.group_counts += one_hot @ valid
+        self.stakeholder_respondents += len(rows)
+
+    def add_impact(self, criteria: Sequence[str], scores: np.ndarray) -> None:
+        """(R, I, C) 영향/재무 평가 텐서 누적 (criteria는 C개 열 이름)"""
+        unknown = [name for name in criteria if name not in _CRITERION_INDEX]
+        if unknown:
+            raise InvalidSurvey(f"unknown criteria {unknown}, expected one of {list(CRITERIA)}")
+        scores = np.asarray(scores, dtype=np.float64)
+        if scores.ndim != 3 or scores.shape[1] != len(self.issues) or scores.shape[2] != len(criteria):
+            raise InvalidSurvey(
+                f"impact scores must be raters x issues({len(self.issues)}) x criteria({len(criteria)}), got {scores.shape}"
+            )
+        columns = [_CRITERION_INDEX[name] for name in criteria]
+        valid = ~np.isnan(scores)
+        np.add.at(self.criteria_sums, (slice(None), columns), np.where(valid, scores, 0.0).sum(axis=0))
+        np.add.at(self.criteria_counts, (slice(None), columns), valid.sum(axis=0))
+        self.impact_respondents += scores.shape[0]
+
+
+class MaterialityEngine:
+    """이중 중대성 점수 계산 (모든 단계가 이슈 × 그룹/항목 행렬 연산)
+
+    stakeholder = 그룹별 평균을 그룹 가중치로 평균 (응답자가 많은 그룹이 결과를 독식하지 않도록)
+    impact      = (1 - stakeholder_share) × 영향 항목 가중 평균 + stakeholder_share × stakeholder
+    financial   = 재무 항목 가중 평균
+    score       = max(impact, financial) 또는 평균, 모든 값은 [score_min, score_max] 척도를 0~1로 정규화
+    """
+
+    def __init__(self, score_min: float = 1.0, score_max: float = 5.0):
+        self.score_min = score_min
+        self.score_max = score_max
+
+    def _normalize(self, values: np.ndarray) -> np.ndarray:
+        return np.clip((values - self.score_min) / (self.score_max - self.score_min), 0.0, 1.0)
+
+    def score(self, aggregate: SurveyAggregate, weights: AssessmentWeights) -> Dict[str, np.ndarray]:
+        group_means = np.divide(
+            aggregate.group_sums, aggregate.group_counts,
+            out=np.full(aggregate.group_sums.shape, np.nan), where=aggregate.group_counts > 0,
+        )
+        group_weights = np.array([weights.stakeholder_groups.get(name, 1.0) for name in aggregate.groups])
+        stakeholder = self._normalize(_weighted_mean(group_means.T, group_weights))
+
+        criteria_means = np.divide(
+            aggregate.criteria_sums, aggregate.criteria_counts,
+            out=np.full(aggregate.criteria_sums.shape, np.nan), where=aggregate.criteria_counts > 0,
+        )
+        impact_weights = np.array([weights.impact_criteria.get(name, 0.0) for name in CRITERIA[:len(IMPACT_CRITERIA)]])
+        financial_weights = np.array([weights.financial_criteria.get(name, 0.0) for name in CRITERIA[len(IMPACT_CRITERIA):]])
+        impact_only = self._normalize(_weighted_mean(criteria_means[:, :len(IMPACT_CRITERIA)], impact_weights))
+        financial = self._normalize(_weighted_mean(criteria_means[:, len(IMPACT_CRITERIA):], financial_weights))
+
+        # 한쪽만 있으면 있는 값을 사용
+        share = weights.stakeholder_share
+        impact = np.where(
+            np.isnan(impact_only), stakeholder,
+            np.where(np.isnan(stakeholder), impact_only, (1.0 - share) * impact_only + share * stakeholder),
+        )
+        if weights.combine == "max":
+            # fmax는 한쪽이 NaN이면 다른 쪽 값을 사용
+            score = np.fmax(impact, financial)
+        else:
+            both = np.vstack([impact, financial])
+            counts = (~np.isnan(both)).sum(axis=0)
+            score = np.divide(np.nansum(both, axis=0), counts, out=np.full(len(impact), np.nan), where=counts > 0)
+        material = (np.nan_to_num(impact, nan=-1.0) >= weights.threshold) | (np.nan_to_num(financial, nan=-1.0) >= weights.threshold)
+        return {
+            "stakeholder": stakeholder,
+            "impact": impact,
+            "financial": financial,
+            "score": score,
+            "rank": _rank(score),
+            "category_rank": _category_rank(score, aggregate.categories),
+            "material": material,
+            "responses": aggregate.group_counts.sum(axis=0) + aggregate.criteria_counts.max(axis=1),
+        }
+
+
+class CompanyAssessment:
+    """회사 하나의 누적 집계와 마지막 점수 (같은 가중치로 다시 조회하면 계산하지 않음)"""
+
+    def __init__(self, company_id: str, aggregate: SurveyAggregate, weights: AssessmentWeights):
+        self.company_id = company_id
+        self.aggregate = aggregate
+        self.weights = weights
+        self.scores: Optional[Dict[str, np.ndarray]] = None
+        self.lock = threading.Lock()
+
+
+class MaterialityStore:
+    """회사별 평가 상태 (프로세스 메모리, 오래 안 쓴 회사부터 max_companies개를 넘으면 제거)"""
+
+    def __init__(self, engine: MaterialityEngine, max_companies: int = 1000):
+        self.engine = engine
+        self.max_companies = max_companies
+        self._companies: "OrderedDict[str, CompanyAssessment]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, company_id: str) -> Optional[CompanyAssessment]:
+        with self._lock:
+            assessment = self._companies.get(company_id)
+            if assessment is not None:
+                self._companies.move_to_end(company_id)
+            return assessment
+
+    def delete(self, company_id: str) -> bool:
+        with self._lock:
+            return self._companies.pop(company_id, None) is not None
+
+    def _put(self, assessment: CompanyAssessment) -> None:
+        with self._lock:
+            self._companies[assessment.company_id] = assessment
+            self._companies.move_to_end(assessment.company_id)
+            while len(self._companies) > self.max_companies:
+                evicted, _ = self._companies.popitem(last=False)
+                logger.info(f"🧹 중대성 평가 캐시에서 {evicted} 제거")
+
+    def load(
+        self,
+        company_id: str,
+        issues: Sequence[Issue],
+        stakeholder: Optional[Tuple[Sequence[str], np.ndarray]] = None,
+        impact: Optional[Tuple[Sequence[str], np.ndarray]] = None,
+        weights: Optional[AssessmentWeights] = None,
+        append: bool = False,
+        limit: Optional[int] = None,
+    ) -> AssessmentResult:
+        """설문 행렬을 집계해 저장하고 점수 계산 (append면 같은 이슈 목록의 기존 합계에 누적)
+
+        이해관계자/영향 중 하나라도 잘못되면 아무것도 반영하지 않도록 복사본에 누적한 뒤 성공하면 교체합니다.
+        """
+        started = time.perf_counter()
+        existing = self.get(company_id) if append else None
+        if existing is not None:
+            if existing.aggregate.issue_ids != [issue.id for issue in issues]:
+                raise InvalidSurvey("append requires the same issue list as the existing assessment")
+            assessment = existing
+        else:
+            assessment = CompanyAssessment(company_id, SurveyAggregate(issues), weights or AssessmentWeights())
+        with assessment.lock:
+            aggregate = assessment.aggregate.copy() if existing is not None else assessment.aggregate
+            if stakeholder is not None:
+                aggregate.add_stakeholder(*stakeholder)
+            if impact is not None:
+                aggregate.add_impact(*impact)
+            weights = weights or assessment.weights
+            scores = self.engine.score(aggregate, weights)
+            assessment.aggregate, assessment.weights, assessment.scores = aggregate, weights, scores
+            self._put(assessment)
+            return self._result(assessment, started, reused=False, limit=limit)
+
+    def rescore(self, company_id: str, weights: AssessmentWeights, limit: Optional[int] = None) -> Optional[AssessmentResult]:
+        """가중치만 바꿔 다시 계산 (누적 합계 재사용, 원응답 재집계 없음)"""
+        started = time.perf_counter()
+        assessment = self.get(company_id)
+        if assessment is None:
+            return None
+        with assessment.lock:
+            if assessment.scores is None or weights != assessment.weights:
+                assessment.weights = weights
+                assessment.scores = self.engine.score(assessment.aggregate, weights)
+            return self._result(assessment, started, reused=True, limit=limit)
+
+    def result(self, company_id: str, limit: Optional[int] = None) -> Optional[AssessmentResult]:
+        assessment = self.get(company_id)
+        if assessment is None:
+            return None
+        with assessment.lock:
+            return self._result(assessment, time.perf_counter(), reused=True, limit=limit)
+
+    @staticmethod
+    def _result(assessment: CompanyAssessment, started: float, reused: bool, limit: Optional[int] = None) -> AssessmentResult:
+        """순위순 결과 (limit이 있으면 상위 limit개만 응답 객체로 만듦)"""
+        scores = assessment.scores
+        aggregate = assessment.aggregate
+        # 순위 없는(점수 NaN) 이슈는 맨 뒤로
+        rank = scores["rank"]
+        order = np.argsort(np.where(rank > 0, rank, len(rank) + 1), kind="stable")[:limit]
+        rounded = {
+            name: np.round(scores[name][order], 6).tolist()
+            for name in ("stakeholder", "impact", "financial", "score")
+        }
+        rank = rank[order].tolist()
+        category_rank = scores["category_rank"][order].tolist()
+        material = scores["material"][order].tolist()
+        responses = scores["responses"][order].astype(np.int64).tolist()
+
+        def value(name: str, index: int) -> Optional[float]:
+            number = rounded[name][index]
+            return None if number != number else number  # NaN → None
+
+        results = [
+            IssueScore(
+                id=aggregate.issues[issue_index].id,
+                name=aggregate.issues[issue_index].name,
+                category=aggregate.issues[issue_index].category,
+                stakeholder=value("stakeholder", index),
+                impact=value("impact", index),
+                financial=value("financial", index),
+                score=value("score", index),
+                rank=rank[index] or None,
+                category_rank=category_rank[index] or None,
+                material=material[index],
+                responses=responses[index],
+            )
+            for index, issue_index in enumerate(order.tolist())
+        ]
+        return AssessmentResult(
+            company_id=assessment.company_id,
+            issues=len(aggregate.issues),
+            stakeholder_respondents=aggregate.stakeholder_respondents,
+            impact_respondents=aggregate.impact_respondents,
+            material_issues=int(scores["material"].sum()),
+            weights=assessment.weights,
+            results=results,
+            reused_aggregates=reused,
+            duration_ms=round((time.perf_counter() - started) * 1000, 3),
+        )
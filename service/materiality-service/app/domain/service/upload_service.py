@@ -0,0 +1,230 @@
+import os
+import re
+import time
+import uuid
+import asyncio
+import hashlib
+import logging
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import MultipartParser, parse_options_header
+
+from app.common.utility.constant.settings import Settings
+from app.domain.model.upload_model import UploadedFile, UploadResult
+
+logger = logging.getLogger("materiality_service")
+
+_SAFE_EXTENSION = re.compile(r"^\.[A-Za-z0-9]{1,10}$")
+
+
+class UploadTooLarge(Exception):
+    """요청 본문/폼 필드/파일 수가 한도를 넘음"""
+
+
+class InvalidUpload(Exception):
+    """멀티파트 형식이 아니거나 깨진 본문"""
+
+
+class _FilePart:
+    """디스크에 쓰는 중인 파일 파트 (쓰기는 write_buffer_bytes 단위로 모아 워커 스레드에서)"""
+
+    def __init__(self, field: str, filename: Optional[str], content_type: Optional[str], path: str):
+        self.field = field
+        self.filename = filename
+        self.content_type = content_type
+        self.path = path
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+        self.buffer: List[bytes] = []
+        self.buffered = 0
+        self.file = None
+
+    async def open(self) -> None:
+        self.file = await asyncio.to_thread(open, self.path, "wb")
+
+    def append(self, data: bytes) -> None:
+        self.size += len(data)
+        self.sha256.update(data)
+        self.buffer.append(data)
+        self.buffered += len(data)
+
+    async def flush(self) -> None:
+        if self.buffer:
+            data = b"".join(self.buffer)
+            self.buffer.clear()
+            self.buffered = 0
+            await asyncio.to_thread(self.file.write, data)
+
+    async def close(self) -> None:
+        if self.file is not None:
+            await self.flush()
+            await asyncio.to_thread(self.file.close)
+            self.file = None
+
+    def result(self) -> UploadedFile:
+        return UploadedFile(
+            field=self.field,
+            filename=self.filename,
+            content_type=self.content_type,
+            size=self.size,
+            sha256=self.sha256.hexdigest(),
+            path=self.path,
+        )
+
+
+class StreamingMultipartReceiver:
+    """multipart/form-data 본문을 청크 단위로 파싱해 파일 파트를 디스크에 바로 기록
+
+    Starlette의 request.form()처럼 파일 전체를 임시 파일/메모리에 모은 뒤 넘기지 않고,
+    받는 즉시 SHA-256을 계산하며 UPLOAD_DIR에 기록합니다. 메모리 사용량은 청크 하나와
+    쓰기 버퍼(UPLOAD_WRITE_BUFFER_BYTES) 수준이고, 디스크 쓰기는 이벤트 루프 밖 스레드에서 합니다.
+    실패하면 기록하던 파일을 지웁니다.
+    """
+
+    def __init__(self, settings: Settings):
+        self.upload_dir = settings.upload_dir
+        self.max_bytes = settings.upload_max_bytes
+        self.max_field_bytes = settings.upload_max_field_bytes
+        self.max_files = settings.upload_max_files
+        self.write_buffer_bytes = settings.upload_write_buffer_bytes
+        os.makedirs(self.upload_dir, exist_ok=True)
+
+    def _file_path(self, upload_id: str, index: int, filename: Optional[str]) -> str:
+        extension = os.path.splitext(os.path.basename(filename or ""))[1]
+        if not _SAFE_EXTENSION.match(extension):
+            extension = ""
+        return os.path.join(self.upload_dir, f"{upload_id}-{index}{extension.lower()}")
+
+    async def receive(
+        self,
+        content_type: str,
+        chunks: AsyncIterator[bytes],
+        sheet_name: Optional[str] = None,
+    ) -> UploadResult:
+        media_type, params = parse_options_header(content_type or "")
+        boundary = params.get(b"boundary")
+        if media_type != b"multipart/form-data" or not boundary:
+            raise InvalidUpload("multipart/form-data with boundary required")
+
+        started = time.perf_counter()
+        upload_id = uuid.uuid4().hex
+        # 파서 콜백(동기)은 이벤트만 쌓고, 파일 열기/쓰기는 아래 루프에서 await
+        events: List[Tuple[str, bytes]] = []
+        header_field = bytearray()
+        header_value = bytearray()
+
+        def on_header_field(data: bytes, start: int, end: int) -> None:
+            header_field.extend(data[start:end])
+
+        def on_header_value(data: bytes, start: int, end: int) -> None:
+            header_value.extend(data[start:end])
+
+        def on_header_end() -> None:
+            events.append(("header", bytes(header_field).lower() + b"\0" + bytes(header_value)))
+            header_field.clear()
+            header_value.clear()
+
+        parser = MultipartParser(boundary, callbacks={
+            "on_part_begin": lambda: events.append(("begin", b"")),
+            "on_header_field": on_header_field,
+            "on_header_value": on_header_value,
+            "on_header_end": on_header_end,
+            "on_headers_finished": lambda: events.append(("headers_done", b"")),
+            "on_part_data": lambda data, start, end: events.append(("data", data[start:end])),
+            "on_part_end": lambda: events.append(("end", b"")),
+        })
+
+        files: List[_FilePart] = []
+        fields: Dict[str, str] = {}
+        headers: Dict[bytes, bytes] = {}
+        current: Optional[_FilePart] = None
+        field_name: Optional[str] = None
+        field_value = bytearray()
+        received = 0
+
+        try:
+            async for chunk in chunks:
+                received += len(chunk)
+                if received > self.max_bytes:
+                    raise UploadTooLarge(f"request body exceeds {self.max_bytes} bytes")
+                try:
+                    parser.write(chunk)
+                except MultipartParseError as e:
+                    raise InvalidUpload(str(e))
+                for kind, data in events:
+                    if kind == "begin":
+                        headers = {}
+                        current, field_name = None, None
+                        field_value.clear()
+                    elif kind == "header":
+                        name, _, value = data.partition(b"\0")
+                        headers[name] = value
+                    elif kind == "headers_done":
+                        _, disposition = parse_options_header(headers.get(b"content-disposition", b""))
+                        name = disposition.get(b"name", b"").decode("utf-8", errors="replace")
+                        filename = disposition.get(b"filename")
+                        if filename is not None:
+                            if len(files) >= self.max_files:
+                                raise UploadTooLarge(f"more than {self.max_files} files")
+                            part_type = headers.get(b"content-type")
+                            current = _FilePart(
+                                name,
+                                filename.decode("utf-8", errors="replace"),
+                                part_type.decode("latin-1") if part_type else None,
+                                self._file_path(upload_id, len(files), filename.decode("utf-8", errors="replace")),
+                            )
+                            files.append(current)
+                            await current.open()
+                        else:
+                            field_name = name
+                    elif kind == "data":
+                        if current is not None:
+                            current.append(data)
+                            if current.buffered >= self.write_buffer_bytes:
+                                await current.flush()
+                        else:
+                            field_value.extend(data)
+                            if len(field_value) > self.max_field_bytes:
+                                raise UploadTooLarge(f"form field exceeds {self.max_field_bytes} bytes")
+                    elif kind == "end":
+                        if current is not None:
+                            await current.close()
+                            current = None
+                        elif field_name is not None:
+                            fields[field_name] = field_value.decode("utf-8", errors="replace")
+                            field_name = None
+                events.clear()
+            try:
+                parser.finalize()
+            except MultipartParseError as e:
+                raise InvalidUpload(str(e))
+            if current is not None:
+                # 닫는 경계 없이 본문이 끝남
+                raise InvalidUpload("multipart body ended before the closing boundary")
+        except BaseException:
+            for part in files:
+                await part.close()
+                await asyncio.to_thread(_remove_quietly, part.path)
+            raise
+
+        duration = time.perf_counter() - started
+        logger.info(
+            "📥 업로드 수신 완료 %s: 파일 %d개, %.1fMB, %.2fs",
+            upload_id, len(files), received / 1048576, duration,
+        )
+        return UploadResult(
+            upload_id=upload_id,
+            files=[part.result() for part in files],
+            fields=fields,
+            bytes_received=received,
+            duration_ms=round(duration * 1000, 2),
+            sheet_name=sheet_name,
+        )
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -1,21 +1,58 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 import logging
 import os
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from app.common.async_logging import setup_logging, create_log_level_router, require_admin_token
+from app.common.metrics import MetricsMiddleware, create_metrics_router
+from app.common.tracing import setup_tracing, TracingMiddleware
+from app.common.utility.constant.settings import Settings
+from app.domain.service.upload_service import StreamingMultipartReceiver
+from app.domain.service.materiality_engine import MaterialityEngine, MaterialityStore
+from app.domain.service.excel_ingestion import ExcelIngestionService
+from app.router.upload_router import upload_router
+from app.router.assessment_router import assessment_router
+from app.router.ingestion_router import ingestion_router
+
+# 로깅 설정 (QueueHandler + 백그라운드 리스너, JSON lines)
+setup_logging("materiality-service")
+# 분산 추적 (gateway가 보낸 traceparent를 이어감, TRACE_EXPORTER=none이면 꺼짐)
+setup_tracing("materiality-service")
 logger = logging.getLogger("materiality_service")
 
+settings = Settings()
+# 엑셀 시트 파싱 (수집 요청마다 워커 프로세스 풀 생성)
+ingestion_service = ExcelIngestionService(settings)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    ingestion_service.close()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="Materiality Service",
     description="Materiality service for ESG Mate",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
+)
+
+app.state.settings = settings
+# 업로드는 스트리밍으로 받아 UPLOAD_DIR에 바로 기록
+app.state.upload_receiver = StreamingMultipartReceiver(settings)
+# 회사별 중대성 평가 누적 집계 (가중치 변경 시 재집계 없이 재계산)
+app.state.materiality_store = MaterialityStore(
+    MaterialityEngine(settings.assessment_score_min, settings.assessment_score_max),
+    max_companies=settings.assessment_max_companies,
 )
+app.state.ingestion_service = ingestion_service
+
+# 요청 수/지연 히스토그램, 이벤트 루프 지연 (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# 요청마다 server span 생성
+app.add_middleware(TracingMiddleware)
 
 # CORS 설정
 app.add_middleware(
@@ -26,6 +63,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우터 등록
+app.include_router(upload_router)
+app.include_router(assessment_router)
+app.include_router(ingestion_router)
+
+# 실행 중 로그 레벨 조회/변경
+app.include_router(create_log_level_router(dependencies=[Depends(require_admin_token)]))
+app.include_router(create_metrics_router())
+
 # 헬스 체크 엔드포인트
 @app.get("/health")
 async def health_check():
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+
+import numpy as np
+
+from app.domain.model.assessment_model import AssessmentResult, AssessmentWeights, SurveyUpload
+from app.domain.service.materiality_engine import InvalidSurvey, MaterialityStore
+
+assessment_router = APIRouter(prefix="/assessment", tags=["assessment"])
+
+logger = logging.getLogger("materiality_service")
+
+def get_materiality_store(request: Request) -> MaterialityStore:
+    return request.app.state.materiality_store
+
+def load_survey(store: MaterialityStore, company_id: str, upload: SurveyUpload, limit: Optional[int]) -> AssessmentResult:
+    """JSON 설문을 NumPy 행렬로 바꿔 집계 (None → NaN)"""
+    try:
+        stakeholder = None
+        if upload.stakeholder is not None:
+            stakeholder = (upload.stakeholder.respondent_groups, np.array(upload.stakeholder.scores, dtype=np.float64))
+        impact = None
+        if upload.impact is not None:
+            impact = (upload.impact.criteria, np.array(upload.impact.scores, dtype=np.float64))
+    except ValueError as e:
+        # 행마다 길이가 다른 경우
+        raise InvalidSurvey(f"survey scores must be a rectangular matrix: {str(e)}")
+    return store.load(
+        company_id,
+        upload.issues,
+        stakeholder=stakeholder,
+        impact=impact,
+        weights=upload.weights,
+        append=upload.mode == "append",
+        limit=limit,
+    )
+
+@assessment_router.post("/{company_id}/surveys", response_model=AssessmentResult, summary="설문 행렬 집계 및 이중 중대성 점수 계산")
+async def upload_surveys(
+    company_id: str,
+    upload: SurveyUpload,
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, description="상위 N개 이슈만 반환"),
+):
+    try:
+        # 수천 × 수천 행렬 연산이므로 이벤트 루프 밖에서
+        result = await asyncio.to_thread(load_survey, get_materiality_store(request), company_id, upload, limit)
+    except InvalidSurvey as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    logger.info(
+        f"📊 {company_id} 중대성 평가: 이슈 {result.issues}개, 이해관계자 {result.stakeholder_respondents}명, "
+        f"평가자 {result.impact_respondents}명 ({result.duration_ms}ms)"
+    )
+    return result
+
+@assessment_router.put("/{company_id}/weights", response_model=AssessmentResult, summary="가중치 변경 후 재계산 (누적 집계 재사용)")
+async def update_weights(
+    company_id: str,
+    weights: AssessmentWeights,
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1),
+):
+    result = get_materiality_store(request).rescore(company_id, weights, limit)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"No assessment for company {company_id}")
+    return result
+
+@assessment_router.get("/{company_id}", response_model=AssessmentResult, summary="마지막 평가 결과 조회")
+async def get_assessment(company_id: str, request: Request, limit: Optional[int] = Query(None, ge=1)):
+    result = get_materiality_store(request).result(company_id, limit)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"No assessment for company {company_id}")
+    return result
+
+@assessment_router.delete("/{company_id}", summary="회사 평가 상태 삭제")
+async def delete_assessment(company_id: str, request: Request):
+    if not get_materiality_store(request).delete(company_id):
+        raise HTTPException(status_code=404, detail=f"No assessment for company {company_id}")
+    return {"deleted": company_id}
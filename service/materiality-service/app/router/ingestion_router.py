@@ -0,0 +1,25 @@
+import asyncio
+import logging
+from fastapi import APIRouter, HTTPException, Request
+
+from app.domain.model.ingestion_model import IngestionResult, IngestRequest
+from app.domain.service.excel_ingestion import ExcelIngestionService, IngestionNotFound
+
+ingestion_router = APIRouter(prefix="/ingest", tags=["ingestion"])
+
+logger = logging.getLogger("materiality_service")
+
+def get_ingestion_service(request: Request) -> ExcelIngestionService:
+    return request.app.state.ingestion_service
+
+@ingestion_router.post("/{upload_id}", response_model=IngestionResult, summary="업로드된 워크북에서 지정한 시트 파싱/검증")
+async def ingest(upload_id: str, body: IngestRequest, request: Request):
+    """시트마다 워커 프로세스에서 read-only로 읽어 열 단위 배치로 기록 (셀 오류는 결과에 행/열과 함께 보고)"""
+    service = get_ingestion_service(request)
+    try:
+        return await service.ingest(upload_id, body)
+    except IngestionNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except asyncio.TimeoutError:
+        logger.error(f"❌ 엑셀 수집 시간 초과: {upload_id}")
+        raise HTTPException(status_code=504, detail=f"Ingestion timed out after {service.timeout}s")
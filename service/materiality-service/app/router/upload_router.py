@@ -0,0 +1,46 @@
+import asyncio
+import logging
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+
+from app.domain.model.ingestion_model import IngestRequest
+from app.domain.model.upload_model import UploadResult
+from app.domain.service.excel_ingestion import EXCEL_EXTENSIONS
+from app.domain.service.upload_service import StreamingMultipartReceiver, UploadTooLarge, InvalidUpload
+
+upload_router = APIRouter(prefix="/upload", tags=["upload"])
+
+logger = logging.getLogger("materiality_service")
+
+def get_upload_receiver(request: Request) -> StreamingMultipartReceiver:
+    return request.app.state.upload_receiver
+
+@upload_router.post("", response_model=UploadResult, summary="엑셀 등 파일 업로드 (multipart 스트리밍 수신)")
+async def upload(
+    request: Request,
+    sheet_name: Optional[str] = Query(None),
+    sheet_names: Optional[List[str]] = Query(None, description="지정하면 받은 엑셀 파일에서 이 시트들을 바로 파싱"),
+):
+    """multipart/form-data 본문을 메모리에 모으지 않고 받으면서 UPLOAD_DIR에 기록"""
+    receiver = get_upload_receiver(request)
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > receiver.max_bytes:
+        raise HTTPException(status_code=413, detail=f"Request body too large (max {receiver.max_bytes} bytes)")
+    try:
+        result = await receiver.receive(request.headers.get("content-type", ""), request.stream(), sheet_name)
+    except UploadTooLarge as e:
+        logger.warning(f"⚠️ 업로드 거부: {str(e)}")
+        raise HTTPException(status_code=413, detail=str(e))
+    except InvalidUpload as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if sheet_names:
+        workbook = next((file for file in result.files if file.path.lower().endswith(EXCEL_EXTENSIONS)), None)
+        if workbook is None:
+            raise HTTPException(status_code=400, detail="sheet_names given but no Excel file (.xlsx/.xlsm) was uploaded")
+        service = request.app.state.ingestion_service
+        try:
+            result.ingestion = await service.ingest(result.upload_id, IngestRequest(sheet_names=sheet_names), workbook.path)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail=f"Ingestion timed out after {service.timeout}s")
+    return result
@@ -0,0 +1,90 @@
+import asyncio
+import os
+
+import pytest
+from openpyxl import Workbook
+
+from app.common.utility.constant.settings import Settings
+from app.domain.model.ingestion_model import IngestRequest
+from app.domain.service.excel_ingestion import ExcelIngestionService, read_batches, sheet_dataset
+
+UPLOAD_ID = "0" * 32
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setenv("UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setenv("INGEST_DIR", str(tmp_path / "ingested"))
+    monkeypatch.setenv("INGEST_WORKERS", "2")
+    service = ExcelIngestionService(Settings())
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    workbook = Workbook()
+    workbook.active.title = "A B"
+    workbook.active.append(["issue", "score"])
+    workbook.active.append(["climate", 4.5])
+    other = workbook.create_sheet("A_B")
+    other.append(["issue", "score"])
+    other.append(["safety", 3.0])
+    other.append(["ethics", 2.0])
+    path = tmp_path / f"{UPLOAD_ID}-survey.xlsx"
+    workbook.save(path)
+    return str(path)
+
+
+def test_sheet_dataset_keeps_similar_names_apart():
+    assert sheet_dataset("A B") != sheet_dataset("A_B")
+    assert sheet_dataset("A B") == sheet_dataset("A B")
+
+
+def test_ingest_returns_batch_id_instead_of_server_path(service, workbook_path):
+    result = asyncio.run(service.ingest(UPLOAD_ID, IngestRequest(sheet_names=["A B", "A_B"]), workbook_path))
+
+    assert [sheet.rows for sheet in result.sheets] == [1, 2]
+    assert all(not os.path.isabs(sheet.dataset) for sheet in result.sheets)
+    assert service.output_root not in result.model_dump_json()
+    sheet_dir = service.batch_path(UPLOAD_ID, result.batch_id, result.sheets[1].dataset)
+    (batch,) = list(read_batches(sheet_dir))
+    assert batch["issue"][0].tolist() == ["safety", "ethics"]
+
+
+def test_timeout_terminates_workers_and_discards_batch(service, workbook_path):
+    service.timeout = 0.001
+    workers = []
+    terminate = service._terminate
+
+    def record_and_terminate(executor):
+        workers.extend(executor._processes.values())
+        terminate(executor)
+
+    service._terminate = record_and_terminate
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(service.ingest(UPLOAD_ID, IngestRequest(sheet_names=["A B"]), workbook_path))
+
+    assert service._executors == set()
+    assert workers
+    for process in workers:
+        process.join(5)
+        assert not process.is_alive()
+    upload_dir = os.path.join(service.output_root, UPLOAD_ID)
+    assert not os.path.exists(upload_dir) or os.listdir(upload_dir) == []
+
+
+def test_timeout_does_not_affect_concurrent_ingest(service, workbook_path):
+    # 요청 A가 시간 초과돼도 같은 시간에 실행 중인 요청 B의 워커는 종료되지 않음
+    async def scenario():
+        slow = asyncio.ensure_future(service.ingest(UPLOAD_ID, IngestRequest(sheet_names=["A_B"]), workbook_path))
+        await asyncio.sleep(0)
+        service.timeout = 0.2
+        with pytest.raises(asyncio.TimeoutError):
+            await service.ingest(UPLOAD_ID, IngestRequest(sheet_names=["A B"]), workbook_path)
+        return await slow
+
+    service.timeout = 60
+    result = asyncio.run(scenario())
+    assert [sheet.status for sheet in result.sheets] == ["ok"]
+    assert result.sheets[0].rows == 2
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from app.domain.model.assessment_model import Issue
+from app.domain.service.materiality_engine import InvalidSurvey, MaterialityEngine, MaterialityStore
+
+ISSUES = [Issue(id="climate", category="E"), Issue(id="safety", category="S")]
+
+
+def make_store() -> MaterialityStore:
+    store = MaterialityStore(MaterialityEngine(1.0, 5.0))
+    store.load(
+        "acme",
+        ISSUES,
+        stakeholder=(["employee", "investor"], np.array([[5.0, 3.0], [4.0, 2.0]])),
+        impact=(["scale", "magnitude"], np.array([[[5.0, 4.0], [2.0, 1.0]]])),
+    )
+    return store
+
+
+def test_rejected_append_leaves_assessment_unchanged():
+    store = make_store()
+    before = store.result("acme")
+
+    with pytest.raises(InvalidSurvey):
+        store.load(
+            "acme",
+            ISSUES,
+            stakeholder=(["customer"], np.array([[1.0, 1.0]])),
+            impact=(["unknown"], np.array([[[1.0], [1.0]]])),
+            append=True,
+        )
+    with pytest.raises(InvalidSurvey):
+        store.load(
+            "acme",
+            ISSUES,
+            stakeholder=(["customer"], np.array([[1.0, 1.0]])),
+            impact=(["scale"], np.array([[1.0, 1.0]])),
+            append=True,
+        )
+
+    after = store.result("acme")
+    assert after.stakeholder_respondents == before.stakeholder_respondents == 2
+    assert after.impact_respondents == before.impact_respondents == 1
+    assert [issue.score for issue in after.results] == [issue.score for issue in before.results]
+
+
+def test_successful_append_accumulates():
+    store = make_store()
+    result = store.load(
+        "acme",
+        ISSUES,
+        stakeholder=(["customer"], np.array([[1.0, 1.0]])),
+        append=True,
+    )
+    assert result.stakeholder_respondents == 3
+    assert result.impact_respondents == 1
@@ -0,0 +1,353 @@
+import os
+import time
+import asyncio
+import logging
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# gateway와 모든 서비스가 같은 파일을 사용합니다 (app/common/metrics.py).
+#
+# Prometheus 텍스트 형식(/metrics)으로 요청 수, 진행 중 요청 수, 지연 히스토그램, 이벤트 루프 지연을 노출합니다.
+# 기록은 이벤트 루프 스레드에서 dict 값을 더하는 것뿐이라 락이 없고, 집계/직렬화는 /metrics 조회 시에만 합니다.
+# 외부 수집기 없이도 /metrics를 직접 조회해 확인할 수 있습니다.
+
+logger = logging.getLogger(__name__)
+
+# 초 단위 지연 버킷 (5ms ~ 10s)
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 이벤트 루프 지연 버킷 (1ms ~ 1s)
+LOOP_LAG_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """단조 증가 카운터 (라벨 조합별)"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def collect(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+            for labels, value in list(self._values.items())
+        ]
+
+
+class Gauge(Counter):
+    """올라가고 내려가는 값 (진행 중 요청 수 등)"""
+
+    kind = "gauge"
+
+    def set(self, labels: LabelValues, value: float) -> None:
+        self._values[labels] = value
+
+    def dec(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+
+
+class CallbackGauge:
+    """조회할 때마다 함수를 호출해 값을 읽는 게이지 (커넥션 풀 사용량 등 다른 객체가 가진 상태)"""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        callback: Callable[[], Iterable[Tuple[LabelValues, float]]],
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.callback = callback
+
+    def collect(self) -> List[str]:
+        try:
+            samples = list(self.callback())
+        except Exception as e:
+            logger.warning(f"⚠️ 메트릭 {self.name} 수집 실패: {str(e)}")
+            return []
+        return [
+            f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+            for labels, value in samples
+        ]
+
+
+class Histogram:
+    """고정 버킷 히스토그램
+
+    observe는 버킷 인덱스를 이분 탐색해 해당 칸만 1 증가시키고(누적하지 않음),
+    누적 합계는 /metrics 조회 시에 계산합니다.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 조합 -> [버킷별 개수..., +Inf 개수, 합계]
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, labels: LabelValues, value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def collect(self) -> List[str]:
+        lines = []
+        bounds = self.buckets + (float("inf"),)
+        for labels, series in list(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(bounds, series):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}")
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 모음 (같은 이름으로 다시 등록하면 기존 메트릭을 돌려줌)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def _get_or_create(self, name: str, factory: Callable[[], object]):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = factory()
+        return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(name, lambda: Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(name, lambda: Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(name, lambda: Histogram(name, documentation, label_names, buckets))
+
+    def gauge_callback(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        callback: Callable[[], Iterable[Tuple[LabelValues, float]]],
+    ) -> None:
+        """콜백 게이지 등록 (lifespan이 다시 실행되면 새 콜백으로 교체)"""
+        self._metrics[name] = CallbackGauge(name, documentation, label_names, callback)
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전체에서 공유하는 기본 레지스트리
+REGISTRY = MetricsRegistry()
+
+REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (응답 본문 전송 완료까지), _count가 요청 수",
+    ("route", "method", "status"),
+)
+REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight",
+    "처리 중인 HTTP 요청 수",
+    ("method",),
+)
+EVENT_LOOP_LAG = REGISTRY.histogram(
+    "event_loop_lag_seconds",
+    "이벤트 루프가 예정보다 늦게 깨어난 시간",
+    buckets=LOOP_LAG_BUCKETS,
+)
+EVENT_LOOP_LAG_LAST = REGISTRY.gauge(
+    "event_loop_lag_last_seconds",
+    "마지막으로 측정한 이벤트 루프 지연",
+)
+
+# 어떤 라우트와도 맞지 않는 요청(404)의 route 라벨
+UNMATCHED_ROUTE = "unmatched"
+
+
+class EventLoopLagMonitor:
+    """interval마다 sleep하고 실제로 깨어난 시각과의 차이로 이벤트 루프 지연을 측정"""
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started - self.interval)
+            EVENT_LOOP_LAG.observe((), lag)
+            EVENT_LOOP_LAG_LAST.set((), lag)
+
+
+class MetricsMiddleware:
+    """요청 수/진행 중 요청 수/지연 히스토그램을 기록하는 pure ASGI 미들웨어
+
+    - route 라벨은 실제 경로가 아니라 라우트 템플릿("/items/{item_id}")이라 라벨 조합 수가 고정됩니다.
+    - expand_path_params: 템플릿에 실제 값을 넣을 경로 파라미터와 허용 값
+      (예: gateway의 {"service": ServiceType 값들} -> "/gri/{path:path}")
+    - lifespan 시작/종료에 맞춰 EventLoopLagMonitor를 켜고 끕니다 (METRICS_LOOP_LAG_INTERVAL, 0이면 끔).
+    """
+
+    def __init__(self, app: ASGIApp, expand_path_params: Optional[Dict[str, Iterable[str]]] = None):
+        self.app = app
+        self.expand_path_params = {name: frozenset(values) for name, values in (expand_path_params or {}).items()}
+        self.loop_lag_monitor = EventLoopLagMonitor(float(os.getenv("METRICS_LOOP_LAG_INTERVAL", 1.0)))
+        self._route_templates: Dict[Callable, str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "lifespan":
+            return await self.app(scope, self._lifespan_receive(receive), send)
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc((method,))
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_FLIGHT.dec((method,))
+            REQUEST_DURATION.observe((self._route(scope), method, str(status)), time.perf_counter() - started)
+
+    def _lifespan_receive(self, receive: Receive) -> Receive:
+        async def wrapped() -> Message:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.loop_lag_monitor.start()
+            elif message["type"] == "lifespan.shutdown":
+                await self.loop_lag_monitor.stop()
+            return message
+        return wrapped
+
+    def _route(self, scope: Scope) -> str:
+        """요청에 해당하는 라우트 템플릿
+
+        라우터가 scope에 남긴 endpoint가 보이면 그것으로 찾고, 안쪽 미들웨어가 scope를 복사해
+        보이지 않으면(또는 인증/rate limit에서 끝난 요청이면) 라우트 목록과 직접 매칭합니다.
+        """
+        endpoint = scope.get("endpoint")
+        path_params = scope.get("path_params")
+        routes = getattr(getattr(scope.get("app"), "router", None), "routes", ())
+        if endpoint is not None:
+            template = self._route_templates.get(endpoint)
+            if template is None:
+                template = next(
+                    (route.path for route in routes if getattr(route, "endpoint", None) is endpoint),
+                    UNMATCHED_ROUTE,
+                )
+                self._route_templates[endpoint] = template
+        else:
+            template, path_params = self._match(routes, scope)
+        if self.expand_path_params and path_params:
+            for name, allowed in self.expand_path_params.items():
+                value = path_params.get(name)
+                if value in allowed:
+                    template = template.replace("{" + name + "}", value)
+        return template
+
+    @staticmethod
+    def _match(routes, scope: Scope) -> Tuple[str, Dict]:
+        partial = None
+        for route in routes:
+            if not hasattr(route, "path"):
+                continue
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return route.path, child_scope.get("path_params", {})
+            if match == Match.PARTIAL and partial is None:
+                # 경로는 맞지만 메서드가 다른 경우 (405)
+                partial = (route.path, child_scope.get("path_params", {}))
+        return partial or (UNMATCHED_ROUTE, {})
+
+
+def create_metrics_router(registry: MetricsRegistry = REGISTRY, dependencies: Sequence = ()) -> APIRouter:
+    """Prometheus 텍스트 형식 /metrics 라우터 (dependencies로 수집기 인증 의존성 지정)"""
+    router = APIRouter(tags=["Metrics"], dependencies=list(dependencies))
+
+    @router.get("/metrics", summary="Prometheus 메트릭", response_class=PlainTextResponse)
+    async def metrics():
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+    return router